@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from tradestrats.backtesting.engine import BacktestResult
+
+TRADE_ANALYTICS_COLUMNS = [
+    "column", "entry_bar", "exit_bar", "direction", "bars_held", "return", "mae", "mfe", "r_multiple",
+]
+
+
+def trade_records(result: BacktestResult) -> dict[str, np.ndarray]:
+    """Trade records of a result as flat arrays, whatever backend produced it.
+
+    Works on vectorbt portfolios (single or multi-column) and on native
+    simulator results. Open trades end on the last bar.
+
+    Returns:
+        Dict of equal-length arrays: col, entry_bar, exit_bar, direction
+        (1 long, -1 short), entry_price, exit_price and return; plus
+        ``columns``, the column labels indexed by col.
+    """
+    if result.portfolio is not None:
+        records = result.portfolio.trades.values
+        columns = result.portfolio.wrapper.columns
+        return {
+            "col": records["col"].astype(np.int64),
+            "entry_bar": records["entry_idx"].astype(np.int64),
+            "exit_bar": records["exit_idx"].astype(np.int64),
+            "direction": np.where(records["direction"] == 0, 1, -1),
+            "entry_price": records["entry_price"].astype(np.float64),
+            "exit_price": records["exit_price"].astype(np.float64),
+            "return": records["return"].astype(np.float64),
+            "columns": np.asarray(columns),
+        }
+    if result.trades is None:
+        raise ValueError("Result has neither a portfolio nor trade records.")
+
+    trades = result.trades
+    last_bar = len(result.equity) - 1 if result.equity is not None else trades["entry_bar"].max()
+    return {
+        "col": np.zeros(len(trades), dtype=np.int64),
+        "entry_bar": trades["entry_bar"].to_numpy(dtype=np.int64),
+        "exit_bar": trades["exit_bar"].fillna(last_bar).to_numpy(dtype=np.int64),
+        "direction": trades["direction"].to_numpy(dtype=np.int64),
+        "entry_price": trades["entry_price"].to_numpy(dtype=np.float64),
+        "exit_price": trades["exit_price"].to_numpy(dtype=np.float64),
+        "return": trades["return"].to_numpy(dtype=np.float64),
+        "columns": np.asarray([0]),
+    }
+
+
+def _segment_reduce(ufunc: np.ufunc, values: np.ndarray, start: np.ndarray, stop: np.ndarray) -> np.ndarray:
+    """``ufunc.reduce(values[start[i]:stop[i]])`` for all segments in one `reduceat`.
+
+    Segments are reduced in order of their start, so the gaps `reduceat`
+    also reduces (between one segment's stop and the next start) add up to
+    at most one pass over `values`. Empty segments yield NaN.
+    """
+    order = np.argsort(start, kind="stable")
+    bounds = np.empty(2 * len(start), dtype=np.int64)
+    bounds[0::2], bounds[1::2] = start[order], stop[order]
+    # A sentinel keeps stop == len(values) a valid reduceat index
+    padded = np.append(values, np.nan)
+    reduced = ufunc.reduceat(padded, bounds)[0::2]
+    out = np.empty(len(start))
+    out[order] = reduced
+    out[stop <= start] = np.nan
+    return out
+
+
+def excursions(
+    high: np.ndarray,
+    low: np.ndarray,
+    col: np.ndarray,
+    entry_bar: np.ndarray,
+    exit_bar: np.ndarray,
+    direction: np.ndarray,
+    entry_price: np.ndarray,
+    exit_price: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Maximum adverse and favourable excursion of every trade.
+
+    The price path of a trade is the bars after its entry bar up to and
+    including its exit bar, plus its entry and exit price. The highs and
+    lows of all trades are two segment reductions (`np.fmax.reduceat`,
+    `np.fmin.reduceat`) over the flattened price arrays; there is no loop
+    over trades, so millions of trades from many columns cost two passes
+    over the data.
+
+    Args:
+        high, low: (bars,) prices shared by all columns (e.g. a parameter
+            sweep on one symbol) or (bars x columns) prices, one column per
+            trade `col` (e.g. a panel).
+        col: Column of every trade.
+        entry_bar, exit_bar: Bar positions of every trade.
+        direction: 1 for long, -1 for short trades.
+        entry_price, exit_price: Fill prices of every trade.
+
+    Returns:
+        (mae, mfe) as fractions of the entry price: MAE is the worst
+        unrealised return (<= 0), MFE the best (>= 0).
+    """
+    high, low = np.asarray(high, dtype=np.float64), np.asarray(low, dtype=np.float64)
+    offset = col * high.shape[0] if high.ndim == 2 else 0
+    # Column-major flattening puts each column's bars next to each other
+    flat_high, flat_low = high.ravel(order="F"), low.ravel(order="F")
+    start, stop = offset + entry_bar + 1, offset + exit_bar + 1
+
+    path_high = np.fmax(_segment_reduce(np.fmax, flat_high, start, stop), np.fmax(entry_price, exit_price))
+    path_low = np.fmin(_segment_reduce(np.fmin, flat_low, start, stop), np.fmin(entry_price, exit_price))
+    up, down = path_high / entry_price - 1, path_low / entry_price - 1
+    long = direction > 0
+    mfe = np.where(long, up, -down)
+    mae = np.where(long, down, -up)
+    return mae, mfe
+
+
+def trade_analytics(result: BacktestResult, data: pd.DataFrame, risk: float | np.ndarray | None = None) -> pd.DataFrame:
+    """Per-trade excursion and holding analytics of a backtest.
+
+    Args:
+        result: Backtest result of `engine.run`, `run_panel` or the native
+            simulator.
+        data: The OHLCV frame (or panel) the result was run on; its
+            high/low (close if missing) give the excursions.
+        risk: Risk per trade as a fraction of the entry price, e.g. the
+            ``sl_stop`` of the run; a scalar or one value per trade.
+            ``r_multiple`` is the trade return in units of it (NaN without).
+
+    Returns:
+        One row per trade (``TRADE_ANALYTICS_COLUMNS``) with the column
+        label, bars held, return, MAE, MFE and R-multiple.
+    """
+    records = trade_records(result)
+    high = data["high"] if "high" in data else data["close"]
+    low = data["low"] if "low" in data else data["close"]
+    mae, mfe = excursions(
+        high.to_numpy(), low.to_numpy(), records["col"], records["entry_bar"], records["exit_bar"],
+        records["direction"], records["entry_price"], records["exit_price"],
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r_multiple = records["return"] / risk if risk is not None else np.full(len(mae), np.nan)
+    return pd.DataFrame(
+        {
+            "column": records["columns"][records["col"]],
+            "entry_bar": records["entry_bar"],
+            "exit_bar": records["exit_bar"],
+            "direction": records["direction"],
+            "bars_held": records["exit_bar"] - records["entry_bar"],
+            "return": records["return"],
+            "mae": mae,
+            "mfe": mfe,
+            "r_multiple": r_multiple,
+        },
+        columns=TRADE_ANALYTICS_COLUMNS,
+    )
+
+
+def time_in_market(result: BacktestResult, n_bars: int) -> pd.Series:
+    """Fraction of bars with an open position, per column.
+
+    Positions within a column never overlap (every runner holds at most
+    one per column), so this is the column's total bars held over
+    `n_bars`, from one `np.bincount`.
+    """
+    records = trade_records(result)
+    columns = records["columns"]
+    held = np.bincount(
+        records["col"], weights=records["exit_bar"] - records["entry_bar"], minlength=len(columns),
+    )
+    return pd.Series(held / n_bars, index=columns, name="time_in_market")
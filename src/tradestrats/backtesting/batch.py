@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import itertools
+import json
+import multiprocessing
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Callable
+
+import pandas as pd
+
+from tradestrats.backtesting import engine
+from tradestrats.backtesting.store import ResultStore
+from tradestrats.config import DEFAULT_EXCHANGE
+from tradestrats.data.fetcher import fetch_ohlcv
+from tradestrats.data.shared import SharedFrameHandle, SharedFrames, attach_frame
+
+# Default history when a job has no start (same as `tradestrats backtest`)
+DEFAULT_LOOKBACK = timedelta(days=180)
+
+RESULT_COLUMNS = [
+    "key", "symbol", "strategy", "timeframe", "start", "end", "exchange",
+    "init_cash", "fees", "sl_stop", "bars", "total_return", "sharpe_ratio",
+    "max_drawdown", "total_trades", "win_rate", "final_value", "error",
+]
+
+
+@dataclass(frozen=True)
+class Job:
+    """One backtest of a batch: strategy x symbol x timeframe x date range."""
+
+    symbol: str
+    strategy: str
+    timeframe: str
+    start: str | None = None
+    end: str | None = None
+    exchange: str = DEFAULT_EXCHANGE
+    init_cash: float = 10_000.0
+    fees: float = 0.001
+    sl_stop: float | None = None
+
+    @property
+    def key(self) -> str:
+        """Stable identifier used to skip finished jobs on restart."""
+        return "|".join(str(v) for v in asdict(self).values())
+
+    @property
+    def dataset(self) -> tuple[str, str, str]:
+        """Jobs with the same dataset share one data load."""
+        return self.exchange, self.symbol, self.timeframe
+
+
+def load_spec(path: str | Path) -> dict:
+    """Read a JSON job spec, see `expand_jobs` for the format."""
+    with open(path) as f:
+        return json.load(f)
+
+
+def expand_jobs(spec: dict) -> list[Job]:
+    """Expand a job spec into the full job matrix.
+
+    Example spec::
+
+        {
+            "symbols": ["BTC/USDT", "ETH/USDT"],
+            "strategies": ["rsi", "sma"],
+            "timeframes": ["1h", "4h"],
+            "ranges": [["2024-01-01", "2024-07-01"], ["2024-07-01", null]],
+            "exchange": "binance",
+            "fees": 0.001
+        }
+
+    ``ranges`` may be replaced by a single ``start``/``end`` pair. Strategies
+    are keys of `tradestrats.cli.STRATEGIES`; ``sl_stop`` defaults to each
+    strategy's recommendation.
+    """
+    from tradestrats.cli import STRATEGIES
+
+    unknown = [s for s in spec.get("strategies", []) if s not in STRATEGIES]
+    if unknown:
+        raise ValueError(f"Unknown strategies {unknown}. Available: {', '.join(STRATEGIES)}")
+    for field in ("symbols", "strategies", "timeframes"):
+        if not spec.get(field):
+            raise ValueError(f"Job spec needs a non-empty {field!r} list.")
+
+    ranges = spec.get("ranges") or [[spec.get("start"), spec.get("end")]]
+    settings = {k: spec[k] for k in ("exchange", "init_cash", "fees", "sl_stop") if k in spec}
+    return [
+        Job(symbol=symbol, strategy=strategy, timeframe=timeframe, start=start, end=end, **settings)
+        for symbol, timeframe, (start, end), strategy in itertools.product(
+            spec["symbols"], spec["timeframes"], ranges, spec["strategies"],
+        )
+    ]
+
+
+def finished_keys(results_path: str | Path) -> set[str]:
+    """Keys of jobs that already have a successful row in the results file."""
+    path = Path(results_path)
+    if not path.exists() or path.stat().st_size == 0:
+        return set()
+    results = pd.read_csv(path, usecols=["key", "error"])
+    return set(results.loc[results["error"].isna(), "key"])
+
+
+def _span(jobs: list[Job]) -> tuple[pd.Timestamp, pd.Timestamp | None]:
+    """Union of the jobs' date ranges as naive UTC timestamps (None end = up to now)."""
+    default_start = pd.Timestamp.utcnow().tz_localize(None) - DEFAULT_LOOKBACK
+    starts = [pd.Timestamp(j.start) if j.start else default_start for j in jobs]
+    ends = [pd.Timestamp(j.end) if j.end else None for j in jobs]
+    return min(starts), None if None in ends else max(ends)
+
+
+def run_dataset(
+    jobs: list[Job], loader: Callable[..., pd.DataFrame], store_path: str | Path | None = None,
+) -> list[dict]:
+    """Load one dataset once and run every job on it.
+
+    All jobs must share the same `Job.dataset`. Failures are returned as
+    rows with an ``error`` instead of being raised.
+
+    Returns:
+        One result row (``RESULT_COLUMNS``) per job.
+    """
+    from tradestrats.cli import STRATEGIES
+
+    store = ResultStore(store_path) if store_path is not None else None
+    first = jobs[0]
+    start, end = _span(jobs)
+    try:
+        data = loader(symbol=first.symbol, timeframe=first.timeframe, start=start, end=end, exchange_id=first.exchange)
+    except Exception as exc:  # noqa: BLE001 - reported per job, the batch continues
+        return [{"key": job.key, **asdict(job), "error": f"{type(exc).__name__}: {exc}"} for job in jobs]
+
+    rows = []
+    for job in jobs:
+        row = {"key": job.key, **asdict(job)}
+        try:
+            window = data
+            if job.start:
+                window = window[window.index >= pd.Timestamp(job.start, tz="UTC")]
+            if job.end:
+                window = window[window.index <= pd.Timestamp(job.end, tz="UTC")]
+            strategy = STRATEGIES[job.strategy]()
+            sl_stop = job.sl_stop if job.sl_stop is not None else strategy.recommended_sl_stop
+            result = engine.run(strategy, window, init_cash=job.init_cash, fees=job.fees, sl_stop=sl_stop, store=store)
+            row.update(bars=len(window), **result.summary(), error=None)
+        except Exception as exc:  # noqa: BLE001
+            row["error"] = f"{type(exc).__name__}: {exc}"
+        rows.append(row)
+    return rows
+
+
+@dataclass(frozen=True)
+class _SharedLoader:
+    """Picklable loader that returns a dataset the parent published to shared memory."""
+
+    handle: SharedFrameHandle
+
+    def __call__(self, **kwargs) -> pd.DataFrame:
+        return attach_frame(self.handle)
+
+
+def _fan_out(
+    tasks: list[list[Job]], n_workers: int, loader: Callable[..., pd.DataFrame], shared: SharedFrames,
+) -> list[tuple[list[Job], Callable[..., pd.DataFrame]]]:
+    """Split dataset groups into single jobs when there are fewer groups than workers.
+
+    The data of a split group is loaded once here and published to shared
+    memory, so its jobs run on all workers without loading or pickling the
+    candles again. Groups whose data fails to load are kept whole; the
+    worker then reports the error per job.
+    """
+    if len(tasks) >= n_workers:
+        return [(group, loader) for group in tasks]
+
+    split = []
+    for group in tasks:
+        if len(group) > 1:
+            first = group[0]
+            start, end = _span(group)
+            try:
+                data = loader(
+                    symbol=first.symbol, timeframe=first.timeframe, start=start, end=end, exchange_id=first.exchange,
+                )
+            except Exception:  # noqa: BLE001 - reported by the worker
+                split.append((group, loader))
+                continue
+            shared_loader = _SharedLoader(shared.publish(data))
+            split.extend(([job], shared_loader) for job in group)
+        else:
+            split.append((group, loader))
+    return split
+
+
+def run_batch(
+    spec: dict,
+    results_path: str | Path,
+    max_workers: int | None = None,
+    restart: bool = True,
+    progress: Callable[[int, int, dict], None] | None = None,
+    loader: Callable[..., pd.DataFrame] = fetch_ohlcv,
+    store_path: str | Path | None = None,
+) -> pd.DataFrame:
+    """Run a job matrix and stream the results into one CSV table.
+
+    Jobs are grouped by dataset (exchange, symbol, timeframe). Each group
+    is one task: its data is loaded once, for the union of the group's date
+    ranges, and sliced per job. The largest groups are scheduled first on
+    a spawn-based process pool, so each worker imports vectorbt only once.
+    If there are fewer groups than workers, the groups' data is loaded
+    once, published to shared memory and their jobs are spread over all
+    workers.
+    Rows are appended to `results_path` as groups finish. Failing jobs are
+    recorded with an ``error`` instead of aborting the batch. Higher-timeframe
+    inputs are derived from the loaded data.
+
+    Args:
+        spec: Job spec, see `expand_jobs`.
+        results_path: CSV file the result rows are appended to.
+        max_workers: Process pool size (default: number of CPUs); 1 runs
+            all groups in this process.
+        restart: Skip jobs that already have a successful row in
+            `results_path`; otherwise the file is overwritten.
+        progress: Called with (done, total, row) after every finished job.
+        loader: Data loader with the signature of `fetch_ohlcv`.
+        store_path: `ResultStore` the workers consult and fill, so jobs
+            already computed on the same data (by earlier batches, the CLI
+            or the dashboard) are not recomputed.
+
+    Returns:
+        The complete results table, one row per job including earlier runs
+        (the latest attempt of a retried job).
+    """
+    results_path = Path(results_path)
+    jobs = expand_jobs(spec)
+    if restart:
+        done_keys = finished_keys(results_path)
+        jobs = [job for job in jobs if job.key not in done_keys]
+    elif results_path.exists():
+        results_path.unlink()
+
+    groups: dict[tuple, list[Job]] = defaultdict(list)
+    for job in jobs:
+        groups[job.dataset].append(job)
+    tasks = sorted(groups.values(), key=len, reverse=True)
+
+    total, done = len(jobs), 0
+
+    def _write(rows: list[dict]) -> None:
+        nonlocal done
+        frame = pd.DataFrame(rows).reindex(columns=RESULT_COLUMNS)
+        write_header = not results_path.exists() or results_path.stat().st_size == 0
+        frame.to_csv(results_path, mode="a", header=write_header, index=False)
+        for row in rows:
+            done += 1
+            if progress is not None:
+                progress(done, total, row)
+
+    results_path.parent.mkdir(parents=True, exist_ok=True)
+    n_workers = max_workers or multiprocessing.cpu_count()
+    if n_workers == 1 or len(jobs) <= 1:
+        for group in tasks:
+            _write(run_dataset(group, loader, store_path))
+    else:
+        ctx = multiprocessing.get_context("spawn")
+        with SharedFrames() as shared:
+            split = _fan_out(tasks, n_workers, loader, shared)
+            with ProcessPoolExecutor(max_workers=min(n_workers, len(split)), mp_context=ctx) as pool:
+                futures = [pool.submit(run_dataset, group, group_loader, store_path) for group, group_loader in split]
+                for future in as_completed(futures):
+                    _write(future.result())
+
+    if not results_path.exists():
+        return pd.DataFrame(columns=RESULT_COLUMNS)
+    return pd.read_csv(results_path).drop_duplicates("key", keep="last").reset_index(drop=True)
+
+
+def format_progress(done: int, total: int, row: dict[str, Any]) -> str:
+    """One progress line for the CLI."""
+    label = f"[{done}/{total}] {row['symbol']} {row['timeframe']} {row['strategy']}"
+    if isinstance(row.get("error"), str):
+        return f"{label}: FEHLER {row['error']}"
+    return f"{label}: {row['total_return']:+.2%} | Sharpe {row['sharpe_ratio']:.2f} | {row['total_trades']} Trades"
@@ -0,0 +1,380 @@
+from __future__ import annotations
+
+import math
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import numpy as np
+import pandas as pd
+
+from tradestrats.backtesting.engine import BacktestResult, ann_factor, infer_freq
+from tradestrats.backtesting.simulator import TRADE_FIELDS, SimResult, SimState, simulate, trade_frame
+from tradestrats.data.timeframes import merge_informative, timeframe_to_timedelta
+from tradestrats.indicators.kernels import crossing_orders
+from tradestrats.strategies.base import Strategy, strategy_signals
+
+DEFAULT_CHUNK_SIZE = 100_000
+DEFAULT_OVERLAP = 1_000
+
+
+def min_overlap(strategy: Strategy, bar: pd.Timedelta) -> int:
+    """Smallest `overlap` for which chunks see the same signals as one pass.
+
+    Covers the strategy's `warmup_bars` and two candles of each informative
+    timeframe: the last closed higher-timeframe candle before a chunk must
+    lie completely in the overlap to be resampled from it, and the overlap
+    may start in the middle of the candle before that.
+
+    Args:
+        strategy: A Strategy instance.
+        bar: Length of one base bar.
+    """
+    bars = strategy.warmup_bars
+    for tf in strategy.informative_timeframes:
+        bars = max(bars, 2 * math.ceil(timeframe_to_timedelta(tf) / bar))
+    return bars
+
+
+def iter_chunks(data: pd.DataFrame, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    """Split a frame into consecutive chunks of `chunk_size` rows (views, no copies)."""
+    for start in range(0, len(data), chunk_size):
+        yield data.iloc[start:start + chunk_size]
+
+
+def iter_parquet(path: str | Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    """Stream an OHLCV Parquet file (e.g. a cache file) in time-ordered chunks.
+
+    Only one chunk is decoded at a time, so files larger than memory can be
+    backtested with `run_chunked`.
+    """
+    import pyarrow.parquet as pq
+
+    with pq.ParquetFile(path) as parquet:
+        for batch in parquet.iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas()
+
+
+_NAT = np.iinfo(np.int64).min  # int64 view of NaT
+
+
+def _timestamps(parts: list[np.ndarray], tz) -> pd.DatetimeIndex:
+    """int64 nanosecond chunks back to a DatetimeIndex in the data's timezone."""
+    values = np.concatenate(parts).astype(np.int64) if parts else np.empty(0, dtype=np.int64)
+    index = pd.DatetimeIndex(values.view("M8[ns]"))
+    return index.tz_localize("UTC").tz_convert(tz) if tz is not None else index
+
+
+class _RunningMetrics:
+    """`compute_metrics` over a value series that arrives in chunks.
+
+    Keeps the previous value, the running peak and the count, mean and sum
+    of squared deviations of the returns (merged per chunk, Chan et al.),
+    so memory does not grow with the history.
+    """
+
+    def __init__(self, init_cash: float):
+        self.init_cash = init_cash
+        self.prev = init_cash
+        self.peak = np.nan
+        self.max_drawdown = np.nan
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, values: np.ndarray) -> None:
+        if not len(values):
+            return
+        with np.errstate(invalid="ignore", divide="ignore"):
+            returns = values / np.concatenate([[self.prev], values[:-1]]) - 1
+            peak = np.fmax.accumulate(np.concatenate([[self.peak], values]))[1:]
+            self.max_drawdown = np.nanmin(np.concatenate([[self.max_drawdown], values / peak - 1]))
+        self.peak = peak[-1]
+        self.prev = values[-1]
+
+        returns = returns[~np.isnan(returns)]
+        n = len(returns)
+        if n:
+            mean = returns.mean()
+            m2 = ((returns - mean) ** 2).sum()
+            total = self.count + n
+            delta = mean - self.mean
+            self.m2 += m2 + delta**2 * self.count * n / total
+            self.mean += delta * n / total
+            self.count = total
+
+    def result(self, freq, trade_pnl: np.ndarray) -> dict:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            std = np.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else np.nan
+            sharpe = np.inf if std == 0 else self.mean / std * np.sqrt(ann_factor(freq))
+        trades = len(trade_pnl)
+        return {
+            "total_return": float(self.prev / self.init_cash - 1),
+            "sharpe_ratio": float(sharpe),
+            "max_drawdown": float(self.max_drawdown),
+            "total_trades": trades,
+            "win_rate": float((trade_pnl > 0).sum() / trades) if trades else 0.0,
+            "final_value": float(self.prev),
+        }
+
+
+class ChunkedRunner:
+    """Native simulator run that consumes the history chunk by chunk.
+
+    `feed` appends time-ordered bars and `result` summarizes everything fed
+    so far. The runner holds only the simulator state, the last `overlap`
+    bars (indicator warm-up for the next chunk), the running metrics and the
+    trade records. It can be pickled, which is how
+    `tradestrats.backtesting.incremental` persists runs between updates.
+
+    Args:
+        strategy: A Strategy instance.
+        overlap: Bars of history prepended to each chunk for the indicators
+            (default: `DEFAULT_OVERLAP` or `min_overlap`, whichever is
+            larger). Checked against `min_overlap` once the bar length is
+            known from the first bars.
+        init_cash, fees, sl_stop, tp_stop, sl_trail, short, limit_offset,
+        limit_tif, informative: See `simulator.run`.
+        keep_equity: Keep the equity curve (grows with the history).
+    """
+
+    def __init__(
+        self,
+        strategy: Strategy,
+        overlap: int | None = None,
+        init_cash: float = 10_000.0,
+        fees: float = 0.001,
+        sl_stop: float | None = 0.05,
+        tp_stop: float | None = None,
+        sl_trail: bool = False,
+        short: bool = False,
+        limit_offset: float = 0.0,
+        limit_tif: int = 1,
+        informative: dict[str, pd.DataFrame] | None = None,
+        keep_equity: bool = False,
+    ):
+        if overlap is not None and overlap < 0:
+            raise ValueError("overlap must be non-negative.")
+        self.strategy = strategy
+        self.overlap = overlap
+        self.init_cash = init_cash
+        self.sim_kwargs = {
+            "fees": fees, "sl_stop": sl_stop, "tp_stop": tp_stop, "sl_trail": sl_trail,
+            "limit_offset": limit_offset, "limit_tif": limit_tif,
+        }
+        self.short = short
+        self.informative = informative
+        self.keep_equity = keep_equity
+
+        self.state = SimState(cash=init_cash)
+        self.metrics = _RunningMetrics(init_cash)
+        self.tail: pd.DataFrame | None = None
+        self.pending: list[pd.DataFrame] = []
+        self.trades: list[np.ndarray] = []
+        self.entry_times: list[np.ndarray] = []
+        self.exit_times: list[np.ndarray] = []
+        self.equity: list[pd.Series] = []
+        self.open_entry_time = _NAT
+        self.bars = 0
+        self.freq = None
+        self.tz = None
+
+    @property
+    def last_time(self) -> pd.Timestamp | None:
+        """Timestamp of the last bar fed (None before the first bar)."""
+        if self.pending:
+            return self.pending[-1].index[-1]
+        return self.tail.index[-1] if self.tail is not None and len(self.tail) else None
+
+    def _resolve_overlap(self, index: pd.DatetimeIndex) -> None:
+        """Infer the bar length from the first bars and settle `overlap`."""
+        self.freq, self.tz = infer_freq(index), index.tz
+        required = min_overlap(self.strategy, pd.Timedelta(self.freq))
+        if self.overlap is None:
+            self.overlap = max(DEFAULT_OVERLAP, required)
+        elif self.overlap < required:
+            raise ValueError(
+                f"overlap={self.overlap} is too short for {self.strategy!r}: it needs at least {required} bars "
+                "(indicator lookback and two candles of each informative timeframe)."
+            )
+
+    def warm_up(self, history: pd.DataFrame) -> None:
+        """Use bars only as indicator history (like the ``warmup`` of `engine.run`)."""
+        if self.bars or self.pending:
+            raise ValueError("Warm-up bars must come before the first chunk.")
+        if self.freq is None and len(history) > 1:
+            self._resolve_overlap(history.index)
+        if self.overlap is None:
+            self.tail = history
+        else:
+            self.tail = history.iloc[len(history) - self.overlap:] if self.overlap else history.iloc[:0]
+
+    def feed(self, chunk: pd.DataFrame) -> None:
+        """Simulate the next bars.
+
+        Before any history exists, bars are buffered until they reach
+        `overlap` bars, so the first chunk is long enough for the indicators.
+        """
+        if not len(chunk):
+            return
+        if self.bars == 0 and (self.tail is None or not len(self.tail)):
+            self.pending.append(chunk)
+            buffered = sum(len(c) for c in self.pending)
+            if self.freq is None and buffered > 1:
+                self._resolve_overlap(self.pending[0].index.append([c.index for c in self.pending[1:]]))
+            if self.freq is None or buffered < self.overlap:
+                return
+            chunk = self._take_pending()
+        elif self.freq is None:
+            self._resolve_overlap(pd.concat([self.tail, chunk]).index)
+        self._simulate(chunk)
+
+    def flush(self) -> None:
+        """Simulate bars still buffered by `feed`."""
+        if self.pending:
+            if self.freq is None:
+                self._resolve_overlap(self.pending[0].index)
+            self._simulate(self._take_pending())
+
+    def _take_pending(self) -> pd.DataFrame:
+        pending, self.pending = self.pending, []
+        return pd.concat(pending) if len(pending) > 1 else pending[0]
+
+    def _simulate(self, chunk: pd.DataFrame) -> None:
+        tail = self.tail
+        frame = pd.concat([tail, chunk]) if tail is not None and len(tail) else chunk
+        if self.strategy.informative_timeframes:
+            frame = merge_informative(frame, self.strategy.informative_timeframes, self.informative)
+        entries, exits = crossing_orders(strategy_signals(self.strategy, frame))
+        skip = len(frame) - len(chunk)
+        entries, exits = entries[skip:], exits[skip:]
+
+        offset = self.bars
+        sim = simulate(
+            close=chunk["close"].to_numpy(),
+            long_entries=entries,
+            long_exits=None if self.short else exits,
+            short_entries=exits if self.short else None,
+            open_=chunk["open"].to_numpy() if "open" in chunk else None,
+            high=chunk["high"].to_numpy() if "high" in chunk else None,
+            low=chunk["low"].to_numpy() if "low" in chunk else None,
+            state=self.state,
+            bar_offset=offset,
+            **self.sim_kwargs,
+        )
+
+        # Trade timestamps (int64 ns); an entry before this chunk was recorded earlier
+        stamps = chunk.index.asi8
+        if len(sim.trades):
+            entry_bar = sim.trades[:, 0].astype(np.int64) - offset
+            self.entry_times.append(np.where(entry_bar >= 0, stamps[np.clip(entry_bar, 0, None)], self.open_entry_time))
+            self.exit_times.append(stamps[sim.trades[:, 1].astype(np.int64) - offset])
+            self.trades.append(sim.trades)
+        self.state = sim.state
+        if self.state.position != 0 and self.state.entry_bar >= offset:
+            self.open_entry_time = stamps[int(self.state.entry_bar) - offset]
+
+        self.metrics.update(sim.value)
+        if self.keep_equity:
+            self.equity.append(pd.Series(sim.value, index=chunk.index, name="value"))
+        columns = list(chunk.columns)
+        self.tail = frame[columns].iloc[len(frame) - self.overlap:].copy() if self.overlap else chunk.iloc[:0]
+        self.bars += len(chunk)
+
+    def result(self) -> BacktestResult:
+        """Metrics and trades (and equity with `keep_equity`) of all bars fed so far."""
+        self.flush()
+        if self.bars == 0:
+            raise ValueError("No data to backtest.")
+
+        state = self.state
+        records = np.concatenate(self.trades) if self.trades else np.empty((0, len(TRADE_FIELDS)))
+        table = trade_frame(SimResult(value=np.empty(0), trades=records, state=state))
+        entry_times, exit_times = list(self.entry_times), list(self.exit_times)
+        if state.position != 0:
+            entry_times.append(np.array([self.open_entry_time]))
+            exit_times.append(np.array([_NAT]))
+        table["entry_time"] = _timestamps(entry_times, self.tz)
+        table["exit_time"] = _timestamps(exit_times, self.tz)
+
+        return BacktestResult(
+            portfolio=None,
+            signals=None,
+            metrics=self.metrics.result(self.freq, table["pnl"].to_numpy()),
+            equity=pd.concat(self.equity) if self.keep_equity else None,
+            trades=table,
+        )
+
+
+def run_chunked(
+    strategy: Strategy,
+    data: pd.DataFrame | Iterable[pd.DataFrame],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    overlap: int | None = None,
+    init_cash: float = 10_000.0,
+    fees: float = 0.001,
+    sl_stop: float | None = 0.05,
+    tp_stop: float | None = None,
+    sl_trail: bool = False,
+    short: bool = False,
+    limit_offset: float = 0.0,
+    limit_tif: int = 1,
+    informative: dict[str, pd.DataFrame] | None = None,
+    warmup: int = 0,
+    keep_equity: bool = False,
+) -> BacktestResult:
+    """Backtest with the native simulator in time-ordered chunks.
+
+    Each chunk is prefixed with the last `overlap` bars of the history
+    before it (leading chunks are merged until they reach `overlap` bars),
+    so indicators are warmed up as in a single pass; signals
+    of the overlap bars only seed the entry/exit transitions. The
+    simulator state (cash, open position, stops, pending limit order)
+    carries over between chunks and the summary metrics are accumulated
+    on the fly. Peak memory therefore depends on `chunk_size` and
+    `overlap`, not on the length of the history.
+
+    The result equals `simulator.run` on the whole history as long as
+    `overlap` covers the strategy's longest lookback, including
+    higher-timeframe candles derived from the data. `min_overlap` enforces
+    the part that is known (`warmup_bars` and `informative_timeframes`);
+    recursive indicators (EMA, RSI) converge within a few times their
+    period, which the default overlap covers. Metrics can differ in the
+    last digits because the return statistics are merged per chunk.
+
+    Args:
+        strategy: A Strategy instance.
+        data: OHLCV DataFrame or an iterable of consecutive OHLCV chunks
+            (e.g. `iter_parquet`), whose sizes are then used as-is.
+        chunk_size: Bars per chunk when `data` is a DataFrame.
+        overlap: Bars of history prepended to each chunk for the indicators
+            (default: `DEFAULT_OVERLAP`, raised to `min_overlap`). Raises
+            ValueError if below `min_overlap`.
+        init_cash, fees, sl_stop, tp_stop, sl_trail, short, limit_offset,
+        limit_tif, informative: See `simulator.run`.
+        warmup: Leading bars of a DataFrame used only as indicator history.
+        keep_equity: Also return the full equity curve (grows with the
+            history).
+
+    Returns:
+        BacktestResult with metrics and trades (and the equity curve with
+        `keep_equity`), without signals.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive.")
+    runner = ChunkedRunner(
+        strategy, overlap=overlap, init_cash=init_cash, fees=fees, sl_stop=sl_stop, tp_stop=tp_stop,
+        sl_trail=sl_trail, short=short, limit_offset=limit_offset, limit_tif=limit_tif,
+        informative=informative, keep_equity=keep_equity,
+    )
+    if isinstance(data, pd.DataFrame):
+        if warmup:
+            runner.warm_up(data.iloc[:warmup])
+        chunks: Iterable[pd.DataFrame] = iter_chunks(data.iloc[warmup:], chunk_size)
+    else:
+        if warmup:
+            raise ValueError("warmup requires a DataFrame; pass the warm-up bars as overlap instead.")
+        chunks = data
+
+    for chunk in chunks:
+        runner.feed(chunk)
+    return runner.result()
@@ -1,61 +1,214 @@
 from __future__ import annotations
 
+import itertools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Sequence
 
+import numpy as np
 import pandas as pd
 import vectorbt as vbt
 
-from tradestrats.strategies.base import Strategy
+from tradestrats.data.shared import SharedFrameHandle, SharedFrames, resolve_frame
+from tradestrats.data.timeframes import merge_informative
+from tradestrats.indicators.kernels import crossing_orders
+from tradestrats.strategies.base import Strategy, strategy_signals
+
+if TYPE_CHECKING:
+    from tradestrats.backtesting.store import ResultStore
+
+
+# Rough peak bytes per (bar x column) cell inside one from_signals call:
+# broadcast price/fees/stops, entry/exit masks and the value/cash/returns outputs
+_BYTES_PER_CELL = 96
+_YEAR = pd.Timedelta(days=365)  # vectorbt's default year_freq
 
 
 @dataclass
 class BacktestResult:
-    """Container for backtest results."""
+    """Container for backtest results.
 
-    portfolio: vbt.Portfolio
-    signals: pd.DataFrame
+    Summary metrics are computed together on first access (one pass over the
+    portfolio value and the trade records, see `compute_metrics`) and cached.
+    Results can also be built from precomputed `metrics` without a portfolio
+    (e.g. by the native simulator, which also fills `trades`); `compact()`
+    turns a full result into such a lightweight one.
+    """
+
+    portfolio: vbt.Portfolio | None
+    signals: pd.DataFrame | None
+    metrics: dict | None = None
+    equity: pd.Series | pd.DataFrame | None = None
+    trades: pd.DataFrame | None = None
+
+    def _metrics(self) -> dict:
+        if self.metrics is None:
+            if self.portfolio is None:
+                raise ValueError("Result has neither a portfolio nor precomputed metrics.")
+            records = self.portfolio.trades.values
+            self.metrics = compute_metrics(
+                self.equity_curve,
+                init_cash=self.portfolio.init_cash,
+                freq=self.portfolio.wrapper.freq,
+                trade_cols=records["col"],
+                trade_pnl=records["pnl"],
+            )
+        return self.metrics
 
     @property
     def total_return(self) -> float:
-        return self.portfolio.total_return()
+        return self._metrics()["total_return"]
 
     @property
     def sharpe_ratio(self) -> float:
-        return self.portfolio.sharpe_ratio()
+        return self._metrics()["sharpe_ratio"]
 
     @property
     def max_drawdown(self) -> float:
-        return self.portfolio.max_drawdown()
+        return self._metrics()["max_drawdown"]
 
     @property
     def total_trades(self) -> int:
-        return self.portfolio.trades.count()
+        return self._metrics()["total_trades"]
 
     @property
     def win_rate(self) -> float:
-        trades = self.portfolio.trades
-        if trades.count() == 0:
-            return 0.0
-        return trades.win_rate()
+        return self._metrics()["win_rate"]
 
     @property
     def equity_curve(self) -> pd.Series:
-        return self.portfolio.value()
+        if self.equity is None:
+            if self.portfolio is None:
+                raise ValueError("Compact result without equity curve; use compact(keep_equity=True).")
+            self.equity = self.portfolio.value()
+        return self.equity
 
     @property
     def final_value(self) -> float:
-        return self.portfolio.final_value()
+        return self._metrics()["final_value"]
 
     def summary(self) -> dict:
         """Return a summary dict of key metrics."""
-        return {
-            "total_return": self.total_return,
-            "sharpe_ratio": self.sharpe_ratio,
-            "max_drawdown": self.max_drawdown,
-            "total_trades": self.total_trades,
-            "win_rate": self.win_rate,
-            "final_value": self.final_value,
-        }
+        return dict(self._metrics())
+
+    def trade_analytics(self, data: pd.DataFrame, risk: float | None = None) -> pd.DataFrame:
+        """Per-trade MAE/MFE, bars held and R-multiples, see `analytics.trade_analytics`."""
+        from tradestrats.backtesting.analytics import trade_analytics
+
+        return trade_analytics(self, data, risk)
+
+    def compact(self, keep_equity: bool = False) -> BacktestResult:
+        """Metrics-only copy without the vectorbt portfolio and signals.
+
+        Args:
+            keep_equity: Also keep the equity curve (one float per bar).
+        """
+        return BacktestResult(
+            portfolio=None,
+            signals=None,
+            metrics=self.summary(),
+            equity=self.equity_curve if keep_equity else None,
+        )
+
+
+def ann_factor(freq) -> float:
+    """Bars per year for a bar frequency (vectorbt's 365-day year)."""
+    return _YEAR / pd.Timedelta(freq)
+
+
+def compute_metrics(
+    value: pd.Series | pd.DataFrame,
+    init_cash: float | Sequence[float],
+    freq,
+    trade_cols: np.ndarray,
+    trade_pnl: np.ndarray,
+) -> dict:
+    """Compute all summary metrics in one vectorized pass.
+
+    Definitions match vectorbt's portfolio methods: returns are taken from
+    the value series (the first bar relative to `init_cash`), the Sharpe ratio
+    is mean / std (ddof=1) annualized to a 365-day year, and trade counts and
+    win rate include trades still open at the end.
+
+    Args:
+        value: Portfolio value per bar, one column per portfolio.
+        init_cash: Starting cash (scalar or per column).
+        freq: Bar frequency.
+        trade_cols: Column position of every trade.
+        trade_pnl: PnL of every trade.
+
+    Returns:
+        Dict of floats for a Series `value`, of Series indexed by column for
+        a DataFrame.
+    """
+    values = np.asarray(value, dtype=float).reshape(len(value), -1)
+    n_cols = values.shape[1]
+    init = np.broadcast_to(np.asarray(init_cash, dtype=float), (n_cols,))
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        prev = np.vstack([init[None, :], values[:-1]])
+        returns = values / prev - 1
+        std = np.nanstd(returns, axis=0, ddof=1) if len(values) > 1 else np.full(n_cols, np.nan)
+        sharpe = np.where(std == 0, np.inf, np.nanmean(returns, axis=0) / std * np.sqrt(ann_factor(freq)))
+        peak = np.fmax.accumulate(values, axis=0)
+        max_drawdown = np.nanmin(values / peak - 1, axis=0)
+
+    trades = np.bincount(trade_cols, minlength=n_cols)
+    wins = np.bincount(trade_cols, weights=np.asarray(trade_pnl) > 0, minlength=n_cols)
+    metrics = {
+        "total_return": values[-1] / init - 1,
+        "sharpe_ratio": sharpe,
+        "max_drawdown": max_drawdown,
+        "total_trades": trades,
+        "win_rate": np.divide(wins, trades, out=np.zeros(n_cols), where=trades > 0),
+        "final_value": values[-1],
+    }
+    if isinstance(value, pd.DataFrame):
+        return {k: pd.Series(v, index=value.columns, name=k) for k, v in metrics.items()}
+    return {k: v[0].item() for k, v in metrics.items()}
+
+
+def signals_to_orders(signal: pd.Series | pd.DataFrame) -> tuple[pd.Series, pd.Series]:
+    """Convert a signal column (or wide signal frame) to entries/exits.
+
+    entries: signal changes from non-1 to 1 (buy)
+    exits: signal changes from non-(-1) to -1 (sell)
+    """
+    entries = (signal == 1) & (signal.shift(1) != 1)
+    exits = (signal == -1) & (signal.shift(1) != -1)
+    return entries, exits
+
+
+def strategy_orders(
+    strategy: Strategy, data: pd.DataFrame, fast: bool = False,
+) -> tuple[pd.DataFrame, np.ndarray, np.ndarray]:
+    """Signals and entry/exit arrays of a strategy on (informative-merged) data.
+
+    Args:
+        strategy: A Strategy instance.
+        data: OHLCV DataFrame.
+        fast: Use the array-level fast path, see `run`.
+
+    Returns:
+        (signals, entries, exits); with `fast` the signals frame only has
+        the ``signal`` column.
+    """
+    if fast:
+        signal = strategy_signals(strategy, data)
+        entries, exits = crossing_orders(signal)
+        return pd.DataFrame({"signal": signal}, index=data.index), entries, exits
+    signals = strategy.generate_signals(data)
+    entries, exits = signals_to_orders(signals["signal"])
+    return signals, entries.to_numpy(), exits.to_numpy()
+
+
+def infer_freq(index: pd.DatetimeIndex):
+    """Detect frequency from the DatetimeIndex; fall back to median diff."""
+    freq = index.freq
+    if freq is None:
+        freq = pd.tseries.frequencies.to_offset(index.to_series().diff().median())
+    return freq
 
 
 def run(
@@ -64,6 +217,14 @@ def run(
     init_cash: float = 10_000.0,
     fees: float = 0.001,
     sl_stop: float = 0.05,
+    informative: dict[str, pd.DataFrame] | None = None,
+    warmup: int = 0,
+    tp_stop: float | None = None,
+    sl_trail: bool = False,
+    backend: str = "vectorbt",
+    store: ResultStore | None = None,
+    fast: bool = False,
+    **native_kwargs: Any,
 ) -> BacktestResult:
     """Run a backtest for the given strategy on OHLCV data.
 
@@ -73,22 +234,67 @@ def run(
         init_cash: Starting cash for the portfolio.
         fees: Trading fee as a fraction (e.g. 0.001 = 0.1%).
         sl_stop: Stop-loss as a fraction (e.g. 0.05 = 5%).
+        informative: Higher-timeframe candles keyed by timeframe (e.g. from
+            `load_informative`) for strategies with `informative_timeframes`.
+            Timeframes not given are derived from `data`.
+        warmup: Number of leading bars used only as indicator history; the
+            portfolio starts trading at ``data.iloc[warmup]``.
+        tp_stop: Take-profit as a fraction.
+        sl_trail: Trail the stop-loss behind the best price since entry.
+        backend: "vectorbt" (stops checked on the close) or "native" (the
+            Numba simulator: stops checked against each bar's high/low).
+        store: Result store to consult first. A stored run with the same
+            strategy, settings and data is returned without recomputing
+            (as a compact result without portfolio and signals); new runs
+            are added to the store.
+        fast: Generate signals with the strategy's array-level
+            ``signal_array`` (if implemented) and derive the orders
+            in compiled code. ``result.signals`` then only holds the
+            ``signal`` column, without indicator columns.
+        **native_kwargs: Native-only options (``short``, ``limit_offset``,
+            ``limit_tif``, ``chunk_size``, ``overlap``), see
+            `tradestrats.backtesting.simulator.run`.
 
     Returns:
         BacktestResult with portfolio and signal data.
     """
-    signals = strategy.generate_signals(data)
+    if store is not None:
+        from tradestrats.backtesting.store import run_key
+
+        settings = {
+            "init_cash": init_cash, "fees": fees, "sl_stop": sl_stop, "tp_stop": tp_stop,
+            "sl_trail": sl_trail, "warmup": warmup, "backend": backend, **native_kwargs,
+        }
+        key = run_key(strategy, data, settings, informative)
+        cached = store.get(key)
+        if cached is not None:
+            return cached
+        result = run(
+            strategy, data, init_cash=init_cash, fees=fees, sl_stop=sl_stop, informative=informative,
+            warmup=warmup, tp_stop=tp_stop, sl_trail=sl_trail, backend=backend, fast=fast, **native_kwargs,
+        )
+        store.put(key, result, strategy=strategy, data=data, settings=settings)
+        return result
 
-    # Convert signal column to entries/exits for vectorbt
-    # entries: signal changes from non-1 to 1 (buy)
-    # exits: signal changes from non-(-1) to -1 (sell)
-    entries = (signals["signal"] == 1) & (signals["signal"].shift(1) != 1)
-    exits = (signals["signal"] == -1) & (signals["signal"].shift(1) != -1)
+    if backend == "native":
+        from tradestrats.backtesting import simulator
 
-    # Detect frequency from the DatetimeIndex; fall back to median diff
-    freq = data.index.freq
-    if freq is None:
-        freq = pd.tseries.frequencies.to_offset(data.index.to_series().diff().median())
+        return simulator.run(
+            strategy, data, init_cash=init_cash, fees=fees, sl_stop=sl_stop, tp_stop=tp_stop,
+            sl_trail=sl_trail, informative=informative, warmup=warmup, fast=fast, **native_kwargs,
+        )
+    if backend != "vectorbt":
+        raise ValueError(f"Unknown backend: {backend!r}. Use 'vectorbt' or 'native'.")
+    if native_kwargs:
+        raise ValueError(f"Options {sorted(native_kwargs)} require backend='native'.")
+
+    if strategy.informative_timeframes:
+        data = merge_informative(data, strategy.informative_timeframes, informative)
+
+    signals, entries, exits = strategy_orders(strategy, data, fast)
+    if warmup:
+        data, signals = data.iloc[warmup:], signals.iloc[warmup:]
+        entries, exits = entries[warmup:], exits[warmup:]
 
     portfolio = vbt.Portfolio.from_signals(
         close=data["close"],
@@ -97,7 +303,202 @@ def run(
         init_cash=init_cash,
         fees=fees,
         sl_stop=sl_stop,
-        freq=freq,
+        tp_stop=tp_stop if tp_stop else np.nan,
+        sl_trail=sl_trail,
+        freq=infer_freq(data.index),
+    )
+
+    return BacktestResult(portfolio=portfolio, signals=signals)
+
+
+def run_panel(
+    strategy: Strategy,
+    panel: pd.DataFrame,
+    init_cash: float = 10_000.0,
+    fees: float = 0.001,
+    sl_stop: float = 0.05,
+) -> BacktestResult:
+    """Backtest a strategy on every symbol of a panel in one vectorbt call.
+
+    Signals for all symbols come from one `generate_panel_signals` pass and
+    feed a multi-column portfolio (one column per symbol, each with its own
+    `init_cash`). Timestamps where a symbol has no candle are skipped by
+    vectorbt (NaN price).
+
+    Args:
+        strategy: A Strategy instance.
+        panel: Multi-symbol panel, see `tradestrats.data.panel.build_panel`.
+        init_cash: Starting cash per symbol.
+        fees: Trading fee as a fraction.
+        sl_stop: Stop-loss as a fraction.
+
+    Returns:
+        BacktestResult whose metrics are Series indexed by symbol and whose
+        `signals` is the (time x symbol) signal frame.
+    """
+    signals = strategy.generate_panel_signals(panel)
+    entries, exits = signals_to_orders(signals)
+
+    portfolio = vbt.Portfolio.from_signals(
+        close=panel["close"],
+        entries=entries,
+        exits=exits,
+        init_cash=init_cash,
+        fees=fees,
+        sl_stop=sl_stop,
+        freq=infer_freq(panel.index),
     )
 
     return BacktestResult(portfolio=portfolio, signals=signals)
+
+
+def _as_grid(value: float | Sequence[float]) -> list[float]:
+    return list(value) if isinstance(value, (list, tuple, np.ndarray)) else [value]
+
+
+def optimize(
+    strategy_cls: type[Strategy],
+    data: pd.DataFrame,
+    param_grid: dict[str, Sequence[Any]],
+    init_cash: float = 10_000.0,
+    fees: float | Sequence[float] = 0.001,
+    sl_stop: float | Sequence[float] = 0.05,
+    memory_budget: int = 512 * 1024**2,
+    informative: dict[str, pd.DataFrame] | None = None,
+    max_workers: int = 1,
+) -> pd.DataFrame:
+    """Backtest every combination of a parameter grid in broadcast vectorbt calls.
+
+    Signals are generated once per strategy parameter combination (with the
+    array-level ``signal_array`` where implemented); all
+    combinations (times the `fees` and `sl_stop` grids) become columns of a
+    single multi-column `from_signals` call. If the columns do not fit
+    `memory_budget`, the grid is processed in chunks.
+
+    With `max_workers` > 1 the grid is split across a process pool. The
+    OHLCV (and informative) frames are published once to shared memory and
+    attached zero-copy by the workers instead of being pickled into each
+    task.
+
+    Args:
+        strategy_cls: Strategy class, instantiated with each grid combination.
+        data: OHLCV DataFrame.
+        param_grid: Mapping of constructor argument to candidate values,
+            e.g. ``{"fast_period": [10, 20], "slow_period": [50, 100]}``.
+        init_cash: Starting cash per combination.
+        fees: Fee rate or list of fee rates to sweep.
+        sl_stop: Stop-loss or list of stop-losses to sweep.
+        memory_budget: Approximate peak bytes per vectorbt call.
+        informative: Higher-timeframe candles, see `run`.
+        max_workers: Process pool size; 1 evaluates in this process.
+
+    Returns:
+        DataFrame of summary metrics indexed by (params..., fees, sl_stop).
+    """
+    names = list(param_grid)
+    candidates = [dict(zip(names, values)) for values in itertools.product(*param_grid.values())]
+    if max_workers <= 1 or len(candidates) < 2:
+        return evaluate(strategy_cls, data, candidates, init_cash, fees, sl_stop, memory_budget, informative)
+
+    n_tasks = min(max_workers, len(candidates))
+    bounds = np.linspace(0, len(candidates), n_tasks + 1).astype(int)
+    engine_kwargs = {"init_cash": init_cash, "fees": fees, "sl_stop": sl_stop, "memory_budget": memory_budget}
+    # spawn: forking a process that already runs numba/BLAS threads is unsafe
+    ctx = multiprocessing.get_context("spawn")
+    with SharedFrames() as shared, ProcessPoolExecutor(max_workers=n_tasks, mp_context=ctx) as pool:
+        handle, informative_handles = shared.publish(data), shared.publish_all(informative)
+        futures = [
+            pool.submit(
+                _evaluate_shared, handle, informative_handles, strategy_cls, candidates[lo:hi], engine_kwargs,
+            )
+            for lo, hi in zip(bounds[:-1], bounds[1:])
+        ]
+        return pd.concat([future.result() for future in futures])
+
+
+def _evaluate_shared(
+    data: pd.DataFrame | SharedFrameHandle,
+    informative: dict[str, pd.DataFrame | SharedFrameHandle] | None,
+    strategy_cls: type[Strategy],
+    candidates: list[dict[str, Any]],
+    engine_kwargs: dict,
+) -> pd.DataFrame:
+    """Worker: `evaluate` on frames attached from shared memory."""
+    if informative is not None:
+        informative = {key: resolve_frame(frame) for key, frame in informative.items()}
+    return evaluate(strategy_cls, resolve_frame(data), candidates, informative=informative, **engine_kwargs)
+
+
+def evaluate(
+    strategy_cls: type[Strategy],
+    data: pd.DataFrame,
+    candidates: Sequence[dict[str, Any]],
+    init_cash: float = 10_000.0,
+    fees: float | Sequence[float] = 0.001,
+    sl_stop: float | Sequence[float] = 0.05,
+    memory_budget: int = 512 * 1024**2,
+    informative: dict[str, pd.DataFrame] | None = None,
+) -> pd.DataFrame:
+    """Backtest an arbitrary list of parameter combinations, see `optimize`.
+
+    Args:
+        strategy_cls: Strategy class, instantiated with each candidate.
+        data: OHLCV DataFrame.
+        candidates: Distinct constructor arguments per combination; all
+            need the same keys.
+        init_cash: Starting cash per combination.
+        fees: Fee rate or list of fee rates to sweep.
+        sl_stop: Stop-loss or list of stop-losses to sweep.
+        memory_budget: Approximate peak bytes per vectorbt call.
+        informative: Higher-timeframe candles, see `run`.
+
+    Returns:
+        DataFrame of summary metrics indexed by (params..., fees, sl_stop),
+        in the order of `candidates`.
+    """
+    if strategy_cls.informative_timeframes:
+        data = merge_informative(data, strategy_cls.informative_timeframes, informative)
+
+    names = list(candidates[0])
+    combos = [tuple(candidate[name] for name in names) for candidate in candidates]
+    engine_combos = list(itertools.product(_as_grid(fees), _as_grid(sl_stop)))
+    index_names = [*names, "fees", "sl_stop"]
+
+    close = data["close"]
+    freq = infer_freq(data.index)
+    max_columns = max(1, memory_budget // (len(data) * _BYTES_PER_CELL))
+    # Keep all engine variants of a strategy combo in the same chunk so its
+    # signals are generated exactly once
+    combos_per_chunk = max(1, max_columns // len(engine_combos))
+
+    tables = []
+    for start in range(0, len(combos), combos_per_chunk):
+        chunk = combos[start:start + combos_per_chunk]
+        entries, exits, keys, chunk_fees, chunk_stops = {}, {}, [], [], []
+
+        for values in chunk:
+            strategy = strategy_cls(**dict(zip(names, values)))
+            combo_entries, combo_exits = crossing_orders(strategy_signals(strategy, data))
+            for fee, stop in engine_combos:
+                key = (*values, fee, stop)
+                entries[key] = combo_entries
+                exits[key] = combo_exits
+                keys.append(key)
+                chunk_fees.append(fee)
+                chunk_stops.append(stop)
+
+        columns = pd.MultiIndex.from_tuples(keys, names=index_names)
+        portfolio = vbt.Portfolio.from_signals(
+            close=close,
+            entries=pd.DataFrame(entries, index=data.index).set_axis(columns, axis=1),
+            exits=pd.DataFrame(exits, index=data.index).set_axis(columns, axis=1),
+            init_cash=init_cash,
+            fees=np.asarray(chunk_fees)[None, :],
+            sl_stop=np.asarray(chunk_stops)[None, :],
+            freq=freq,
+        )
+        tables.append(pd.DataFrame(BacktestResult(portfolio=portfolio, signals=None).summary()))
+
+    table = pd.concat(tables)
+    table.index.names = index_names
+    return table
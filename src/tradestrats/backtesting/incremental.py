@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import os
+import pickle
+from pathlib import Path
+
+import pandas as pd
+
+from tradestrats.backtesting.chunked import DEFAULT_CHUNK_SIZE, ChunkedRunner, iter_chunks
+from tradestrats.backtesting.engine import BacktestResult
+from tradestrats.backtesting.store import run_key
+from tradestrats.config import DATA_DIR
+from tradestrats.strategies.base import Strategy
+
+CHECKPOINT_DIR = DATA_DIR / "checkpoints"
+
+# Bump when the checkpoint layout changes so old files are recomputed
+CHECKPOINT_VERSION = 1
+
+
+def checkpoint_path(strategy: Strategy, symbol: str, timeframe: str, exchange_id: str) -> Path:
+    """Default checkpoint file of a strategy on one dataset."""
+    name = f"{exchange_id}_{symbol.replace('/', '_')}_{timeframe}_{type(strategy).__name__}.pkl"
+    return CHECKPOINT_DIR / name
+
+
+def _load(path: Path, key: str) -> dict | None:
+    """Checkpoint for `key`, or None if missing, unreadable or for other settings."""
+    if not path.exists():
+        return None
+    try:
+        with open(path, "rb") as f:
+            checkpoint = pickle.load(f)
+    except Exception:  # noqa: BLE001 - a broken checkpoint only costs a full run
+        return None
+    if checkpoint.get("version") != CHECKPOINT_VERSION or checkpoint.get("key") != key:
+        return None
+    return checkpoint
+
+
+def _save(path: Path, checkpoint: dict) -> None:
+    """Write atomically, so a crash never leaves a truncated checkpoint."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        pickle.dump(checkpoint, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+
+
+def run_incremental(
+    strategy: Strategy,
+    data: pd.DataFrame,
+    checkpoint: str | Path,
+    overlap: int | None = None,
+    init_cash: float = 10_000.0,
+    fees: float = 0.001,
+    sl_stop: float | None = 0.05,
+    tp_stop: float | None = None,
+    sl_trail: bool = False,
+    short: bool = False,
+    limit_offset: float = 0.0,
+    limit_tif: int = 1,
+    informative: dict[str, pd.DataFrame] | None = None,
+    keep_equity: bool = False,
+) -> BacktestResult:
+    """Backtest that only simulates the bars added since the last call.
+
+    The first call runs the whole history (in chunks, see
+    `tradestrats.backtesting.chunked`) and saves the run to `checkpoint`.
+    The checkpoint holds the simulator state (cash, position, stop and limit
+    levels), the last `overlap` bars as indicator state, the running
+    metrics and the trades. Later calls with the grown history load it and
+    feed only the newer bars, so an update costs O(new bars + overlap) and
+    gives the same result as a full rerun (see `run_chunked` for the
+    `overlap` requirement).
+
+    A full run is done instead if the checkpoint is missing, was written
+    for a different strategy or settings, or if the last checkpointed
+    candle differs in `data` (revised history). Only pass closed candles:
+    a still forming last candle would be simulated with its preliminary
+    values. Checkpoints are pickles; only load files you wrote yourself.
+
+    Args:
+        strategy: A Strategy instance.
+        data: The full OHLCV history up to now (or at least every bar after
+            the checkpoint plus the last checkpointed bar).
+        checkpoint: Checkpoint file, e.g. from `checkpoint_path`.
+        overlap: Bars of indicator warm-up, see `run_chunked`.
+        init_cash, fees, sl_stop, tp_stop, sl_trail, short, limit_offset,
+        limit_tif, informative: See `simulator.run`.
+        keep_equity: Keep the equity curve. It is part of the checkpoint, so
+            saving it grows with the history.
+
+    Returns:
+        BacktestResult over the whole history, without signals.
+    """
+    checkpoint = Path(checkpoint)
+    settings = {
+        "init_cash": init_cash, "fees": fees, "sl_stop": sl_stop, "tp_stop": tp_stop, "sl_trail": sl_trail,
+        "short": short, "limit_offset": limit_offset, "limit_tif": limit_tif, "overlap": overlap,
+        "keep_equity": keep_equity,
+    }
+    key = run_key(strategy, None, settings)
+
+    saved = _load(checkpoint, key)
+    runner: ChunkedRunner | None = None
+    new = data
+    if saved is not None:
+        last = saved["last_bar"]
+        if last.name in data.index and data.loc[last.name, last.index].equals(last):
+            runner = saved["runner"]
+            runner.informative = informative
+            new = data[data.index > last.name]
+
+    if runner is None:
+        runner = ChunkedRunner(
+            strategy, overlap=overlap, init_cash=init_cash, fees=fees, sl_stop=sl_stop, tp_stop=tp_stop,
+            sl_trail=sl_trail, short=short, limit_offset=limit_offset, limit_tif=limit_tif,
+            informative=informative, keep_equity=keep_equity,
+        )
+
+    for chunk in iter_chunks(new, DEFAULT_CHUNK_SIZE):
+        runner.feed(chunk)
+    result = runner.result()
+
+    runner.informative = None  # reloaded on every call, not worth persisting
+    _save(checkpoint, {"version": CHECKPOINT_VERSION, "key": key, "runner": runner, "last_bar": data.iloc[-1]})
+    return result
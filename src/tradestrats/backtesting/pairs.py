@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from tradestrats.data.shared import SharedFrameHandle, SharedFrames, resolve_frame
+
+# MacKinnon (2010) response surfaces for the Engle-Granger test with two
+# variables and a constant: critical value = b0 + b1 / T + b2 / T^2
+_EG_CRITICAL = {
+    0.01: (-3.89644, -10.9519, -22.527),
+    0.05: (-3.33613, -6.1101, -6.823),
+    0.10: (-3.04445, -4.2412, -2.720),
+}
+
+PAIR_COLUMNS = [
+    "y", "x", "corr", "beta", "alpha", "adf_stat", "critical_value", "cointegrated", "half_life", "n_obs",
+]
+
+
+def log_returns(close: pd.DataFrame) -> pd.DataFrame:
+    """Bar log returns of a (time x symbol) close frame; NaN where a candle is missing."""
+    values = np.log(close.to_numpy(dtype=np.float64))
+    returns = np.full(values.shape, np.nan)
+    returns[1:] = values[1:] - values[:-1]
+    return pd.DataFrame(returns, index=close.index, columns=close.columns)
+
+
+def correlation_matrix(returns: pd.DataFrame, min_overlap: int = 2) -> pd.DataFrame:
+    """Pairwise-complete Pearson correlation of all columns in a few matrix products.
+
+    Each pair uses only the rows where both symbols have a value, as
+    ``DataFrame.corr`` does, but all sums come from (symbols x symbols)
+    matrix products instead of a Python loop over pairs.
+
+    Args:
+        returns: (time x symbol) values, NaN where missing.
+        min_overlap: Pairs with fewer common rows are NaN.
+    """
+    values = returns.to_numpy(dtype=np.float64)
+    valid = np.isfinite(values)
+    x = np.where(valid, values, 0.0)
+    m = valid.astype(np.float64)
+
+    n = m.T @ m                 # common rows
+    sx = x.T @ m                # sum of column i over the rows column j is valid
+    sxx = (x * x).T @ m
+    sxy = x.T @ x
+    cov = n * sxy - sx * sx.T
+    var_x, var_y = n * sxx - sx * sx, (n * sxx - sx * sx).T
+    with np.errstate(invalid="ignore", divide="ignore"):
+        corr = cov / np.sqrt(var_x * var_y)
+    corr[n < min_overlap] = np.nan
+    return pd.DataFrame(np.clip(corr, -1.0, 1.0), index=returns.columns, columns=returns.columns)
+
+
+def _ols(design: np.ndarray, target: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """OLS coefficients and their standard errors."""
+    coef, _, _, _ = np.linalg.lstsq(design, target, rcond=None)
+    resid = target - design @ coef
+    dof = max(1, len(target) - design.shape[1])
+    sigma2 = resid @ resid / dof
+    cov = sigma2 * np.linalg.pinv(design.T @ design)
+    return coef, np.sqrt(np.diag(cov))
+
+
+def adf_stat(series: np.ndarray, lags: int = 1) -> float:
+    """Augmented Dickey-Fuller t-statistic without constant (for regression residuals).
+
+    Regresses ``diff(e)`` on ``e[t-1]`` and `lags` lagged differences and
+    returns the t-statistic of the ``e[t-1]`` coefficient.
+    """
+    diff = np.diff(series)
+    target = diff[lags:]
+    columns = [series[lags:-1]] + [diff[lags - i:len(diff) - i] for i in range(1, lags + 1)]
+    coef, se = _ols(np.column_stack(columns), target)
+    return float(coef[0] / se[0]) if se[0] > 0 else float("-inf")
+
+
+def half_life(spread: np.ndarray) -> float:
+    """Mean-reversion half-life in bars from an AR(1) fit of the spread.
+
+    Returns inf if the spread does not revert (non-negative AR coefficient).
+    """
+    design = np.column_stack([np.ones(len(spread) - 1), spread[:-1]])
+    (_, lam), _ = _ols(design, np.diff(spread))
+    if not -1 < lam < 0:
+        return float("inf")
+    return float(-np.log(2) / np.log1p(lam))
+
+
+def eg_critical_value(n_obs: int, significance: float = 0.05) -> float:
+    """Engle-Granger critical value for a pair at 1%, 5% or 10% significance."""
+    if significance not in _EG_CRITICAL:
+        raise ValueError(f"significance must be one of {sorted(_EG_CRITICAL)}, got {significance}.")
+    b0, b1, b2 = _EG_CRITICAL[significance]
+    return b0 + b1 / n_obs + b2 / n_obs**2
+
+
+def engle_granger(y: np.ndarray, x: np.ndarray, lags: int = 1, significance: float = 0.05) -> dict:
+    """Engle-Granger two-step cointegration test of two log-price series.
+
+    Step 1 fits ``y = alpha + beta * x + spread``, step 2 runs an ADF test
+    on the spread. Only rows where both series have a value are used.
+
+    Returns:
+        Dict with beta, alpha, adf_stat, critical_value, cointegrated,
+        half_life and n_obs.
+    """
+    both = np.isfinite(y) & np.isfinite(x)
+    y, x = y[both], x[both]
+    n_obs = len(y)
+    (alpha, beta), _ = _ols(np.column_stack([np.ones(n_obs), x]), y)
+    spread = y - alpha - beta * x
+    stat = adf_stat(spread, lags)
+    critical = eg_critical_value(n_obs, significance)
+    return {
+        "beta": float(beta),
+        "alpha": float(alpha),
+        "adf_stat": stat,
+        "critical_value": critical,
+        "cointegrated": stat < critical,
+        "half_life": half_life(spread),
+        "n_obs": n_obs,
+    }
+
+
+def _test_pairs(
+    log_close: pd.DataFrame | SharedFrameHandle,
+    pairs: list[tuple[int, int]],
+    lags: int,
+    significance: float,
+) -> list[dict]:
+    """Worker: Engle-Granger per pair ``(i, j)`` with column `i` as y."""
+    values = resolve_frame(log_close).to_numpy()
+    return [{"y": i, "x": j, **engle_granger(values[:, i], values[:, j], lags, significance)} for i, j in pairs]
+
+
+def scan_pairs(
+    panel: pd.DataFrame,
+    min_corr: float = 0.7,
+    max_pairs: int | None = 500,
+    min_overlap: int = 500,
+    lags: int = 1,
+    significance: float = 0.05,
+    max_half_life: float | None = None,
+    max_workers: int | None = None,
+) -> pd.DataFrame:
+    """Find cointegrated pairs in a multi-symbol panel.
+
+    All symbol pairs are first screened with one vectorized correlation
+    matrix of aligned log returns (`correlation_matrix`). Only pairs with
+    a correlation of at least `min_corr` (the `max_pairs` highest) get the
+    Engle-Granger test on their log prices. The regression direction is
+    fixed up front (the symbol that comes first in the panel is y), so the
+    test holds at `significance`: keeping the stronger of both directions
+    would reject more often than the one-direction critical values allow.
+    These tests run on a process pool that attaches to the log prices in
+    shared memory.
+
+    Args:
+        panel: Multi-symbol panel, e.g. from `load_cached_panel`.
+        min_corr: Minimum return correlation to be tested.
+        max_pairs: Test at most this many of the most correlated pairs.
+        min_overlap: Minimum number of common bars of a pair.
+        lags: Lagged differences in the ADF regression.
+        significance: Test level: 0.01, 0.05 or 0.10.
+        max_half_life: Drop pairs whose spread half-life (in bars) is longer.
+        max_workers: Process pool size (default: number of CPUs); 1 tests
+            in this process.
+
+    Returns:
+        One row per tested pair (``PAIR_COLUMNS``): the spread is
+        ``log(y) - alpha - beta * log(x)``. Cointegrated pairs come first,
+        each group sorted by the ADF statistic (most negative first).
+    """
+    eg_critical_value(min_overlap, significance)  # validate before the heavy work
+    close = panel["close"]
+    symbols = list(close.columns)
+    corr = correlation_matrix(log_returns(close), min_overlap=min_overlap).to_numpy()
+
+    upper_i, upper_j = np.triu_indices(len(symbols), k=1)
+    pair_corr = corr[upper_i, upper_j]
+    keep = np.flatnonzero(pair_corr >= min_corr)
+    keep = keep[np.argsort(-pair_corr[keep], kind="stable")][:max_pairs]
+    pairs = list(zip(upper_i[keep].tolist(), upper_j[keep].tolist()))
+    if not pairs:
+        return pd.DataFrame(columns=PAIR_COLUMNS)
+
+    log_close = np.log(close)
+    n_workers = min(max_workers or multiprocessing.cpu_count(), len(pairs))
+    if n_workers <= 1:
+        rows = _test_pairs(log_close, pairs, lags, significance)
+    else:
+        chunks = [pairs[k::n_workers] for k in range(n_workers)]
+        # spawn: forking a process that already runs numba/BLAS threads is unsafe
+        ctx = multiprocessing.get_context("spawn")
+        with SharedFrames() as shared, ProcessPoolExecutor(max_workers=n_workers, mp_context=ctx) as pool:
+            handle = shared.publish(log_close)
+            futures = [pool.submit(_test_pairs, handle, chunk, lags, significance) for chunk in chunks]
+            rows = [row for future in futures for row in future.result()]
+
+    result = pd.DataFrame(rows)
+    result["corr"] = corr[result["y"], result["x"]]
+    result["y"] = [symbols[i] for i in result["y"]]
+    result["x"] = [symbols[i] for i in result["x"]]
+    if max_half_life is not None:
+        result = result[result["half_life"] <= max_half_life]
+    result = result.sort_values(["cointegrated", "adf_stat"], ascending=[False, True], kind="stable")
+    return result[PAIR_COLUMNS].reset_index(drop=True)
+
+
+def spread_frame(panel: pd.DataFrame, y: str, x: str, beta: float) -> pd.DataFrame:
+    """Synthetic OHLCV frame of the pair spread ``y / x**beta``.
+
+    Holding one unit of it is long `y` and short `beta` (in log terms) of
+    `x`; its log close is the spread of `scan_pairs` up to the constant
+    alpha. High/low are the max/min of open and close (intrabar extremes of
+    a spread are unknown). Use it with `PairSpread` and `engine.run`.
+
+    Args:
+        panel: Multi-symbol panel containing both symbols.
+        y, x: Symbols of the pair, as in a `scan_pairs` row.
+        beta: Hedge ratio from `scan_pairs`.
+    """
+    close = panel["close"][y] / panel["close"][x] ** beta
+    if "open" in panel.columns.get_level_values(0):
+        open_ = panel["open"][y] / panel["open"][x] ** beta
+    else:
+        open_ = close.shift().fillna(close)
+    frame = pd.DataFrame(
+        {
+            "open": open_,
+            "high": np.maximum(open_, close),
+            "low": np.minimum(open_, close),
+            "close": close,
+            "volume": 0.0,
+        },
+        index=panel.index,
+    )
+    return frame.dropna(subset=["open", "close"])
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+import vectorbt as vbt
+from numba import njit
+
+from tradestrats.backtesting.engine import BacktestResult, ann_factor, compute_metrics, infer_freq, signals_to_orders
+from tradestrats.strategies.base import Strategy
+
+SIZING_RULES = ("equal", "volatility")
+
+
+@dataclass
+class PortfolioResult(BacktestResult):
+    """Result of a shared-cash multi-asset backtest.
+
+    The inherited metrics describe the whole portfolio; `assets` holds the
+    per-symbol breakdown and `weights` the target weight of every order.
+    """
+
+    assets: pd.DataFrame | None = None
+    weights: pd.DataFrame | None = None
+
+
+@njit(cache=True)
+def _slot_orders_nb(close, entries, exits, sl_stop, max_positions):
+    """Walk the bars once and decide which signals become orders.
+
+    An entry is accepted only while fewer than `max_positions` symbols are
+    held (lower column positions first). Stop-losses are checked on the
+    close from the bar after the entry, like vectorbt without OHLC data.
+    Exits free their slot for entries on the same bar; a symbol is never
+    re-entered on its exit bar.
+    """
+    n, n_cols = close.shape
+    order_entries = np.zeros((n, n_cols), dtype=np.bool_)
+    order_exits = np.zeros((n, n_cols), dtype=np.bool_)
+    entry_price = np.full(n_cols, np.nan)
+    held = 0
+    for i in range(n):
+        for col in range(n_cols):
+            if np.isnan(close[i, col]) or np.isnan(entry_price[col]):
+                continue
+            stopped = not np.isnan(sl_stop) and close[i, col] <= entry_price[col] * (1 - sl_stop)
+            if stopped or exits[i, col]:
+                order_exits[i, col] = True
+                entry_price[col] = np.nan
+                held -= 1
+        for col in range(n_cols):
+            if held >= max_positions:
+                break
+            if entries[i, col] and np.isnan(entry_price[col]) and not order_exits[i, col] and not np.isnan(close[i, col]):
+                order_entries[i, col] = True
+                entry_price[col] = close[i, col]
+                held += 1
+    return order_entries, order_exits
+
+
+def position_weights(
+    close: pd.DataFrame,
+    sizing: str = "equal",
+    slots: int | None = None,
+    target_vol: float = 0.2,
+    vol_window: int = 20,
+) -> pd.DataFrame:
+    """Target portfolio weight of a position opened at each bar.
+
+    Every position gets an equal slot of ``1 / slots`` of the portfolio value.
+    With ``sizing="volatility"`` the slot is scaled down by
+    ``target_vol / realized_vol`` (annualized rolling std of returns, capped
+    at the full slot) so riskier assets get less capital; bars without
+    `vol_window` bars of history use the full slot.
+
+    Args:
+        close: (time x symbol) close prices.
+        sizing: One of `SIZING_RULES`.
+        slots: Number of slots (default: number of symbols).
+        target_vol: Annualized volatility per position for "volatility".
+        vol_window: Bars for the realized volatility.
+    """
+    if sizing not in SIZING_RULES:
+        raise ValueError(f"Unknown sizing rule: {sizing!r}. Available: {', '.join(SIZING_RULES)}")
+    budget = 1.0 / (slots or close.shape[1])
+    if sizing == "equal":
+        return pd.DataFrame(budget, index=close.index, columns=close.columns)
+
+    realized = close.pct_change(fill_method=None).rolling(vol_window).std() * np.sqrt(ann_factor(infer_freq(close.index)))
+    scale = (target_vol / realized).clip(upper=1.0).fillna(1.0)
+    return budget * scale
+
+
+def run_portfolio(
+    strategy: Strategy,
+    panel: pd.DataFrame,
+    init_cash: float = 10_000.0,
+    fees: float = 0.001,
+    sl_stop: float | None = 0.05,
+    sizing: str = "equal",
+    max_positions: int | None = None,
+    target_vol: float = 0.2,
+    vol_window: int = 20,
+) -> PortfolioResult:
+    """Backtest a strategy on a multi-symbol panel with one shared cash pool.
+
+    Unlike `engine.run_panel` (one independent portfolio per symbol), all
+    symbols draw from the same `init_cash`. Signals come from one
+    `generate_panel_signals` pass. A compiled pass over the bars applies
+    the stop-losses and the `max_positions` limit. The positions are then
+    simulated in a single grouped vectorbt run (``cash_sharing``,
+    sells before buys on each bar). Each entry buys up to its target weight
+    of the current portfolio value (see `position_weights`), and each exit
+    closes the position.
+
+    Args:
+        strategy: A Strategy instance.
+        panel: Multi-symbol panel, see `tradestrats.data.panel.build_panel`.
+        init_cash: Starting cash of the whole portfolio.
+        fees: Trading fee as a fraction.
+        sl_stop: Stop-loss as a fraction (checked on the close).
+        sizing: Position sizing rule, one of `SIZING_RULES`.
+        max_positions: Maximum number of simultaneously held symbols; also
+            the number of slots the capital is split into.
+        target_vol: Annualized volatility per position for "volatility".
+        vol_window: Bars for the realized volatility.
+
+    Returns:
+        PortfolioResult with portfolio-level metrics and per-asset breakdown.
+    """
+    close = panel["close"]
+    n_symbols = close.shape[1]
+    if max_positions is not None and not 1 <= max_positions <= n_symbols:
+        raise ValueError(f"max_positions must be between 1 and {n_symbols}, got {max_positions}.")
+    weights = position_weights(close, sizing, max_positions, target_vol, vol_window)
+
+    signals = strategy.generate_panel_signals(panel)
+    entries, exits = signals_to_orders(signals)
+    order_entries, order_exits = _slot_orders_nb(
+        close.to_numpy(dtype=float),
+        entries.to_numpy(),
+        exits.to_numpy(),
+        np.nan if not sl_stop else float(sl_stop),
+        max_positions or n_symbols,
+    )
+
+    size = np.where(order_entries, weights.to_numpy(), np.where(order_exits, 0.0, np.nan))
+    freq = infer_freq(panel.index)
+    portfolio = vbt.Portfolio.from_orders(
+        close=close,
+        size=size,
+        size_type="targetpercent",
+        init_cash=init_cash,
+        fees=fees,
+        cash_sharing=True,
+        group_by=True,
+        call_seq="auto",
+        freq=freq,
+    )
+
+    records = portfolio.trades.values
+    metrics = compute_metrics(
+        portfolio.value(),
+        init_cash=init_cash,
+        freq=freq,
+        trade_cols=np.zeros(len(records), dtype=np.int64),
+        trade_pnl=records["pnl"],
+    )
+
+    # Per-asset breakdown from the same trade records
+    trades = np.bincount(records["col"], minlength=n_symbols)
+    wins = np.bincount(records["col"], weights=records["pnl"] > 0, minlength=n_symbols)
+    pnl = np.bincount(records["col"], weights=records["pnl"], minlength=n_symbols)
+    assets = pd.DataFrame(
+        {
+            "trades": trades,
+            "win_rate": np.divide(wins, trades, out=np.zeros(n_symbols), where=trades > 0),
+            "pnl": pnl,
+            "contribution": pnl / init_cash,
+            "exposure": (portfolio.assets() != 0).mean().to_numpy(),
+        },
+        index=close.columns,
+    )
+
+    return PortfolioResult(
+        portfolio=portfolio,
+        signals=signals,
+        metrics=metrics,
+        equity=portfolio.value(),
+        assets=assets,
+        weights=pd.DataFrame(size, index=close.index, columns=close.columns),
+    )
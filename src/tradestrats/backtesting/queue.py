@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Iterable
+
+import pandas as pd
+
+from tradestrats.backtesting.batch import RESULT_COLUMNS, Job, run_dataset
+from tradestrats.data.fetcher import fetch_ohlcv
+
+DEFAULT_LEASE = 300.0
+DEFAULT_MAX_ATTEMPTS = 3
+JOB_STATES = ("pending", "running", "done", "failed")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    sweep TEXT NOT NULL,
+    key TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    lease_owner TEXT,
+    lease_expires REAL,
+    result TEXT,
+    error TEXT,
+    updated_at REAL,
+    UNIQUE (sweep, key)
+);
+CREATE INDEX IF NOT EXISTS jobs_claim ON jobs (sweep, status, lease_expires);
+"""
+
+
+@dataclass(frozen=True)
+class QueuedJob:
+    """A job claimed from the queue by one worker."""
+
+    id: int
+    job: Job
+    attempt: int
+    owner: str
+
+
+def worker_id() -> str:
+    """Identifier of this process, unique across hosts sharing a queue."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class JobQueue:
+    """Backtest job queue in a SQLite file, shared by workers on several hosts.
+
+    Workers `claim` a job with a lease, `heartbeat` while running it and
+    `complete` or `fail` it. A job whose lease runs out (crashed or killed
+    worker) becomes claimable again; every claim counts as an attempt and
+    a job is marked failed after `max_attempts`. Results and state changes
+    are only accepted from the current lease owner, so a late answer of a
+    worker that lost its lease is ignored.
+
+    The file must live on storage all workers can reach and that supports
+    file locks, which SQLite relies on; network file systems with unreliable
+    locking are not safe.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        # Autocommit mode; writes use explicit BEGIN IMMEDIATE transactions
+        return sqlite3.connect(self.path, timeout=60, isolation_level=None)
+
+    def submit(self, jobs: Iterable[Job], sweep: str = "default", max_attempts: int = DEFAULT_MAX_ATTEMPTS) -> int:
+        """Enqueue jobs; jobs already in the sweep are skipped.
+
+        Returns:
+            Number of newly added jobs.
+        """
+        rows = [(sweep, job.key, json.dumps(asdict(job)), max_attempts, time.time()) for job in jobs]
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO jobs (sweep, key, payload, max_attempts, updated_at) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            added = conn.total_changes - before
+            conn.execute("COMMIT")
+        return added
+
+    def claim(self, owner: str, sweep: str = "default", lease: float = DEFAULT_LEASE) -> QueuedJob | None:
+        """Lease the next pending (or expired) job of a sweep, or None if there is none."""
+        now = time.time()
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            # Expired leases of jobs without attempts left end here
+            conn.execute(
+                "UPDATE jobs SET status = 'failed', error = COALESCE(error, 'lease expired'), lease_owner = NULL, "
+                "updated_at = ? WHERE sweep = ? AND status = 'running' AND lease_expires < ? "
+                "AND attempts >= max_attempts",
+                (now, sweep, now),
+            )
+            row = conn.execute(
+                "SELECT id, payload, attempts FROM jobs WHERE sweep = ? AND "
+                "(status = 'pending' OR (status = 'running' AND lease_expires < ?)) ORDER BY id LIMIT 1",
+                (sweep, now),
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            job_id, payload, attempts = row
+            conn.execute(
+                "UPDATE jobs SET status = 'running', attempts = ?, lease_owner = ?, lease_expires = ?, "
+                "updated_at = ? WHERE id = ?",
+                (attempts + 1, owner, now + lease, now, job_id),
+            )
+            conn.execute("COMMIT")
+        return QueuedJob(id=job_id, job=Job(**json.loads(payload)), attempt=attempts + 1, owner=owner)
+
+    def _update_owned(self, claimed: QueuedJob, sql: str, args: tuple) -> bool:
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                f"UPDATE jobs SET {sql}, updated_at = ? WHERE id = ? AND lease_owner = ? AND status = 'running'",
+                (*args, time.time(), claimed.id, claimed.owner),
+            )
+            return cursor.rowcount == 1
+
+    def heartbeat(self, claimed: QueuedJob, lease: float = DEFAULT_LEASE) -> bool:
+        """Extend a lease; False if the job was meanwhile taken over."""
+        return self._update_owned(claimed, "lease_expires = ?", (time.time() + lease,))
+
+    def complete(self, claimed: QueuedJob, result: dict) -> bool:
+        """Store the result row of a job; False if the lease was lost."""
+        return self._update_owned(
+            claimed,
+            "status = 'done', result = ?, error = NULL, lease_owner = NULL, lease_expires = NULL",
+            (json.dumps(result, default=str),),
+        )
+
+    def fail(self, claimed: QueuedJob, error: str) -> bool:
+        """Record a failed attempt; the job is retried while attempts are left."""
+        return self._update_owned(
+            claimed,
+            "status = CASE WHEN attempts < max_attempts THEN 'pending' ELSE 'failed' END, "
+            "error = ?, lease_owner = NULL, lease_expires = NULL",
+            (error,),
+        )
+
+    def counts(self, sweep: str = "default") -> dict[str, int]:
+        """Number of jobs per state."""
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT status, COUNT(*) FROM jobs WHERE sweep = ? GROUP BY status", (sweep,))
+            found = dict(rows.fetchall())
+        return {state: found.get(state, 0) for state in JOB_STATES}
+
+    def results(self, sweep: str = "default") -> pd.DataFrame:
+        """Finished and failed jobs as a table with the `batch.RESULT_COLUMNS`."""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT payload, result, error FROM jobs WHERE sweep = ? AND status IN ('done', 'failed') ORDER BY id",
+                (sweep,),
+            ).fetchall()
+        records = []
+        for payload, result, error in rows:
+            if result is not None:
+                records.append(json.loads(result))
+            else:
+                job = Job(**json.loads(payload))
+                records.append({"key": job.key, **asdict(job), "error": error})
+        return pd.DataFrame(records).reindex(columns=RESULT_COLUMNS)
+
+
+def _keep_alive(queue: JobQueue, claimed: QueuedJob, lease: float, stop: threading.Event) -> None:
+    """Heartbeat thread: renew the lease at a third of its length."""
+    while not stop.wait(lease / 3):
+        if not queue.heartbeat(claimed, lease):
+            return
+
+
+def run_worker(
+    queue: JobQueue,
+    sweep: str = "default",
+    owner: str | None = None,
+    lease: float = DEFAULT_LEASE,
+    poll: float = 5.0,
+    max_jobs: int | None = None,
+    loader: Callable[..., pd.DataFrame] = fetch_ohlcv,
+    store_path: str | Path | None = None,
+    progress: Callable[[QueuedJob, dict], None] | None = None,
+) -> int:
+    """Drain a sweep: claim, run and report jobs until none are left.
+
+    While jobs of other workers are still running the worker keeps polling,
+    so it can pick up their jobs if their leases expire. Each job runs
+    through the same code path as `batch.run_batch`; errors are reported to
+    the queue and retried there.
+
+    Args:
+        queue: The shared queue.
+        sweep: Sweep to work on.
+        owner: Worker identifier (default: host and process id).
+        lease: Lease length in seconds, renewed in the background while a
+            job runs.
+        poll: Seconds to wait before asking again when nothing is claimable.
+        max_jobs: Stop after this many jobs.
+        loader: Data loader with the signature of `fetch_ohlcv`.
+        store_path: `ResultStore` to consult and fill, see `run_batch`.
+        progress: Called with (job, result row) after every job.
+
+    Returns:
+        Number of jobs this worker processed.
+    """
+    owner = owner or worker_id()
+    processed = 0
+    while max_jobs is None or processed < max_jobs:
+        claimed = queue.claim(owner, sweep, lease)
+        if claimed is None:
+            counts = queue.counts(sweep)
+            if counts["pending"] == 0 and counts["running"] == 0:
+                break
+            time.sleep(poll)
+            continue
+
+        stop = threading.Event()
+        keeper = threading.Thread(target=_keep_alive, args=(queue, claimed, lease, stop), daemon=True)
+        keeper.start()
+        try:
+            row = run_dataset([claimed.job], loader, store_path)[0]
+        finally:
+            stop.set()
+            keeper.join()
+
+        if isinstance(row.get("error"), str):
+            queue.fail(claimed, row["error"])
+        else:
+            queue.complete(claimed, row)
+        processed += 1
+        if progress is not None:
+            progress(claimed, row)
+    return processed
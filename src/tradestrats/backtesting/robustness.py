@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from tradestrats.backtesting.engine import BacktestResult, ann_factor
+
+# Peak bytes per (path x step) cell: index matrix, path matrix, running peak
+_BYTES_PER_CELL = 24
+
+METHODS = ("shuffle", "bootstrap", "block_bootstrap")
+
+
+@dataclass
+class RobustnessResult:
+    """Metric distributions over resampled equity paths."""
+
+    method: str
+    observed: dict
+    distribution: pd.DataFrame
+
+    def confidence_interval(self, level: float = 0.95) -> pd.DataFrame:
+        """Two-sided percentile interval per metric.
+
+        Returns:
+            DataFrame indexed by metric with lower/median/upper columns.
+        """
+        if not 0 < level < 1:
+            raise ValueError(f"level must be in (0, 1), got {level}.")
+        tail = (1 - level) / 2
+        q = self.distribution.quantile([tail, 0.5, 1 - tail]).T
+        q.columns = ["lower", "median", "upper"]
+        return q
+
+    @property
+    def probability_of_loss(self) -> float:
+        """Share of paths ending below the starting capital."""
+        return float((self.distribution["total_return"] < 0).mean())
+
+    def summary(self, level: float = 0.95) -> pd.DataFrame:
+        """Observed metrics next to their confidence interval."""
+        table = self.confidence_interval(level)
+        table.insert(0, "observed", pd.Series(self.observed))
+        return table
+
+
+def shuffle_paths(returns: np.ndarray, n_paths: int, rng: np.random.Generator) -> np.ndarray:
+    """Random permutations of a return sequence, one path per row.
+
+    The compounded total return is identical on every path; the order of
+    wins and losses — and with it the drawdown — varies.
+    """
+    paths = np.broadcast_to(np.asarray(returns, dtype=float), (n_paths, len(returns)))
+    return rng.permuted(paths, axis=1)
+
+
+def bootstrap_paths(
+    returns: np.ndarray,
+    n_paths: int,
+    rng: np.random.Generator,
+    block_size: int = 1,
+) -> np.ndarray:
+    """Circular moving-block bootstrap of a return sequence, one path per row.
+
+    Each path has the original length and is assembled from blocks of
+    ``block_size`` consecutive returns starting at random positions (wrapping
+    around the end). ``block_size=1`` is the plain i.i.d. bootstrap; longer
+    blocks preserve volatility clustering and autocorrelation.
+    """
+    returns = np.asarray(returns, dtype=float)
+    n = len(returns)
+    if not 1 <= block_size <= n:
+        raise ValueError(f"block_size must be between 1 and {n}, got {block_size}.")
+    n_blocks = -(-n // block_size)
+    starts = rng.integers(0, n, size=(n_paths, n_blocks, 1))
+    idx = (starts + np.arange(block_size)).reshape(n_paths, -1)[:, :n]
+    np.remainder(idx, n, out=idx)
+    return returns[idx]
+
+
+def path_metrics(paths: np.ndarray, ann_factor: float | None = None) -> dict[str, np.ndarray]:
+    """Compute metrics for every row of a (paths x steps) return matrix.
+
+    Definitions follow vectorbt: ``total_return`` compounds the returns,
+    ``max_drawdown`` is measured against the running peak of the compounded
+    curve, which starts at the initial equity of 1.0, and ``sharpe_ratio`` is
+    mean / std (ddof=1) scaled by ``sqrt(ann_factor)``.
+
+    Note: ``paths`` is overwritten (used as scratch space for the equity curves).
+
+    Args:
+        paths: 2-D array of simple returns.
+        ann_factor: Periods per year; omit to skip the Sharpe ratio (e.g. for
+            per-trade returns).
+    """
+    metrics = {}
+    if ann_factor is not None:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            std = paths.std(axis=1, ddof=1)
+            metrics["sharpe_ratio"] = paths.mean(axis=1) / std * np.sqrt(ann_factor)
+
+    equity = np.add(paths, 1.0, out=paths)
+    np.cumprod(equity, axis=1, out=equity)
+    metrics["total_return"] = equity[:, -1] - 1
+
+    # The peak starts at the initial equity, so a loss on the first step counts
+    peak = np.maximum.accumulate(equity, axis=1)
+    np.maximum(peak, 1.0, out=peak)
+    np.divide(equity, peak, out=peak)
+    metrics["max_drawdown"] = peak.min(axis=1) - 1
+    return metrics
+
+
+def monte_carlo(
+    result: BacktestResult,
+    method: str = "block_bootstrap",
+    n_paths: int = 10_000,
+    block_size: int | None = None,
+    seed: int | None = None,
+    memory_budget: int = 256 * 1024**2,
+) -> RobustnessResult:
+    """Resample a backtest into many alternative histories.
+
+    Methods:
+        shuffle: Permute the closed trades' returns (drawdown risk from
+            trade order).
+        bootstrap: Draw closed trades with replacement.
+        block_bootstrap: Circular block bootstrap of the per-bar portfolio
+            returns (includes Sharpe ratio).
+
+    Paths are generated and evaluated as 2-D NumPy arrays in chunks that fit
+    `memory_budget`; only the per-path metrics are kept, so the path count is
+    not limited by memory. Results are reproducible for a given `seed` and
+    `memory_budget`.
+
+    Args:
+        result: Single-column backtest result.
+        method: One of `METHODS`.
+        n_paths: Number of resampled paths.
+        block_size: Bars per block for block_bootstrap (default: cube root
+            of the number of bars).
+        seed: Seed for the random generator.
+        memory_budget: Approximate peak bytes per chunk.
+
+    Returns:
+        RobustnessResult with the observed metrics and one row per path.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown method: {method!r}. Available: {', '.join(METHODS)}")
+    portfolio = result.portfolio
+    if portfolio is None:
+        raise ValueError("Monte Carlo analysis needs the full result, not a compact one.")
+    if portfolio.wrapper.ndim != 1:
+        raise ValueError("Monte Carlo analysis needs a single-column backtest result.")
+
+    if method == "block_bootstrap":
+        returns = portfolio.returns().to_numpy(dtype=float)
+        periods = ann_factor(portfolio.wrapper.freq)
+        block_size = block_size or max(1, round(len(returns) ** (1 / 3)))
+    else:
+        returns = portfolio.trades.closed.returns.values.astype(float)
+        periods = None
+    if len(returns) < 2:
+        raise ValueError(f"Need at least 2 returns to resample, got {len(returns)}.")
+
+    rng = np.random.default_rng(seed)
+    observed = {k: float(v[0]) for k, v in path_metrics(returns[None, :].copy(), periods).items()}
+
+    chunk = max(1, memory_budget // (len(returns) * _BYTES_PER_CELL))
+    parts = []
+    for start in range(0, n_paths, chunk):
+        k = min(chunk, n_paths - start)
+        if method == "shuffle":
+            paths = shuffle_paths(returns, k, rng)
+        else:
+            paths = bootstrap_paths(returns, k, rng, block_size if method == "block_bootstrap" else 1)
+        parts.append(pd.DataFrame(path_metrics(paths, periods)))
+
+    distribution = pd.concat(parts, ignore_index=True)
+    return RobustnessResult(method=method, observed=observed, distribution=distribution)
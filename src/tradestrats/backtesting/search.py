@@ -0,0 +1,397 @@
+from __future__ import annotations
+
+import math
+import multiprocessing
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+import numpy as np
+import pandas as pd
+
+from tradestrats.backtesting import engine
+from tradestrats.data.shared import SharedFrameHandle, SharedFrames, resolve_frame
+from tradestrats.strategies.base import Strategy
+
+SEARCH_METHODS = ("random", "halving", "hyperband", "tpe")
+RESOURCES = ("bars", "symbols")
+
+METRICS = ("total_return", "sharpe_ratio", "max_drawdown", "total_trades", "win_rate", "final_value")
+
+
+@dataclass
+class SearchResult:
+    """Container for a parameter search.
+
+    `trials` has one row per evaluation: the parameters, the budget they
+    were evaluated on (``budget`` as a fraction of the full data, ``bars``
+    and ``symbols`` actually used), the summary metrics (averaged over the
+    symbols) and the ``score``. Halving-based methods evaluate a candidate
+    once per rung it survives.
+    """
+
+    method: str
+    metric: str
+    space: dict[str, list[Any]]
+    trials: pd.DataFrame
+    bars_evaluated: int
+    full_bars: int
+    elapsed: float
+
+    def _best(self) -> tuple[pd.DataFrame, int]:
+        """Trials on the full budget (all if there are none) and the best position."""
+        finalists = self.trials[self.trials["budget"] >= 1.0]
+        if finalists.empty:
+            finalists = self.trials
+        return finalists, int(_rank_key(finalists["score"].to_numpy()).argmax())
+
+    @property
+    def best_params(self) -> dict[str, Any]:
+        """Best parameters among the candidates evaluated on the full budget."""
+        finalists, i = self._best()
+        return {name: finalists[name].tolist()[i] for name in self.space}
+
+    @property
+    def best_score(self) -> float:
+        finalists, i = self._best()
+        return float(finalists["score"].iloc[i])
+
+    @property
+    def cost_fraction(self) -> float:
+        """Bars evaluated relative to an exhaustive grid on the full data."""
+        return self.bars_evaluated / (grid_size(self.space) * self.full_bars)
+
+    def compare(self, grid: pd.DataFrame) -> dict[str, Any]:
+        """How close the search got to the exhaustive optimum.
+
+        Args:
+            grid: Table from `engine.optimize` over the same space and data
+                (with scalar ``fees`` and ``sl_stop``). For multi-symbol
+                searches pass the per-candidate mean over the symbols.
+
+        Returns:
+            Dict with the grid optimum, the search result, ``score_gap``
+            (grid best minus search best), ``rank`` of the search's choice
+            in the grid (1 = found the optimum), ``percentile`` (share of
+            the grid scoring at most as well) and ``cost_fraction``.
+        """
+        table = grid.reset_index()
+        scores = table[self.metric].replace([np.inf, -np.inf], np.nan).to_numpy(dtype=float)
+        ranked = _rank_key(scores)
+        best = int(ranked.argmax())
+
+        chosen = self.best_params
+        mask = np.logical_and.reduce([table[name].to_numpy() == value for name, value in chosen.items()])
+        if not mask.any():
+            raise ValueError(f"Best parameters {chosen} are not part of the grid.")
+        chosen_score = ranked[mask][0]
+
+        return {
+            "grid_best_params": {name: table[name].tolist()[best] for name in self.space},
+            "grid_best_score": float(scores[best]),
+            "search_best_params": chosen,
+            "search_best_score": self.best_score,
+            "score_gap": float(ranked.max() - chosen_score),
+            "rank": int((ranked > chosen_score).sum()) + 1,
+            "percentile": float((ranked <= chosen_score).mean()),
+            "cost_fraction": self.cost_fraction,
+        }
+
+
+def grid_size(space: dict[str, Sequence[Any]]) -> int:
+    """Number of combinations in an exhaustive grid over `space`."""
+    return math.prod(len(values) for values in space.values())
+
+
+def _rank_key(scores: np.ndarray) -> np.ndarray:
+    """Scores for ranking: NaN and infinities count as the worst result."""
+    scores = np.asarray(scores, dtype=float)
+    return np.where(np.isfinite(scores), scores, -np.inf)
+
+
+def _evaluate_chunk(
+    frames: list[pd.DataFrame | SharedFrameHandle],
+    n_bars: int,
+    strategy_cls: type[Strategy],
+    candidates: list[dict[str, Any]],
+    engine_kwargs: dict,
+) -> np.ndarray:
+    """Worker: metrics of each candidate on the last `n_bars` of each frame, averaged."""
+    tables = []
+    for frame in frames:
+        data = resolve_frame(frame).iloc[-n_bars:]
+        table = engine.evaluate(strategy_cls, data, candidates, **engine_kwargs)
+        tables.append(table[list(METRICS)].to_numpy(dtype=float))
+    with np.errstate(invalid="ignore"):
+        return np.mean(tables, axis=0)
+
+
+class _Evaluator:
+    """Evaluates candidate batches on a budget, in parallel, and logs the trials."""
+
+    def __init__(self, strategy_cls, space, metric, frames, n_bars, resource, min_bars, engine_kwargs, pool, n_workers, rng):
+        self.strategy_cls = strategy_cls
+        self.metric = metric
+        self.space = space
+        self.frames = frames
+        self.n_bars = n_bars
+        self.resource = resource
+        self.min_bars = min_bars
+        self.engine_kwargs = engine_kwargs
+        self.pool = pool
+        self.n_workers = n_workers
+        # Symbols are added to the budget in a seeded random order
+        self.symbol_order = rng.permutation(len(frames))
+        self.rows: list[dict] = []
+        self.bars_evaluated = 0
+
+    def __call__(self, codes: np.ndarray, budget: float, **labels: Any) -> np.ndarray:
+        """Score candidates (rows of value indices) on a budget in (0, 1]."""
+        budget = min(1.0, budget)
+        if self.resource == "symbols":
+            n_symbols = max(1, math.ceil(budget * len(self.frames)))
+            frames = [self.frames[i] for i in sorted(self.symbol_order[:n_symbols])]
+            n_bars = self.n_bars
+        else:
+            frames = self.frames
+            n_bars = min(self.n_bars, max(self.min_bars, round(budget * self.n_bars)))
+
+        candidates = [self.params(code) for code in codes]
+        chunks = [c for c in np.array_split(np.arange(len(candidates)), self.n_workers) if len(c)]
+        args = [(frames, n_bars, self.strategy_cls, [candidates[i] for i in chunk], self.engine_kwargs) for chunk in chunks]
+        if self.pool is None:
+            metrics = [_evaluate_chunk(*a) for a in args]
+        else:
+            metrics = [f.result() for f in [self.pool.submit(_evaluate_chunk, *a) for a in args]]
+        metrics = np.concatenate(metrics)
+
+        self.bars_evaluated += n_bars * len(frames) * len(candidates)
+        scores = metrics[:, METRICS.index(self.metric)]
+        for candidate, values, score in zip(candidates, metrics, scores):
+            self.rows.append({
+                **labels, "budget": budget, "bars": n_bars, "symbols": len(frames),
+                **candidate, **dict(zip(METRICS, values)), "score": score,
+            })
+        return scores
+
+    def params(self, code: np.ndarray) -> dict[str, Any]:
+        return {name: values[int(i)] for (name, values), i in zip(self.space.items(), code)}
+
+
+def _sample(rng: np.random.Generator, dims: tuple[int, ...], n: int, exclude: set[tuple] = frozenset()) -> np.ndarray:
+    """Up to `n` distinct grid points (as value-index rows) not in `exclude`."""
+    total = math.prod(dims)
+    n = min(n, total - len(exclude))
+    if n <= 0:
+        return np.empty((0, len(dims)), dtype=np.int64)
+    picked: list[tuple] = []
+    seen = set(exclude)
+    while len(picked) < n:
+        flat = rng.choice(total, size=min(total, n - len(picked) + len(seen)), replace=False)
+        for code in zip(*np.unravel_index(flat, dims)):
+            code = tuple(int(i) for i in code)
+            if code not in seen:
+                seen.add(code)
+                picked.append(code)
+                if len(picked) == n:
+                    break
+    return np.asarray(picked, dtype=np.int64)
+
+
+def _successive_halving(evaluate, codes: np.ndarray, min_budget: float, eta: int, bracket: int = 0) -> None:
+    """Evaluate on growing budgets, keeping the best 1/eta after each rung."""
+    budget, rung = min_budget, 0
+    while len(codes):
+        scores = evaluate(codes, budget, bracket=bracket, rung=rung)
+        if budget >= 1.0:
+            return
+        keep = max(1, len(codes) // eta)
+        # Stable sort: ties keep sampling order, so runs are reproducible
+        order = np.argsort(-_rank_key(scores), kind="stable")[:keep]
+        codes = codes[order]
+        budget, rung = min(1.0, budget * eta), rung + 1
+
+
+def _tpe(evaluate, rng, dims, n_trials, batch_size, n_startup, gamma, n_ei_candidates) -> None:
+    """Tree-structured Parzen estimator over the discrete grid.
+
+    Each dimension gets two smoothed categorical densities: l(x) from the
+    best `gamma` share of the evaluated candidates and g(x) from the rest.
+    New candidates are drawn from l and the ones with the highest l/g
+    ratio (the TPE proxy for expected improvement) are evaluated next.
+    """
+    seen: set[tuple] = set()
+    codes_hist: list[np.ndarray] = []
+    scores_hist: list[np.ndarray] = []
+    n_done = 0
+
+    while n_done < n_trials:
+        size = min(batch_size, n_trials - n_done)
+        if n_done < n_startup:
+            batch = _sample(rng, dims, min(size, n_startup - n_done), seen)
+        else:
+            codes = np.concatenate(codes_hist)
+            scores = _rank_key(np.concatenate(scores_hist))
+            n_good = max(1, math.ceil(gamma * len(codes)))
+            good = np.zeros(len(codes), dtype=bool)
+            good[np.argsort(-scores, kind="stable")[:n_good]] = True
+
+            drawn = np.empty((n_ei_candidates, len(dims)), dtype=np.int64)
+            log_ratio = np.zeros(n_ei_candidates)
+            for j, k in enumerate(dims):
+                l = (np.bincount(codes[good, j], minlength=k) + 1.0) / (good.sum() + k)
+                g = (np.bincount(codes[~good, j], minlength=k) + 1.0) / ((~good).sum() + k)
+                drawn[:, j] = rng.choice(k, size=n_ei_candidates, p=l)
+                log_ratio += np.log(l[drawn[:, j]]) - np.log(g[drawn[:, j]])
+
+            picked = []
+            for i in np.argsort(-log_ratio, kind="stable"):
+                code = tuple(int(v) for v in drawn[i])
+                if code not in seen and code not in picked:
+                    picked.append(code)
+                    if len(picked) == size:
+                        break
+            batch = np.asarray(picked, dtype=np.int64).reshape(-1, len(dims))
+            if len(batch) < size:  # l concentrated on evaluated points: explore
+                extra = _sample(rng, dims, size - len(batch), seen | set(picked))
+                batch = np.concatenate([batch, extra])
+
+        if not len(batch):
+            return  # grid exhausted
+        seen.update(tuple(int(v) for v in code) for code in batch)
+        scores_hist.append(evaluate(batch, 1.0, rung=0))
+        codes_hist.append(batch)
+        n_done += len(batch)
+
+
+def search(
+    strategy_cls: type[Strategy],
+    data: pd.DataFrame | dict[str, pd.DataFrame],
+    space: dict[str, Sequence[Any]],
+    method: str = "halving",
+    n_trials: int = 64,
+    metric: str = "sharpe_ratio",
+    resource: str = "bars",
+    eta: int = 3,
+    min_budget: float = 1 / 9,
+    min_bars: int = 100,
+    seed: int | None = None,
+    max_workers: int | None = None,
+    batch_size: int = 8,
+    init_cash: float = 10_000.0,
+    fees: float = 0.001,
+    sl_stop: float = 0.05,
+) -> SearchResult:
+    """Search a parameter space without backtesting every combination.
+
+    Methods:
+
+    - ``"random"``: `n_trials` distinct random combinations on the full data.
+    - ``"halving"``: successive halving. `n_trials` combinations start on
+      `min_budget` of the data; after each rung only the best ``1/eta``
+      continue on ``eta`` times the budget, up to the full data.
+    - ``"hyperband"``: several halving brackets that trade the number of
+      candidates against the starting budget (from many candidates on
+      `min_budget` to few on the full data), hedging against rankings on
+      small budgets being misleading. Bracket sizes follow from `eta` and
+      `min_budget`; `n_trials` is not used.
+    - ``"tpe"``: Bayesian-style search (tree-structured Parzen estimator)
+      on the full data; the first quarter of `n_trials` is random, later
+      batches are drawn where good results concentrate.
+
+    The budget is either the most recent fraction of the history
+    (``resource="bars"``) or a seeded random subset of the symbols
+    (``resource="symbols"``, `data` is a dict of frames). With several
+    symbols the metrics are averaged over the symbols. Each batch of
+    candidates is split across a spawn-based process pool that reads the
+    data from shared memory. With the same `seed` the result does not
+    depend on `max_workers`.
+
+    Args:
+        strategy_cls: Strategy class to optimize.
+        data: OHLCV DataFrame, or dict of symbol -> OHLCV DataFrame.
+        space: Constructor arguments and candidate values (like a grid for
+            `engine.optimize`).
+        method: One of `SEARCH_METHODS`.
+        n_trials: Number of sampled combinations (see above).
+        metric: Summary metric to maximize.
+        resource: What a budget scales, one of `RESOURCES`.
+        eta: Reduction factor of halving and hyperband.
+        min_budget: Smallest budget as a fraction of the full data.
+        min_bars: Lower limit for the bars of a history slice.
+        seed: Seed of the random sampling.
+        max_workers: Process pool size (default: number of CPUs); 1 runs
+            everything in this process.
+        batch_size: Candidates per TPE iteration.
+        init_cash: Starting cash per backtest.
+        fees: Trading fee as a fraction.
+        sl_stop: Stop-loss as a fraction.
+
+    Returns:
+        SearchResult with all trials, the best parameters and the cost.
+    """
+    if method not in SEARCH_METHODS:
+        raise ValueError(f"Unknown search method: {method!r}. Available: {', '.join(SEARCH_METHODS)}")
+    if resource not in RESOURCES:
+        raise ValueError(f"Unknown resource: {resource!r}. Available: {', '.join(RESOURCES)}")
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric: {metric!r}. Available: {', '.join(METRICS)}")
+    if not 0 < min_budget <= 1 or eta < 2:
+        raise ValueError("min_budget must be in (0, 1] and eta at least 2.")
+
+    frames = list(data.values()) if isinstance(data, dict) else [data]
+    if resource == "symbols" and len(frames) < 2:
+        raise ValueError("resource='symbols' needs a dict with at least two symbols.")
+    n_bars = min(len(frame) for frame in frames)
+    space = {name: list(values) for name, values in space.items()}
+    dims = tuple(len(values) for values in space.values())
+
+    rng = np.random.default_rng(seed)
+    started = time.perf_counter()
+    engine_kwargs = {"init_cash": init_cash, "fees": fees, "sl_stop": sl_stop}
+
+    shared = SharedFrames()
+    pool: Executor | None = None
+    n_workers = max_workers or multiprocessing.cpu_count()
+    try:
+        if n_workers > 1:
+            frames = [shared.publish(frame) for frame in frames]
+            # spawn: forking a process that already runs numba/BLAS threads is unsafe
+            pool = ProcessPoolExecutor(max_workers=n_workers, mp_context=multiprocessing.get_context("spawn"))
+
+        evaluate = _Evaluator(
+            strategy_cls, space, metric, frames, n_bars, resource, min_bars, engine_kwargs, pool, n_workers, rng,
+        )
+
+        if method == "random":
+            evaluate(_sample(rng, dims, n_trials), 1.0, rung=0)
+        elif method == "halving":
+            _successive_halving(evaluate, _sample(rng, dims, n_trials), min_budget, eta)
+        elif method == "hyperband":
+            s_max = int(math.floor(math.log(1 / min_budget, eta) + 1e-9))
+            sampled: set[tuple] = set()
+            for s in range(s_max, -1, -1):
+                n = math.ceil((s_max + 1) / (s + 1) * eta**s)
+                codes = _sample(rng, dims, n, sampled)
+                sampled.update(tuple(int(v) for v in code) for code in codes)
+                _successive_halving(evaluate, codes, float(eta) ** -s, eta, bracket=s_max - s)
+        else:
+            _tpe(evaluate, rng, dims, n_trials, batch_size, n_startup=max(1, n_trials // 4),
+                 gamma=0.25, n_ei_candidates=64)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        shared.close()
+
+    trials = pd.DataFrame(evaluate.rows)
+    trials.index.name = "trial"
+    return SearchResult(
+        method=method,
+        metric=metric,
+        space=space,
+        trials=trials,
+        bars_evaluated=evaluate.bars_evaluated,
+        full_bars=n_bars * len(frames),
+        elapsed=time.perf_counter() - started,
+    )
@@ -0,0 +1,404 @@
+from __future__ import annotations
+
+from dataclasses import astuple, dataclass
+
+import numpy as np
+import pandas as pd
+from numba import njit
+
+from tradestrats.backtesting.engine import BacktestResult, compute_metrics, infer_freq, strategy_orders
+from tradestrats.data.timeframes import merge_informative
+from tradestrats.strategies.base import Strategy
+
+# Exit reasons stored in the trade records
+EXIT_SIGNAL, EXIT_STOP_LOSS, EXIT_TAKE_PROFIT, EXIT_TRAILING_STOP, EXIT_OPEN = range(5)
+EXIT_REASONS = ("signal", "stop_loss", "take_profit", "trailing_stop", "open")
+
+TRADE_FIELDS = (
+    "entry_bar", "exit_bar", "direction", "size", "entry_price", "exit_price",
+    "entry_fees", "exit_fees", "pnl", "return", "exit_reason",
+)
+
+
+@dataclass
+class SimState:
+    """Simulator state between two calls, e.g. for chunked or live runs.
+
+    A fresh state is flat with `cash` set to the starting capital. Bar
+    positions (`entry_bar`, `limit_expiry`) are global, see `bar_offset`.
+    """
+
+    cash: float
+    position: float = 0.0
+    entry_price: float = np.nan
+    entry_fees: float = 0.0
+    entry_bar: float = -1.0
+    stop_anchor: float = np.nan
+    limit_price: float = np.nan
+    limit_expiry: float = -1.0
+    limit_direction: float = 0.0
+    last_close: float = np.nan
+
+    def to_array(self) -> np.ndarray:
+        return np.array(astuple(self), dtype=np.float64)
+
+    @classmethod
+    def from_array(cls, values: np.ndarray) -> SimState:
+        return cls(*(float(v) for v in values))
+
+
+@dataclass
+class SimResult:
+    """Raw simulator output."""
+
+    value: np.ndarray
+    trades: np.ndarray
+    state: SimState
+
+
+@njit(cache=True)
+def _close_position(state, price, fees, bar, reason, trades, n_trades):
+    position = state[1]
+    size = abs(position)
+    exit_fees = size * price * fees
+    if position > 0:
+        state[0] += size * price - exit_fees
+        pnl = size * (price - state[2]) - state[3] - exit_fees
+    else:
+        state[0] -= size * price + exit_fees
+        pnl = size * (state[2] - price) - state[3] - exit_fees
+
+    if n_trades == trades.shape[0]:
+        grown = np.empty((2 * trades.shape[0], trades.shape[1]))
+        grown[:n_trades] = trades
+        trades = grown
+    row = trades[n_trades]
+    row[0] = state[4]
+    row[1] = bar
+    row[2] = 1.0 if position > 0 else -1.0
+    row[3] = size
+    row[4] = state[2]
+    row[5] = price
+    row[6] = state[3]
+    row[7] = exit_fees
+    row[8] = pnl
+    row[9] = pnl / (size * state[2])
+    row[10] = reason
+
+    state[1] = 0.0
+    state[2] = np.nan
+    state[3] = 0.0
+    state[4] = -1.0
+    state[5] = np.nan
+    return trades, n_trades + 1
+
+
+@njit(cache=True)
+def _open_position(state, direction, price, fees, bar):
+    # All available cash, fees included (like vectorbt's size=inf)
+    cash = state[0]
+    size = cash / (price * (1 + fees))
+    entry_fees = size * price * fees
+    if direction > 0:
+        state[0] = cash - size * price - entry_fees
+        state[1] = size
+    else:
+        state[0] = cash + size * price - entry_fees
+        state[1] = -size
+    state[2] = price
+    state[3] = entry_fees
+    state[4] = bar
+    state[5] = price
+
+
+@njit(cache=True)
+def _simulate_nb(
+    open_, high, low, close,
+    long_entries, long_exits, short_entries, short_exits,
+    fees, sl_stop, tp_stop, sl_trail, limit_offset, limit_tif,
+    state, bar_offset,
+):
+    n = close.shape[0]
+    value = np.empty(n)
+    trades = np.empty((16, 11))
+    n_trades = 0
+    stop_reason = EXIT_TRAILING_STOP if sl_trail else EXIT_STOP_LOSS
+
+    for i in range(n):
+        bar = i + bar_offset
+        c = close[i]
+        if np.isnan(c):  # no candle: nothing can fill
+            value[i] = state[0] + state[1] * state[9] if state[1] != 0 else state[0]
+            continue
+        o = open_[i] if not np.isnan(open_[i]) else c
+        h = high[i] if not np.isnan(high[i]) else max(o, c)
+        lo = low[i] if not np.isnan(low[i]) else min(o, c)
+        position = state[1]
+
+        # 1. Stops against the bar's range; a gap through the stop fills at the open
+        exit_price = np.nan
+        reason = stop_reason
+        if position != 0:
+            if not np.isnan(sl_stop):
+                if position > 0:
+                    stop = state[5] * (1 - sl_stop)
+                    if o <= stop:
+                        exit_price = o
+                    elif lo <= stop:
+                        exit_price = stop
+                else:
+                    stop = state[5] * (1 + sl_stop)
+                    if o >= stop:
+                        exit_price = o
+                    elif h >= stop:
+                        exit_price = stop
+            if np.isnan(exit_price) and not np.isnan(tp_stop):
+                reason = EXIT_TAKE_PROFIT
+                if position > 0:
+                    target = state[2] * (1 + tp_stop)
+                    if o >= target:
+                        exit_price = o
+                    elif h >= target:
+                        exit_price = target
+                else:
+                    target = state[2] * (1 - tp_stop)
+                    if o <= target:
+                        exit_price = o
+                    elif lo <= target:
+                        exit_price = target
+            if sl_trail:
+                if position > 0 and h > state[5]:
+                    state[5] = h
+                elif position < 0 and lo < state[5]:
+                    state[5] = lo
+
+        if not np.isnan(exit_price):
+            # A stop exit takes the bar; signals on it are ignored
+            trades, n_trades = _close_position(state, exit_price, fees, bar, reason, trades, n_trades)
+        else:
+            # 2. Pending limit entry
+            if state[8] != 0 and state[1] == 0:
+                if bar > state[7]:
+                    state[8] = 0.0
+                elif state[8] > 0 and lo <= state[6]:
+                    _open_position(state, 1.0, min(o, state[6]), fees, bar)
+                    state[8] = 0.0
+                elif state[8] < 0 and h >= state[6]:
+                    _open_position(state, -1.0, max(o, state[6]), fees, bar)
+                    state[8] = 0.0
+
+            # 3. Signals, filled at the close
+            position = state[1]
+            if position > 0 and (long_exits[i] or short_entries[i]):
+                trades, n_trades = _close_position(state, c, fees, bar, EXIT_SIGNAL, trades, n_trades)
+            elif position < 0 and (short_exits[i] or long_entries[i]):
+                trades, n_trades = _close_position(state, c, fees, bar, EXIT_SIGNAL, trades, n_trades)
+            if (state[8] > 0 and long_exits[i]) or (state[8] < 0 and short_exits[i]):
+                state[8] = 0.0
+
+            if state[1] == 0 and long_entries[i] != short_entries[i]:
+                direction = 1.0 if long_entries[i] else -1.0
+                if limit_offset > 0:
+                    state[6] = c * (1 - direction * limit_offset)
+                    state[7] = bar + limit_tif
+                    state[8] = direction
+                else:
+                    _open_position(state, direction, c, fees, bar)
+
+        state[9] = c
+        value[i] = state[0] + state[1] * c
+
+    return value, trades[:n_trades], state
+
+
+def _as_float(values, n: int) -> np.ndarray:
+    if values is None:
+        return np.full(n, np.nan)
+    return np.asarray(values, dtype=np.float64)
+
+
+def _as_bool(values, n: int) -> np.ndarray:
+    if values is None:
+        return np.zeros(n, dtype=np.bool_)
+    return np.asarray(values, dtype=np.bool_)
+
+
+def simulate(
+    close: np.ndarray,
+    long_entries: np.ndarray,
+    long_exits: np.ndarray,
+    short_entries: np.ndarray | None = None,
+    short_exits: np.ndarray | None = None,
+    open_: np.ndarray | None = None,
+    high: np.ndarray | None = None,
+    low: np.ndarray | None = None,
+    init_cash: float = 10_000.0,
+    fees: float = 0.001,
+    sl_stop: float | None = None,
+    tp_stop: float | None = None,
+    sl_trail: bool = False,
+    limit_offset: float = 0.0,
+    limit_tif: int = 1,
+    state: SimState | None = None,
+    bar_offset: int = 0,
+) -> SimResult:
+    """Bar-by-bar simulation of a single asset (Numba-compiled).
+
+    Per bar, in this order:
+
+    1. Stops of an open position are checked against the bar's open/high/low.
+       Stop-loss and trailing stop are measured from the entry (trailing: the
+       best high/low since entry), take-profit from the entry price. A bar that
+       opens beyond the level fills at the open, otherwise at the level.
+       A stop exit ends the bar: signals on that bar are ignored.
+    2. A pending limit entry fills if the bar trades through its price (at
+       the better of open and limit) or expires after `limit_tif` bars.
+    3. Signals fill at the close: an exit or an opposite entry closes the
+       position, an entry opens one with all available cash (or places a
+       limit order `limit_offset` away from the close).
+
+    Conventions follow ``vbt.Portfolio.from_signals`` (stops from the next
+    bar on, stop orders without slippage, trade return = PnL / entry value),
+    so runs without limit orders and shorts reproduce vectorbt exactly.
+    Missing open/high/low fall back to the close.
+
+    Args:
+        close: Close prices; NaN bars are skipped.
+        long_entries, long_exits: Boolean signal arrays.
+        short_entries, short_exits: Boolean signal arrays for short trades.
+        open_, high, low: Optional prices for OHLC-aware fills.
+        init_cash: Starting cash (ignored if `state` is given).
+        fees: Fee as a fraction of the traded value.
+        sl_stop: Stop-loss as a fraction.
+        tp_stop: Take-profit as a fraction.
+        sl_trail: Trail the stop-loss behind the best price since entry.
+        limit_offset: Place entries as limit orders this fraction below
+            (long) or above (short) the signal close; 0 = market at close.
+        limit_tif: Bars a limit order stays active.
+        state: State returned by a previous call to continue from.
+        bar_offset: Global position of the first bar (for trade records).
+
+    Returns:
+        SimResult with the value per bar, one row per closed trade (columns
+        `TRADE_FIELDS`) and the final state.
+    """
+    n = len(close)
+    state = state if state is not None else SimState(cash=init_cash)
+    value, trades, final = _simulate_nb(
+        _as_float(open_, n), _as_float(high, n), _as_float(low, n), _as_float(close, n),
+        _as_bool(long_entries, n), _as_bool(long_exits, n),
+        _as_bool(short_entries, n), _as_bool(short_exits, n),
+        float(fees),
+        np.nan if not sl_stop else float(sl_stop),
+        np.nan if not tp_stop else float(tp_stop),
+        bool(sl_trail),
+        float(limit_offset),
+        int(limit_tif),
+        state.to_array(),
+        int(bar_offset),
+    )
+    return SimResult(value=value, trades=trades, state=SimState.from_array(final))
+
+
+def trade_frame(sim: SimResult, index: pd.DatetimeIndex | None = None) -> pd.DataFrame:
+    """Trade records as a DataFrame, including a still open position.
+
+    The open trade is marked to market at the last close without exit fees
+    (like vectorbt). With `index`, entry/exit bars are mapped to timestamps.
+    """
+    trades = pd.DataFrame(sim.trades, columns=list(TRADE_FIELDS))
+    state = sim.state
+    if state.position != 0:
+        size = abs(state.position)
+        direction = np.sign(state.position)
+        pnl = direction * size * (state.last_close - state.entry_price) - state.entry_fees
+        trades.loc[len(trades)] = [
+            state.entry_bar, np.nan, direction, size, state.entry_price, state.last_close,
+            state.entry_fees, 0.0, pnl, pnl / (size * state.entry_price), EXIT_OPEN,
+        ]
+    trades = trades.astype({"entry_bar": int, "direction": int, "exit_reason": int})
+    trades["exit_reason"] = np.asarray(EXIT_REASONS)[trades["exit_reason"]]
+    if index is not None:
+        trades["entry_time"] = index[trades["entry_bar"]]
+        exit_bar = trades["exit_bar"].fillna(len(index) - 1).astype(int)
+        trades["exit_time"] = index[exit_bar].where(trades["exit_bar"].notna())
+    return trades
+
+
+def run(
+    strategy: Strategy,
+    data: pd.DataFrame,
+    init_cash: float = 10_000.0,
+    fees: float = 0.001,
+    sl_stop: float | None = 0.05,
+    tp_stop: float | None = None,
+    sl_trail: bool = False,
+    short: bool = False,
+    limit_offset: float = 0.0,
+    limit_tif: int = 1,
+    informative: dict[str, pd.DataFrame] | None = None,
+    warmup: int = 0,
+    chunk_size: int | None = None,
+    overlap: int | None = None,
+    fast: bool = False,
+) -> BacktestResult:
+    """Backtest a strategy with the native simulator.
+
+    Buy signals (1) open longs, sell signals (-1) close them; with
+    ``short=True`` sell signals open shorts instead (reversing a long) and buy
+    signals reverse back. Stops are checked against each bar's high/low.
+    See `simulate` for the fill rules and `engine.run` for the other args.
+    With `chunk_size` the history is processed in memory-bounded chunks
+    with `overlap` bars of indicator warm-up, see
+    `tradestrats.backtesting.chunked.run_chunked` (which can also drop the
+    equity curve and stream from Parquet). `fast` uses the array-level
+    signal path, see `engine.run`; chunked runs always do.
+
+    Returns:
+        BacktestResult without a vectorbt portfolio: metrics, equity curve and
+        trade records are precomputed.
+    """
+    if chunk_size:
+        from tradestrats.backtesting.chunked import run_chunked
+
+        return run_chunked(
+            strategy, data, chunk_size=chunk_size, overlap=overlap,
+            init_cash=init_cash, fees=fees, sl_stop=sl_stop, tp_stop=tp_stop, sl_trail=sl_trail, short=short,
+            limit_offset=limit_offset, limit_tif=limit_tif, informative=informative, warmup=warmup,
+            keep_equity=True,
+        )
+    if strategy.informative_timeframes:
+        data = merge_informative(data, strategy.informative_timeframes, informative)
+
+    signals, entries, exits = strategy_orders(strategy, data, fast)
+    if warmup:
+        data, signals = data.iloc[warmup:], signals.iloc[warmup:]
+        entries, exits = entries[warmup:], exits[warmup:]
+
+    sim = simulate(
+        close=data["close"].to_numpy(),
+        long_entries=entries,
+        long_exits=None if short else exits,
+        short_entries=exits if short else None,
+        open_=data["open"].to_numpy() if "open" in data else None,
+        high=data["high"].to_numpy() if "high" in data else None,
+        low=data["low"].to_numpy() if "low" in data else None,
+        init_cash=init_cash,
+        fees=fees,
+        sl_stop=sl_stop,
+        tp_stop=tp_stop,
+        sl_trail=sl_trail,
+        limit_offset=limit_offset,
+        limit_tif=limit_tif,
+    )
+
+    trades = trade_frame(sim, data.index)
+    equity = pd.Series(sim.value, index=data.index, name="value")
+    metrics = compute_metrics(
+        equity,
+        init_cash=init_cash,
+        freq=infer_freq(data.index),
+        trade_cols=np.zeros(len(trades), dtype=np.int64),
+        trade_pnl=trades["pnl"].to_numpy(),
+    )
+    return BacktestResult(portfolio=None, signals=signals, metrics=metrics, equity=equity, trades=trades)
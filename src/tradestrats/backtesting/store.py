@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import sqlite3
+from contextlib import closing
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from tradestrats.config import DATA_DIR
+
+# Bump when engine semantics change so old entries stop matching
+STORE_VERSION = 1
+
+DEFAULT_STORE_PATH = DATA_DIR / "results.sqlite"
+
+METRIC_COLUMNS = ("total_return", "sharpe_ratio", "max_drawdown", "total_trades", "win_rate", "final_value")
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS runs (
+    key TEXT PRIMARY KEY,
+    strategy TEXT NOT NULL,
+    params TEXT NOT NULL,
+    settings TEXT NOT NULL,
+    data_fingerprint TEXT NOT NULL,
+    n_bars INTEGER,
+    start TEXT,
+    end TEXT,
+    created_at TEXT,
+    {", ".join(f"{m} REAL" for m in METRIC_COLUMNS)},
+    equity BLOB,
+    trades BLOB
+);
+CREATE INDEX IF NOT EXISTS runs_sharpe ON runs (sharpe_ratio);
+CREATE INDEX IF NOT EXISTS runs_return ON runs (total_return);
+CREATE INDEX IF NOT EXISTS runs_strategy ON runs (strategy);
+"""
+
+
+def data_fingerprint(data: pd.DataFrame | None) -> str:
+    """Content hash of a frame (index, column names and values)."""
+    if data is None:
+        return "none"
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(json.dumps([str(c) for c in data.columns]).encode())
+    digest.update(np.ascontiguousarray(data.index.asi8 if hasattr(data.index, "asi8") else data.index.to_numpy()).tobytes())
+    digest.update(np.ascontiguousarray(data.to_numpy(dtype=np.float64)).tobytes())
+    return digest.hexdigest()
+
+
+def _param_state(value: Any) -> Any:
+    """JSON-friendly snapshot of an object's attributes, recursively.
+
+    Identifies strategy parameters without relying on ``__repr__`` (the
+    base `Strategy.__repr__` lists no parameters). Nested objects such as
+    expression trees are expanded the same way; other values fall back to
+    ``str`` when the payload is encoded.
+    """
+    if isinstance(value, dict):
+        return {str(k): _param_state(v) for k, v in sorted(value.items(), key=lambda item: str(item[0]))}
+    if isinstance(value, (list, tuple)):
+        return [_param_state(v) for v in value]
+    if hasattr(value, "__dict__") and not isinstance(value, type):
+        return {"__class__": f"{type(value).__module__}.{type(value).__qualname__}", **_param_state(vars(value))}
+    return value
+
+
+def run_key(
+    strategy,
+    data: pd.DataFrame,
+    settings: dict[str, Any],
+    informative: dict[str, pd.DataFrame] | None = None,
+) -> str:
+    """Content address of a backtest: strategy, engine settings and data.
+
+    Args:
+        strategy: Strategy instance; its class and instance attributes (the
+            parameters) identify it.
+        data: OHLCV input frame.
+        settings: Engine settings (fees, stops, backend, ...); must be JSON
+            serializable.
+        informative: Higher-timeframe inputs, if any.
+    """
+    payload = {
+        "version": STORE_VERSION,
+        "strategy": f"{type(strategy).__module__}.{type(strategy).__qualname__}",
+        "params": _param_state(strategy),
+        "settings": settings,
+        "data": data_fingerprint(data),
+        "informative": {tf: data_fingerprint(df) for tf, df in sorted((informative or {}).items())},
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _to_blob(frame: pd.DataFrame | pd.Series | None) -> bytes | None:
+    if frame is None:
+        return None
+    if isinstance(frame, pd.Series):
+        frame = frame.to_frame(name=frame.name or "value")
+    buffer = io.BytesIO()
+    frame.to_parquet(buffer)
+    return buffer.getvalue()
+
+
+def _from_blob(blob: bytes | None) -> pd.DataFrame | None:
+    return None if blob is None else pd.read_parquet(io.BytesIO(blob))
+
+
+class ResultStore:
+    """Backtest results on local disk (SQLite), keyed by `run_key`.
+
+    Each entry holds the summary metrics, optionally the equity curve and
+    trade records (as Parquet blobs), plus metadata for queries. Metric
+    columns are indexed, so ranking thousands of runs is a single query.
+    Connections are opened per operation, so a store can be shared between
+    processes (e.g. batch workers).
+    """
+
+    def __init__(self, path: str | Path = DEFAULT_STORE_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def __len__(self) -> int:
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+    def __contains__(self, key: str) -> bool:
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT 1 FROM runs WHERE key = ?", (key,)).fetchone() is not None
+
+    def get(self, key: str):
+        """Load a stored result, or None if the key is unknown.
+
+        Returns:
+            BacktestResult without portfolio and signals; `equity` and
+            `trades` are set if they were stored.
+        """
+        from tradestrats.backtesting.engine import BacktestResult
+
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                f"SELECT {', '.join(METRIC_COLUMNS)}, equity, trades FROM runs WHERE key = ?", (key,),
+            ).fetchone()
+        if row is None:
+            return None
+
+        metrics = {m: (np.nan if v is None else v) for m, v in zip(METRIC_COLUMNS, row)}
+        metrics["total_trades"] = int(metrics["total_trades"])
+        equity = _from_blob(row[-2])
+        return BacktestResult(
+            portfolio=None,
+            signals=None,
+            metrics=metrics,
+            equity=equity.iloc[:, 0] if equity is not None else None,
+            trades=_from_blob(row[-1]),
+        )
+
+    def put(
+        self,
+        key: str,
+        result,
+        strategy=None,
+        data: pd.DataFrame | None = None,
+        settings: dict[str, Any] | None = None,
+        keep_equity: bool = True,
+        keep_trades: bool = True,
+    ) -> None:
+        """Store a result under `key` (replacing an existing entry).
+
+        Args:
+            key: Key from `run_key`.
+            result: Single-column BacktestResult.
+            strategy: Strategy for the metadata columns.
+            data: Input frame for the metadata columns.
+            settings: Engine settings for the metadata columns.
+            keep_equity: Store the equity curve.
+            keep_trades: Store the trade records.
+        """
+        summary = result.summary()
+        trades = None
+        if keep_trades:
+            trades = result.trades
+            if trades is None and result.portfolio is not None:
+                trades = result.portfolio.trades.records_readable
+
+        row = {
+            "key": key,
+            "strategy": type(strategy).__name__ if strategy is not None else "",
+            "params": repr(strategy) if strategy is not None else "",
+            "settings": json.dumps(settings or {}, sort_keys=True, default=str),
+            "data_fingerprint": data_fingerprint(data),
+            "n_bars": len(data) if data is not None else None,
+            "start": str(data.index[0]) if data is not None and len(data) else None,
+            "end": str(data.index[-1]) if data is not None and len(data) else None,
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            **{m: float(summary[m]) for m in METRIC_COLUMNS},
+            "equity": _to_blob(result.equity_curve) if keep_equity else None,
+            "trades": _to_blob(trades),
+        }
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                f"INSERT OR REPLACE INTO runs ({', '.join(row)}) VALUES ({', '.join('?' * len(row))})",
+                tuple(row.values()),
+            )
+
+    def top(self, n: int = 10, by: str = "sharpe_ratio", ascending: bool = False, strategy: str | None = None) -> pd.DataFrame:
+        """Best stored runs by a metric (NaN metrics last).
+
+        Args:
+            n: Number of rows.
+            by: Metric column to rank by.
+            ascending: Rank ascending (e.g. for max_drawdown magnitude use False).
+            strategy: Restrict to one strategy class name.
+
+        Returns:
+            DataFrame of metadata and metrics (without blobs), indexed by key.
+        """
+        if by not in METRIC_COLUMNS:
+            raise ValueError(f"Unknown metric: {by!r}. Available: {', '.join(METRIC_COLUMNS)}")
+        columns = ["key", "strategy", "params", "settings", "n_bars", "start", "end", *METRIC_COLUMNS]
+        query = f"SELECT {', '.join(columns)} FROM runs"
+        args: tuple = ()
+        if strategy is not None:
+            query += " WHERE strategy = ?"
+            args = (strategy,)
+        query += f" ORDER BY {by} IS NULL, {by} {'ASC' if ascending else 'DESC'} LIMIT ?"
+        with closing(self._connect()) as conn:
+            table = pd.read_sql_query(query, conn, params=(*args, n))
+        return table.set_index("key")
+
+    def delete(self, key: str) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM runs WHERE key = ?", (key,))
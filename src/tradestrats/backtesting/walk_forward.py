@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+import numpy as np
+import pandas as pd
+
+from tradestrats.backtesting import engine
+from tradestrats.data.shared import SharedFrameHandle, SharedFrames, attach_frame
+from tradestrats.strategies.base import Strategy
+
+
+@dataclass(frozen=True)
+class Window:
+    """One walk-forward fold as bar positions (end exclusive)."""
+
+    is_start: int
+    is_end: int
+    oos_start: int
+    oos_end: int
+
+
+@dataclass
+class WalkForwardResult:
+    """Container for walk-forward results."""
+
+    folds: pd.DataFrame
+    equity_curve: pd.Series
+    freq: Any
+
+    @property
+    def total_return(self) -> float:
+        return self.equity_curve.iloc[-1] / self.equity_curve.iloc[0] - 1
+
+    @property
+    def sharpe_ratio(self) -> float:
+        returns = self.equity_curve.vbt.to_returns()
+        return returns.vbt.returns(freq=self.freq).sharpe_ratio()
+
+    @property
+    def max_drawdown(self) -> float:
+        return (self.equity_curve / self.equity_curve.cummax() - 1).min()
+
+    def summary(self) -> dict:
+        """Aggregate metrics over the stitched out-of-sample equity curve."""
+        return {
+            "total_return": self.total_return,
+            "sharpe_ratio": self.sharpe_ratio,
+            "max_drawdown": self.max_drawdown,
+            "total_trades": int(self.folds["oos_trades"].sum()),
+            "folds": len(self.folds),
+        }
+
+
+def split_windows(
+    n_bars: int,
+    in_sample: int,
+    out_of_sample: int,
+    anchored: bool = False,
+) -> list[Window]:
+    """Split a history into consecutive in-sample/out-of-sample folds.
+
+    Out-of-sample windows tile the history after the first in-sample window
+    without overlap. Rolling windows keep the in-sample length fixed;
+    anchored windows always start at bar 0 and grow.
+
+    Args:
+        n_bars: Length of the history.
+        in_sample: Bars per in-sample window (the first one for anchored).
+        out_of_sample: Bars per out-of-sample window (the last may be shorter).
+        anchored: Grow the in-sample window from the start instead of rolling.
+    """
+    if in_sample <= 0 or out_of_sample <= 0:
+        raise ValueError("in_sample and out_of_sample must be positive.")
+    if in_sample >= n_bars:
+        raise ValueError(f"in_sample ({in_sample}) leaves no out-of-sample data in {n_bars} bars.")
+
+    windows = []
+    oos_start = in_sample
+    while oos_start < n_bars:
+        oos_end = min(oos_start + out_of_sample, n_bars)
+        is_start = 0 if anchored else oos_start - in_sample
+        windows.append(Window(is_start, oos_start, oos_start, oos_end))
+        oos_start = oos_end
+    return windows
+
+
+def _optimize_window(
+    handle: SharedFrameHandle,
+    strategy_cls: type[Strategy],
+    param_grid: dict[str, Sequence[Any]],
+    window: Window,
+    metric: str,
+    engine_kwargs: dict,
+) -> tuple[dict[str, Any], float]:
+    """Worker: grid-search one in-sample window, return best params and score."""
+    data = attach_frame(handle).iloc[window.is_start:window.is_end]
+    table = engine.optimize(strategy_cls, data, param_grid, **engine_kwargs)
+
+    scores = table[metric].replace([np.inf, -np.inf], np.nan)
+    if scores.isna().all():
+        best = table.index[0]
+        score = np.nan
+    else:
+        best = scores.idxmax()
+        score = float(scores[best])
+    return dict(zip(param_grid, best)), score
+
+
+def walk_forward(
+    strategy_cls: type[Strategy],
+    data: pd.DataFrame,
+    param_grid: dict[str, Sequence[Any]],
+    in_sample: int,
+    out_of_sample: int,
+    anchored: bool = False,
+    metric: str = "sharpe_ratio",
+    init_cash: float = 10_000.0,
+    fees: float = 0.001,
+    sl_stop: float = 0.05,
+    max_workers: int | None = None,
+) -> WalkForwardResult:
+    """Walk-forward optimization.
+
+    Every in-sample window is grid-searched with `engine.optimize` in a
+    separate process; the OHLCV data is published once to shared memory
+    instead of being pickled into each task. The best parameters of each
+    fold are then traded on the following out-of-sample window (using the
+    in-sample bars as indicator warm-up) and the out-of-sample equity curves
+    are stitched, carrying the capital from fold to fold (positions still
+    open at the end of a fold are marked to market).
+
+    Args:
+        strategy_cls: Strategy class to optimize.
+        data: OHLCV DataFrame.
+        param_grid: Constructor arguments and candidate values.
+        in_sample: Bars per in-sample window.
+        out_of_sample: Bars per out-of-sample window.
+        anchored: Anchored (expanding) instead of rolling in-sample windows.
+        metric: Summary metric to maximize in-sample.
+        init_cash: Starting cash of the stitched out-of-sample run.
+        fees: Trading fee as a fraction.
+        sl_stop: Stop-loss as a fraction.
+        max_workers: Process pool size (default: number of CPUs).
+
+    Returns:
+        WalkForwardResult with a per-fold table and the stitched equity curve.
+    """
+    windows = split_windows(len(data), in_sample, out_of_sample, anchored)
+    engine_kwargs = {"init_cash": init_cash, "fees": fees, "sl_stop": sl_stop}
+
+    # spawn: forking a process that already runs numba/BLAS threads is unsafe
+    ctx = multiprocessing.get_context("spawn")
+    with SharedFrames() as shared, ProcessPoolExecutor(max_workers=max_workers, mp_context=ctx) as pool:
+        handle = shared.publish(data)
+        futures = [
+            pool.submit(_optimize_window, handle, strategy_cls, param_grid, w, metric, engine_kwargs)
+            for w in windows
+        ]
+        best = [f.result() for f in futures]
+
+    rows, pieces = [], []
+    cash = init_cash
+    for i, (window, (params, score)) in enumerate(zip(windows, best)):
+        oos = engine.run(
+            strategy_cls(**params),
+            data.iloc[window.is_start:window.oos_end],
+            init_cash=cash,
+            fees=fees,
+            sl_stop=sl_stop,
+            warmup=window.oos_start - window.is_start,
+        )
+        equity = oos.equity_curve
+        pieces.append(equity)
+        cash = float(equity.iloc[-1])
+        rows.append({
+            "fold": i,
+            "is_start": data.index[window.is_start],
+            "is_end": data.index[window.is_end - 1],
+            "oos_start": data.index[window.oos_start],
+            "oos_end": data.index[window.oos_end - 1],
+            **params,
+            f"is_{metric}": score,
+            "oos_return": oos.total_return,
+            "oos_sharpe": oos.sharpe_ratio,
+            "oos_max_drawdown": oos.max_drawdown,
+            "oos_trades": oos.total_trades,
+        })
+
+    # Anchor the curve at the starting capital on the last in-sample bar
+    start = pd.Series([init_cash], index=[data.index[windows[0].oos_start - 1]])
+    equity_curve = pd.concat([start, *pieces])
+    return WalkForwardResult(
+        folds=pd.DataFrame(rows).set_index("fold"),
+        equity_curve=equity_curve,
+        freq=engine.infer_freq(data.index),
+    )
@@ -9,10 +9,13 @@ from pathlib import Path
 import pandas as pd
 
 from tradestrats.backtesting import engine
+from tradestrats.backtesting.store import DEFAULT_STORE_PATH, ResultStore
 from tradestrats.config import DATA_DIR, DEFAULT_EXCHANGE, DEFAULT_SYMBOL, DEFAULT_TIMEFRAME, TIMEFRAMES
 from tradestrats.data.fetcher import fetch_ohlcv, is_stock_symbol
+from tradestrats.data.timeframes import load_informative
 from tradestrats.strategies.bollinger_band import BollingerBandStrategy
 from tradestrats.strategies.box_theory import BoxTheory
+from tradestrats.strategies.composite import rsi_bollinger
 from tradestrats.strategies.rsi_mean_reversion import RSIMeanReversion
 from tradestrats.strategies.sma_cross import SMACrossover
 
@@ -21,6 +24,13 @@ STRATEGIES = {
     "sma": lambda: SMACrossover(),
     "box": lambda: BoxTheory(),
     "bb": lambda: BollingerBandStrategy(),
+    "rsi_bb": lambda: rsi_bollinger(),
+}
+
+# Tables of `tradestrats.data.query.connect`, listed by `query` without SQL
+QUERY_TABLES = {
+    "candles": "source, symbol, timeframe, timestamp, open, high, low, close, volume (Parquet-Cache)",
+    "runs": "key, strategy, params, settings, n_bars, start, end, created_at, Metriken (Ergebnis-Store)",
 }
 
 
@@ -62,12 +72,12 @@ def main():
     )
 
     # --- cache ---
-    cache_parser = subparsers.add_parser("cache", help="Gecachte Parquet-Dateien anzeigen")
+    cache_parser = subparsers.add_parser("cache", help="Gecachte Parquet-Dateien anzeigen und pflegen")
     cache_parser.add_argument(
         "file",
         nargs="?",
         default=None,
-        help="Dateiname oder Nummer aus der Liste zum Inspizieren",
+        help="Dateiname oder Nummer aus der Liste zum Inspizieren, oder 'compact' / 'verify'",
     )
     cache_parser.add_argument(
         "-n", "--rows",
@@ -80,6 +90,17 @@ def main():
         action="store_true",
         help="Erste Zeilen statt letzte anzeigen",
     )
+    cache_parser.add_argument(
+        "-j", "--workers",
+        type=int,
+        default=None,
+        help="Anzahl Prozesse fuer compact/verify (default: Anzahl CPUs)",
+    )
+    cache_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="compact: nur anzeigen, was entfernt wuerde",
+    )
 
     # --- dashboard ---
     subparsers.add_parser("dashboard", help="Streamlit-Dashboard starten")
@@ -137,6 +158,123 @@ def main():
         default=None,
         help="Stop-Loss als Dezimalzahl (default: empfohlener Wert der Strategie)",
     )
+    bt_parser.add_argument(
+        "--tp",
+        type=float,
+        default=None,
+        help="Take-Profit als Dezimalzahl (default: keiner)",
+    )
+    bt_parser.add_argument(
+        "--backend",
+        default="vectorbt",
+        choices=["vectorbt", "native"],
+        help="Backtest-Engine: vectorbt oder nativer Simulator mit High/Low-Stops (default: vectorbt)",
+    )
+    bt_parser.add_argument(
+        "--no-store",
+        action="store_true",
+        help="Ergebnis-Store (data/results.sqlite) weder lesen noch beschreiben",
+    )
+
+    # --- batch ---
+    batch_parser = subparsers.add_parser("batch", help="Backtest-Matrix aus einer Job-Spec ausfuehren")
+    batch_parser.add_argument(
+        "spec",
+        help="JSON-Datei mit symbols, strategies, timeframes und ranges",
+    )
+    batch_parser.add_argument(
+        "-o", "--output",
+        default=None,
+        help="Ergebnis-CSV (default: <spec>.results.csv)",
+    )
+    batch_parser.add_argument(
+        "-j", "--workers",
+        type=int,
+        default=None,
+        help="Anzahl Prozesse (default: Anzahl CPUs)",
+    )
+    batch_parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Ergebnisdatei ueberschreiben statt fertige Jobs zu ueberspringen",
+    )
+    batch_parser.add_argument(
+        "--no-store",
+        action="store_true",
+        help="Ergebnis-Store (data/results.sqlite) weder lesen noch beschreiben",
+    )
+
+    # --- worker ---
+    worker_parser = subparsers.add_parser("worker", help="Jobs aus einer gemeinsamen Queue abarbeiten")
+    worker_parser.add_argument(
+        "queue",
+        help="SQLite-Queue auf gemeinsamem Speicher, z.B. /mnt/shared/sweep.sqlite",
+    )
+    worker_parser.add_argument(
+        "--submit",
+        default=None,
+        metavar="SPEC",
+        help="Jobs aus einer JSON-Job-Spec (wie bei batch) in die Queue stellen",
+    )
+    worker_parser.add_argument(
+        "--sweep",
+        default="default",
+        help="Name des Sweeps in der Queue (default: default)",
+    )
+    worker_parser.add_argument(
+        "--lease",
+        type=float,
+        default=300.0,
+        help="Lease pro Job in Sekunden; abgelaufene Jobs werden neu vergeben (default: 300)",
+    )
+    worker_parser.add_argument(
+        "--poll",
+        type=float,
+        default=5.0,
+        help="Wartezeit in Sekunden, wenn gerade kein Job frei ist (default: 5)",
+    )
+    worker_parser.add_argument(
+        "--max-attempts",
+        type=int,
+        default=3,
+        help="Versuche pro Job beim Einstellen mit --submit (default: 3)",
+    )
+    worker_parser.add_argument(
+        "--status",
+        action="store_true",
+        help="Nur den Stand der Queue anzeigen",
+    )
+    worker_parser.add_argument(
+        "--export",
+        default=None,
+        metavar="CSV",
+        help="Ergebnisse des Sweeps als CSV schreiben und beenden",
+    )
+    worker_parser.add_argument(
+        "--no-store",
+        action="store_true",
+        help="Ergebnis-Store (data/results.sqlite) weder lesen noch beschreiben",
+    )
+
+    # --- query ---
+    query_parser = subparsers.add_parser("query", help="SQL ueber Cache und Ergebnis-Store (DuckDB)")
+    query_parser.add_argument(
+        "sql",
+        nargs="?",
+        default=None,
+        help="SQL-Abfrage ueber die Tabellen candles und runs (ohne: Tabellen anzeigen)",
+    )
+    query_parser.add_argument(
+        "-n", "--rows",
+        type=int,
+        default=50,
+        help="Maximal angezeigte Zeilen (default: 50)",
+    )
+    query_parser.add_argument(
+        "-o", "--output",
+        default=None,
+        help="Ergebnis zusaetzlich als CSV speichern",
+    )
 
     args = parser.parse_args()
 
@@ -150,6 +288,12 @@ def main():
         _cmd_cache(args)
     elif args.command == "backtest":
         _cmd_backtest(args)
+    elif args.command == "batch":
+        _cmd_batch(args)
+    elif args.command == "worker":
+        _cmd_worker(args)
+    elif args.command == "query":
+        _cmd_query(args)
     elif args.command == "dashboard":
         _cmd_dashboard()
 
@@ -202,6 +346,10 @@ def _cmd_cache(args):
         print("Keine gecachten Dateien gefunden.")
         return
 
+    if args.file in ("compact", "verify"):
+        _cmd_cache_maintenance(args, parquet_files)
+        return
+
     # List all cached files
     if args.file is None:
         print("Gecachte Dateien:\n")
@@ -252,6 +400,43 @@ def _cmd_cache(args):
         print(df.tail(n).to_string())
 
 
+def _cmd_cache_maintenance(args, parquet_files):
+    from tradestrats.data import maintenance
+
+    if args.file == "verify":
+        report = maintenance.verify_cache(parquet_files, max_workers=args.workers)
+        for row in report.itertuples():
+            if row.error:
+                print(f"  FEHLER {row.file}: {row.error}")
+            elif not row.ok:
+                found = ", ".join(f"{issue}={getattr(row, issue)}" for issue in maintenance.ISSUES if getattr(row, issue))
+                print(f"  WARN   {row.file}: {found}")
+        n_bad = int((~report["ok"]).sum())
+        print(f"\n{len(report)} Dateien geprueft | {len(report) - n_bad} ok | {n_bad} mit Problemen")
+        if n_bad:
+            print("Reparieren (Sortierung, Duplikate, offene Candles): tradestrats cache compact")
+        return
+
+    report = maintenance.compact_cache(parquet_files, max_workers=args.workers, dry_run=args.dry_run)
+    for row in report.itertuples():
+        print(
+            f"  {row.file}: {row.rows_before} -> {row.rows_after} Zeilen "
+            f"({row.duplicates} Duplikate, {row.partial_dropped} offene Candles) | "
+            f"Row-Groups {row.row_groups_before} -> {row.row_groups_after if not args.dry_run else '-'}"
+        )
+    print()
+    if args.dry_run:
+        print(f"Dry-Run: {int(report['rows_before'].sum() - report['rows_after'].sum())} Zeilen wuerden entfernt.")
+        return
+    before, after = report["bytes_before"].sum(), report["bytes_after"].sum()
+    read_before, read_after = report["read_s_before"].sum(), report["read_s_after"].sum()
+    print(f"Groesse:  {before / 1024:,.1f} KB -> {after / 1024:,.1f} KB ({(before - after) / 1024:,.1f} KB frei)")
+    print(
+        f"Lesezeit: {read_before * 1000:,.1f} ms -> {read_after * 1000:,.1f} ms "
+        f"({read_before / read_after:.2f}x)"
+    )
+
+
 def _cmd_backtest(args):
     strategy = STRATEGIES[args.strategy]()
 
@@ -284,8 +469,15 @@ def _cmd_backtest(args):
     )
     print(f"{len(data)} Candles geladen\n")
 
+    informative = load_informative(
+        args.symbol, strategy.informative_timeframes, start=start, end=end, exchange_id=args.exchange,
+    )
+
     print("Starte Backtest...")
-    result = engine.run(strategy, data, init_cash=args.cash, fees=args.fees, sl_stop=sl_stop)
+    result = engine.run(
+        strategy, data, init_cash=args.cash, fees=args.fees, sl_stop=sl_stop, informative=informative,
+        tp_stop=args.tp, backend=args.backend, store=None if args.no_store else ResultStore(),
+    )
     print()
 
     # Summary
@@ -302,6 +494,104 @@ def _cmd_backtest(args):
     print("=" * 40)
 
 
+def _cmd_batch(args):
+    from tradestrats.backtesting import batch
+
+    spec = batch.load_spec(args.spec)
+    output = Path(args.output) if args.output else Path(args.spec).with_suffix(".results.csv")
+    jobs = batch.expand_jobs(spec)
+    if args.fresh:
+        pending = len(jobs)
+    else:
+        done_keys = batch.finished_keys(output)
+        pending = sum(job.key not in done_keys for job in jobs)
+    print(f"{len(jobs)} Jobs, davon {pending} offen | Ergebnisse: {output}\n")
+
+    results = batch.run_batch(
+        spec,
+        output,
+        max_workers=args.workers,
+        restart=not args.fresh,
+        store_path=None if args.no_store else DEFAULT_STORE_PATH,
+        progress=lambda done, total, row: print(batch.format_progress(done, total, row), flush=True),
+    )
+
+    failed = results["error"].notna().sum()
+    print(f"\nFertig: {len(results) - failed} erfolgreich, {failed} fehlgeschlagen")
+    if len(results) > failed:
+        best = results[results["error"].isna()].sort_values("sharpe_ratio", ascending=False).head(5)
+        print("\nTop 5 nach Sharpe Ratio:")
+        print(best[["symbol", "timeframe", "strategy", "start", "end", "total_return", "sharpe_ratio"]].to_string(index=False))
+
+
+def _cmd_worker(args):
+    from tradestrats.backtesting import batch
+    from tradestrats.backtesting.queue import JobQueue, run_worker, worker_id
+
+    queue = JobQueue(args.queue)
+    if args.submit:
+        jobs = batch.expand_jobs(batch.load_spec(args.submit))
+        added = queue.submit(jobs, sweep=args.sweep, max_attempts=args.max_attempts)
+        print(f"{added} von {len(jobs)} Jobs in Sweep '{args.sweep}' eingestellt")
+
+    if args.export:
+        results = queue.results(args.sweep)
+        results.to_csv(args.export, index=False)
+        print(f"{len(results)} Ergebnisse nach {args.export} geschrieben")
+        return
+
+    counts = queue.counts(args.sweep)
+    print(" | ".join(f"{state}: {n}" for state, n in counts.items()))
+    if args.status:
+        return
+
+    owner = worker_id()
+    print(f"Worker {owner} startet (Sweep '{args.sweep}', Lease {args.lease:.0f}s)\n")
+    processed = run_worker(
+        queue,
+        sweep=args.sweep,
+        owner=owner,
+        lease=args.lease,
+        poll=args.poll,
+        store_path=None if args.no_store else DEFAULT_STORE_PATH,
+        progress=lambda claimed, row: print(
+            batch.format_progress(claimed.id, sum(queue.counts(args.sweep).values()), row), flush=True,
+        ),
+    )
+    counts = queue.counts(args.sweep)
+    print(f"\nFertig: {processed} Jobs bearbeitet | " + " | ".join(f"{state}: {n}" for state, n in counts.items()))
+
+
+def _cmd_query(args):
+    from tradestrats.data import query
+
+    if args.sql is None:
+        print("Tabellen:\n")
+        for name, columns in QUERY_TABLES.items():
+            print(f"  {name:<8} {columns}")
+        print()
+        print('Beispiel: tradestrats query "SELECT symbol, count(*) FROM candles GROUP BY symbol"')
+        return
+
+    try:
+        result = query.query(args.sql)
+    except ImportError as exc:
+        print(exc)
+        sys.exit(1)
+    except Exception as exc:  # duckdb.Error is only importable with the extra
+        print(f"Abfrage fehlgeschlagen: {exc}")
+        sys.exit(1)
+
+    if len(result) > args.rows:
+        print(result.head(args.rows).to_string())
+        print(f"\n... {len(result) - args.rows} weitere Zeilen ({len(result)} gesamt)")
+    else:
+        print(result.to_string())
+    if args.output:
+        result.to_csv(args.output, index=False)
+        print(f"\nGespeichert: {args.output}")
+
+
 def _cmd_dashboard():
     dashboard_path = Path(__file__).resolve().parent / "dashboard.py"
     sys.exit(subprocess.run(["streamlit", "run", str(dashboard_path)]).returncode)
@@ -7,8 +7,12 @@ import pandas as pd
 import streamlit as st
 
 from tradestrats.backtesting import engine
+from tradestrats.backtesting.store import ResultStore
 from tradestrats.config import DEFAULT_EXCHANGE, DEFAULT_SYMBOL, TIMEFRAMES
 from tradestrats.data.fetcher import fetch_ohlcv, is_stock_symbol
+from tradestrats.data.timeframes import load_informative, merge_informative
+from tradestrats.indicators.catalog import get_catalog
+from tradestrats.indicators.registry import get_indicator
 from tradestrats.strategies.base import Strategy
 from tradestrats.strategies.bollinger_band import BollingerBandStrategy
 from tradestrats.strategies.box_theory import BoxTheory
@@ -62,6 +66,9 @@ def _render_sidebar() -> dict:
     elif strategy_key == "box":
         params["zone_pct"] = st.sidebar.number_input("Zone %", 0.05, 0.50, 0.25, step=0.05, format="%.2f")
 
+    st.sidebar.header("Indicators")
+    params["overlays"] = st.sidebar.multiselect("Overlays", _overlay_indicators())
+
     # Read recommended defaults from the selected strategy class
     strat_cls = _STRATEGY_CLASSES[strategy_key]
     rec_tf = strat_cls.recommended_timeframe
@@ -122,6 +129,31 @@ def _build_strategy(params: dict) -> Strategy:
     )
 
 
+def _overlay_indicators() -> list[str]:
+    """Price-scale indicators from the catalog that can be drawn on the candlestick."""
+    return [
+        name for name, info in get_catalog().items()
+        if info.category == "overlap" and info.dispatchable
+    ]
+
+
+def _get_overlays(names: list[str], data: pd.DataFrame) -> dict:
+    """Compute user-selected overlay indicators with their default parameters."""
+    overlays: dict = {}
+    for name in names:
+        try:
+            values = get_indicator(name, data)
+        except ValueError:
+            continue
+        if isinstance(values, tuple):  # e.g. ichimoku returns (current, forward)
+            values = values[0]
+        if isinstance(values, pd.Series):
+            overlays[values.name or name.upper()] = values
+        elif isinstance(values, pd.DataFrame):
+            overlays.update({col: values[col] for col in values.columns})
+    return overlays
+
+
 def _get_indicators(strategy_key: str, signals) -> dict | None:
     """Return indicator columns for candlestick overlay."""
     if strategy_key == "sma":
@@ -167,7 +199,9 @@ def _display_results(result, params: dict) -> None:
     data = signals[["open", "high", "low", "close", "volume"]]
 
     with tabs[0]:
-        indicators = _get_indicators(params["strategy_key"], signals)
+        indicators = _get_indicators(params["strategy_key"], signals) or {}
+        indicators.update(_get_overlays(params.get("overlays", []), data))
+        indicators = indicators or None
         fig = plot_candlestick(data, indicators=indicators, title=f"{params['symbol']} — Price & Indicators")
         st.plotly_chart(fig, use_container_width=True)
 
@@ -218,12 +252,24 @@ def main() -> None:
                     exchange_id=params["exchange"],
                 )
                 strategy = _build_strategy(params)
+                informative = load_informative(
+                    params["symbol"], strategy.informative_timeframes,
+                    start=str(params["start"]), end=str(params["end"]),
+                    exchange_id=params["exchange"],
+                )
                 result = engine.run(
                     strategy, data,
                     init_cash=params["cash"],
                     fees=params["fees"],
                     sl_stop=params["stop_loss"],
+                    informative=informative,
+                    store=ResultStore(),
                 )
+                if result.signals is None:
+                    # Served from the result store: only the chart data is missing
+                    if strategy.informative_timeframes:
+                        data = merge_informative(data, strategy.informative_timeframes, informative)
+                    result.signals = strategy.generate_signals(data)
             st.session_state["result"] = result
             st.session_state["params"] = params
         except Exception as exc:
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+from tradestrats.config import DATA_DIR
+
+# Rows per Parquet row group of a compacted cache: a few MB of OHLCV, large
+# enough for fast sequential scans, small enough for row-group pruning
+DEFAULT_ROW_GROUP_SIZE = 131_072
+
+ISSUES = ("unsorted", "duplicates", "nan_prices", "non_positive", "ohlc_violations", "negative_volume", "partial_last")
+
+
+def cache_files(data_dir: str | Path = DATA_DIR) -> list[Path]:
+    """OHLCV cache files (``<exchange>_<symbol>_<timeframe>.parquet``) in `data_dir`."""
+    return sorted(Path(data_dir).glob("*.parquet"))
+
+
+def _bar_length(path: Path) -> pd.Timedelta | None:
+    """Candle length from the timeframe suffix of a cache file name, if fixed."""
+    timeframe = path.stem.rsplit("_", 1)[-1]
+    try:
+        return pd.Timedelta(timeframe)
+    except ValueError:  # calendar timeframes (e.g. months) have no fixed length
+        return None
+
+
+def _fetched_at(path: Path) -> pd.Timestamp:
+    """Modification time of a cache file, i.e. when it was last fetched (UTC)."""
+    return pd.Timestamp(path.stat().st_mtime, unit="s", tz="UTC")
+
+
+def _is_partial_last(index: pd.DatetimeIndex, bar: pd.Timedelta | None, now: pd.Timestamp) -> bool:
+    """True if the newest candle was still forming when it was fetched."""
+    if bar is None or len(index) == 0:
+        return False
+    if index.tz is None:
+        now = now.tz_convert("UTC").tz_localize(None)
+    return index.max() + bar > now
+
+
+def check_frame(df: pd.DataFrame, bar: pd.Timedelta | None = None, now: pd.Timestamp | None = None) -> dict[str, int]:
+    """Count integrity problems of an OHLCV frame with vectorized checks.
+
+    Args:
+        df: OHLCV frame with a DatetimeIndex.
+        bar: Candle length; enables the partial-last-candle check.
+        now: Reference time for that check (default: now, UTC).
+
+    Returns:
+        Count per issue (``ISSUES``): out-of-order timestamps, duplicate
+        timestamps, rows with NaN or non-positive prices, rows breaking
+        ``low <= open, close <= high``, negative volumes and a still
+        forming last candle.
+    """
+    ts = df.index.asi8
+    o, h, l, c = (df[col].to_numpy(dtype=np.float64) for col in ("open", "high", "low", "close"))
+    prices = np.column_stack([o, h, l, c])
+    finite = np.isfinite(prices).all(axis=1)
+    with np.errstate(invalid="ignore"):
+        violations = (h < np.maximum(o, c)) | (l > np.minimum(o, c)) | (l > h)
+        negative_volume = df["volume"].to_numpy(dtype=np.float64) < 0 if "volume" in df else np.zeros(0, bool)
+        non_positive = (prices <= 0).any(axis=1)
+    now = now if now is not None else pd.Timestamp.now(tz="UTC")
+    return {
+        "unsorted": int(np.count_nonzero(ts[1:] < ts[:-1])),
+        "duplicates": int(df.index.duplicated().sum()),
+        "nan_prices": int(np.count_nonzero(~finite)),
+        "non_positive": int(np.count_nonzero(non_positive)),
+        "ohlc_violations": int(np.count_nonzero(violations & finite)),
+        "negative_volume": int(np.count_nonzero(negative_volume)),
+        "partial_last": int(_is_partial_last(df.index, bar, now)),
+    }
+
+
+def compact_frame(df: pd.DataFrame, bar: pd.Timedelta | None = None, now: pd.Timestamp | None = None) -> pd.DataFrame:
+    """Sorted, de-duplicated copy without a still forming last candle.
+
+    Duplicates keep the last row, as the fetcher's merge does. Rows with
+    broken OHLC values are kept; `check_frame` reports them.
+    """
+    df = df[~df.index.duplicated(keep="last")].sort_index()
+    if _is_partial_last(df.index, bar, now if now is not None else pd.Timestamp.now(tz="UTC")):
+        df = df.iloc[:-1]
+    return df
+
+
+def _read_seconds(path: Path, repeat: int = 3) -> float:
+    """Best-of-`repeat` wall time of reading the file into pandas."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        pd.read_parquet(path)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def verify_file(path: str | Path, now: pd.Timestamp | None = None) -> dict:
+    """Integrity report of one cache file: layout plus `check_frame` counts.
+
+    The partial-candle check compares against `now` (default: the file's
+    modification time, when its newest candle was fetched).
+    """
+    path = Path(path)
+    report = {"file": path.name, "bytes": path.stat().st_size}
+    try:
+        report["row_groups"] = pq.ParquetFile(path).metadata.num_row_groups
+        df = pd.read_parquet(path)
+    except Exception as exc:  # unreadable or truncated file
+        return {**report, "rows": 0, "ok": False, "error": str(exc)}
+    issues = check_frame(df, _bar_length(path), now if now is not None else _fetched_at(path))
+    return {**report, "rows": len(df), **issues, "ok": not any(issues.values()), "error": None}
+
+
+def compact_file(
+    path: str | Path,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    now: pd.Timestamp | None = None,
+    dry_run: bool = False,
+) -> dict:
+    """Rewrite one cache file sorted, de-duplicated and in large row groups.
+
+    The new file is written next to the old one and swapped in with an
+    atomic rename, so a crash never leaves a half-written cache. A last
+    candle that was still forming at `now` (default: the file's
+    modification time, when it was fetched) is dropped.
+
+    Returns:
+        Report with rows and bytes before/after, the dropped duplicates and
+        partial candles, row groups before/after and the best-of-three read
+        time before/after (NaN after with `dry_run`, which writes nothing).
+    """
+    path = Path(path)
+    fetched_at = now if now is not None else _fetched_at(path)
+    df = pd.read_parquet(path)
+    compacted = compact_frame(df, _bar_length(path), fetched_at)
+    duplicates = int(df.index.duplicated().sum())
+    report = {
+        "file": path.name,
+        "rows_before": len(df),
+        "rows_after": len(compacted),
+        "duplicates": duplicates,
+        "partial_dropped": len(df) - duplicates - len(compacted),
+        "row_groups_before": pq.ParquetFile(path).metadata.num_row_groups,
+        "bytes_before": path.stat().st_size,
+        "read_s_before": _read_seconds(path),
+    }
+    if dry_run:
+        return {**report, "row_groups_after": np.nan, "bytes_after": np.nan, "read_s_after": np.nan}
+
+    tmp = path.with_name(path.name + ".tmp")
+    compacted.to_parquet(tmp, row_group_size=row_group_size)
+    os.replace(tmp, path)
+    return {
+        **report,
+        "row_groups_after": pq.ParquetFile(path).metadata.num_row_groups,
+        "bytes_after": path.stat().st_size,
+        "read_s_after": _read_seconds(path),
+    }
+
+
+def _run_parallel(func, paths: list[Path], max_workers: int | None, **kwargs) -> pd.DataFrame:
+    n_workers = min(max_workers or multiprocessing.cpu_count(), len(paths))
+    if n_workers <= 1:
+        rows = [func(path, **kwargs) for path in paths]
+    else:
+        # spawn: forking a process that already runs numba/BLAS threads is unsafe
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=n_workers, mp_context=ctx) as pool:
+            futures = [pool.submit(func, path, **kwargs) for path in paths]
+            rows = [future.result() for future in futures]
+    return pd.DataFrame(rows)
+
+
+def verify_cache(
+    paths: list[str | Path] | None = None,
+    max_workers: int | None = None,
+    now: pd.Timestamp | None = None,
+) -> pd.DataFrame:
+    """`verify_file` for many cache files on a process pool.
+
+    Args:
+        paths: Files to check (default: all of `cache_files`).
+        max_workers: Process pool size (default: number of CPUs).
+        now: Reference time of the partial-candle check (default: each
+            file's modification time).
+
+    Returns:
+        One report row per file.
+    """
+    paths = [Path(p) for p in paths] if paths is not None else cache_files()
+    if not paths:
+        return pd.DataFrame()
+    return _run_parallel(verify_file, paths, max_workers, now=now)
+
+
+def compact_cache(
+    paths: list[str | Path] | None = None,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    max_workers: int | None = None,
+    now: pd.Timestamp | None = None,
+    dry_run: bool = False,
+) -> pd.DataFrame:
+    """`compact_file` for many cache files on a process pool.
+
+    Args:
+        paths: Files to compact (default: all of `cache_files`).
+        row_group_size: Rows per row group of the rewritten files.
+        max_workers: Process pool size (default: number of CPUs).
+        now: Reference time of the partial-candle check (default: each
+            file's modification time).
+        dry_run: Only report what would be dropped.
+
+    Returns:
+        One report row per file.
+    """
+    paths = [Path(p) for p in paths] if paths is not None else cache_files()
+    if not paths:
+        return pd.DataFrame()
+    return _run_parallel(compact_file, paths, max_workers, row_group_size=row_group_size, now=now, dry_run=dry_run)
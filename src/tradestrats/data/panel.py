@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+import pandas as pd
+
+from tradestrats.config import DATA_DIR, DEFAULT_EXCHANGE, DEFAULT_TIMEFRAME
+from tradestrats.data.fetcher import _cache_path, fetch_ohlcv
+
+# Column levels of a multi-symbol panel: panel["close"] is a (time x symbol) frame
+PANEL_FIELDS = ["open", "high", "low", "close", "volume"]
+PANEL_LEVELS = ["field", "symbol"]
+
+
+def is_panel(data: pd.DataFrame) -> bool:
+    """Return True if the frame is a multi-symbol panel (field, symbol) columns."""
+    return isinstance(data.columns, pd.MultiIndex) and data.columns.nlevels == 2
+
+
+def build_panel(frames: dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """Combine per-symbol OHLCV frames into one wide panel.
+
+    The result is indexed by the union of all timestamps; symbols without a
+    candle at a timestamp (shorter or gappy histories) hold NaN there.
+
+    Args:
+        frames: Mapping of symbol to OHLCV DataFrame.
+
+    Returns:
+        DataFrame with MultiIndex columns (field, symbol).
+    """
+    if not frames:
+        raise ValueError("build_panel needs at least one symbol frame.")
+
+    panel = pd.concat(
+        {symbol: df[[c for c in PANEL_FIELDS if c in df.columns]] for symbol, df in frames.items()},
+        axis=1,
+    )
+    panel = panel.swaplevel(axis=1)
+    panel.columns.names = PANEL_LEVELS
+
+    fields = [f for f in PANEL_FIELDS if f in panel.columns.get_level_values(0)]
+    panel = panel.reindex(columns=pd.MultiIndex.from_product([fields, list(frames)], names=PANEL_LEVELS))
+    return panel.sort_index()
+
+
+def panel_symbols(panel: pd.DataFrame) -> list[str]:
+    """Symbols contained in a panel, in column order."""
+    return list(panel.columns.get_level_values("symbol").unique())
+
+
+def symbol_frame(panel: pd.DataFrame, symbol: str) -> pd.DataFrame:
+    """Extract one symbol's OHLCV frame, dropping timestamps it has no data for."""
+    df = panel.xs(symbol, axis=1, level="symbol")
+    df.columns.name = None
+    return df.dropna(how="all")
+
+
+def load_panel(
+    symbols: list[str],
+    timeframe: str = DEFAULT_TIMEFRAME,
+    start: str | datetime | None = None,
+    end: str | datetime | None = None,
+    exchange_id: str = DEFAULT_EXCHANGE,
+) -> pd.DataFrame:
+    """Fetch (or read from cache) several symbols and combine them into a panel."""
+    frames = {
+        symbol: fetch_ohlcv(symbol, timeframe=timeframe, start=start, end=end, exchange_id=exchange_id)
+        for symbol in symbols
+    }
+    return build_panel({s: df for s, df in frames.items() if not df.empty})
+
+
+def cached_symbols(timeframe: str = DEFAULT_TIMEFRAME, exchange_id: str = DEFAULT_EXCHANGE) -> list[str]:
+    """Crypto symbols with a Parquet cache file for `timeframe` on `exchange_id`."""
+    prefix, suffix = f"{exchange_id}_", f"_{timeframe}.parquet"
+    symbols = []
+    for path in sorted(DATA_DIR.glob(f"{prefix}*{suffix}")):
+        symbol = path.name[len(prefix):-len(suffix)].replace("_", "/", 1)
+        if _cache_path(symbol, timeframe, exchange_id) == path:
+            symbols.append(symbol)
+    return symbols
+
+
+def load_cached_panel(
+    symbols: list[str] | None = None,
+    timeframe: str = DEFAULT_TIMEFRAME,
+    start: str | datetime | None = None,
+    end: str | datetime | None = None,
+    exchange_id: str = DEFAULT_EXCHANGE,
+) -> pd.DataFrame:
+    """Build a panel from the Parquet cache only, without fetching.
+
+    Args:
+        symbols: Symbols to load (default: every cached symbol, see
+            `cached_symbols`). Symbols without a cache file are skipped.
+        timeframe: Candle timeframe.
+        start: Drop candles before this time.
+        end: Drop candles after this time.
+        exchange_id: Exchange of the cache files.
+    """
+    start_ts = pd.Timestamp(start, tz="UTC") if start is not None else None
+    end_ts = pd.Timestamp(end, tz="UTC") if end is not None else None
+    frames = {}
+    for symbol in symbols if symbols is not None else cached_symbols(timeframe, exchange_id):
+        path = _cache_path(symbol, timeframe, exchange_id)
+        if not path.exists():
+            continue
+        df = pd.read_parquet(path)
+        if start_ts is not None:
+            df = df[df.index >= start_ts]
+        if end_ts is not None:
+            df = df[df.index <= end_ts]
+        if not df.empty:
+            frames[symbol] = df
+    if not frames:
+        raise ValueError(f"No cached {timeframe} data on {exchange_id} for the requested symbols.")
+    return build_panel(frames)
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+
+import pandas as pd
+
+from tradestrats.backtesting.store import METRIC_COLUMNS
+from tradestrats.config import DATA_DIR
+
+# SQL over the Parquet cache and the result store with DuckDB (optional
+# extra: ``pip install 'tradestrats[query]'``). Candles are scanned straight
+# from the Parquet files, so filters and aggregates over the whole universe
+# never load it into pandas.
+
+# Cache file names are <exchange>_<symbol>_<timeframe>.parquet, see
+# `fetcher._cache_path`: crypto symbols have their "/" replaced by "_",
+# index tickers their "^" by "IDX_"
+_CANDLES_VIEW = """
+CREATE OR REPLACE VIEW candles AS
+SELECT
+    source,
+    CASE WHEN source = 'yfinance' THEN regexp_replace(raw_symbol, '^IDX_', '^')
+         ELSE regexp_replace(raw_symbol, '_', '/') END AS symbol,
+    timeframe,
+    "timestamp", open, high, low, close, volume
+FROM (
+    SELECT
+        *,
+        regexp_extract(stem, '^([^_]+)_', 1) AS source,
+        regexp_extract(stem, '^[^_]+_(.+)_[^_]+$', 1) AS raw_symbol,
+        regexp_extract(stem, '_([^_]+)$', 1) AS timeframe
+    FROM (
+        SELECT *, regexp_extract(filename, '([^/\\\\]+)\\.parquet$', 1) AS stem
+        FROM read_parquet({files}, filename = true, union_by_name = true)
+    )
+)
+"""
+
+_EMPTY_CANDLES = """
+CREATE OR REPLACE VIEW candles AS
+SELECT
+    NULL::VARCHAR AS source, NULL::VARCHAR AS symbol, NULL::VARCHAR AS timeframe,
+    NULL::TIMESTAMPTZ AS "timestamp", NULL::DOUBLE AS open, NULL::DOUBLE AS high,
+    NULL::DOUBLE AS low, NULL::DOUBLE AS close, NULL::DOUBLE AS volume
+WHERE false
+"""
+
+_RUN_COLUMNS = (
+    "key", "strategy", "params", "settings", "n_bars", "start", "end", "created_at", *METRIC_COLUMNS,
+)
+
+
+def _import_duckdb():
+    try:
+        import duckdb
+    except ImportError as exc:
+        raise ImportError(
+            "The query layer needs DuckDB: pip install 'tradestrats[query]' (or uv sync --extra query)."
+        ) from exc
+    return duckdb
+
+
+def connect(data_dir: str | Path | None = None, store_path: str | Path | None = None):
+    """In-memory DuckDB connection with the cache and result store as tables.
+
+    Tables:
+        candles: Every cached OHLCV Parquet file in `data_dir`, one row per
+            candle, with ``source`` (exchange or ``yfinance``), ``symbol``
+            and ``timeframe`` parsed from the file name. It is a view over
+            ``read_parquet``, so queries scan the files out of core and only
+            read the columns and row groups they need.
+        runs: The metadata and metrics of the result store (without the
+            equity and trade blobs). ``params`` is the strategy repr,
+            ``settings`` JSON text, e.g. ``settings->>'fees'``. The store is
+            attached read-only with DuckDB's sqlite extension, so rows are
+            scanned in place; where the extension cannot be loaded (it is
+            downloaded on first use), the rows are read into pandas instead.
+
+    Args:
+        data_dir: Directory of the Parquet cache (default: `DATA_DIR`).
+        store_path: Result store (default: ``data_dir / "results.sqlite"``).
+            The ``runs`` table is empty if it does not exist.
+
+    Returns:
+        A ``duckdb.DuckDBPyConnection``; close it when done.
+    """
+    duckdb = _import_duckdb()
+    data_dir = Path(data_dir) if data_dir is not None else DATA_DIR
+    store_path = Path(store_path) if store_path is not None else data_dir / "results.sqlite"
+
+    con = duckdb.connect()
+    if any(data_dir.glob("*.parquet")):
+        files = str(data_dir / "*.parquet").replace("'", "''")
+        con.execute(_CANDLES_VIEW.format(files=f"'{files}'"))
+    else:
+        con.execute(_EMPTY_CANDLES)
+
+    columns = ", ".join(f'"{column}"' for column in _RUN_COLUMNS)
+    if store_path.exists():
+        try:
+            path = str(store_path).replace("'", "''")
+            con.execute(f"ATTACH '{path}' AS store (TYPE sqlite, READ_ONLY)")
+            con.execute(f"CREATE OR REPLACE VIEW runs AS SELECT {columns} FROM store.runs")
+            return con
+        except duckdb.Error:  # sqlite extension not installed and not downloadable
+            pass
+    con.register("_runs", _store_runs(store_path))
+    con.execute(f"CREATE OR REPLACE VIEW runs AS SELECT {columns} FROM _runs")
+    return con
+
+
+def _store_runs(store_path: Path) -> pd.DataFrame:
+    """Result-store rows without the blob columns, read through pandas."""
+    if not store_path.exists():
+        return pd.DataFrame({column: pd.Series(dtype=object) for column in _RUN_COLUMNS})
+    with closing(sqlite3.connect(store_path)) as con:
+        columns = ", ".join(f'"{column}"' for column in _RUN_COLUMNS)
+        return pd.read_sql_query(f"SELECT {columns} FROM runs", con)
+
+
+def query(sql: str, data_dir: str | Path | None = None, store_path: str | Path | None = None) -> pd.DataFrame:
+    """Run one SQL query over the ``candles`` and ``runs`` tables, see `connect`.
+
+    Example:
+        Symbols whose daily range exceeded 5% on some day last month::
+
+            query('''
+                SELECT symbol, count(*) AS days
+                FROM candles
+                WHERE timeframe = '1d' AND "timestamp" >= now() - INTERVAL 1 MONTH
+                  AND (high - low) / low > 0.05
+                GROUP BY symbol ORDER BY days DESC
+            ''')
+
+    Returns:
+        The result as a DataFrame (only the result is materialized).
+    """
+    con = connect(data_dir, store_path)
+    try:
+        return con.execute(sql).df()
+    finally:
+        con.close()
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import atexit
+import signal
+import threading
+from dataclasses import dataclass
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+import pandas as pd
+
+# Shared blocks attached in this process, kept alive while views are in use
+_ATTACHED: dict[str, shared_memory.SharedMemory] = {}
+
+# Shared blocks published (created) by this process and not yet released
+_OWNED: dict[str, shared_memory.SharedMemory] = {}
+_OWNED_LOCK = threading.Lock()
+_HOOKS_INSTALLED = False
+
+
+@dataclass(frozen=True)
+class SharedFrameHandle:
+    """Picklable description of an OHLCV frame published to shared memory.
+
+    The block holds the index as int64 nanoseconds followed by the values as a
+    C-contiguous float64 (rows x columns) matrix.
+    """
+
+    name: str
+    n_rows: int
+    columns: tuple[str, ...]
+    tz: str | None = None
+
+
+def share_frame(df: pd.DataFrame) -> tuple[shared_memory.SharedMemory, SharedFrameHandle]:
+    """Copy a DataFrame into a new shared memory block.
+
+    The caller owns the returned block and must free it with `release` (or
+    use `SharedFrames`) once all workers are done. Blocks that are still
+    published when the interpreter exits, including on SIGTERM, are
+    released automatically.
+    """
+    n_rows, n_cols = len(df), len(df.columns)
+    size = max(1, n_rows * 8 * (n_cols + 1))
+    _install_cleanup_hooks()
+    shm = shared_memory.SharedMemory(create=True, size=size)
+    with _OWNED_LOCK:
+        _OWNED[shm.name] = shm
+
+    index = np.ndarray((n_rows,), dtype=np.int64, buffer=shm.buf)
+    index[:] = df.index.asi8
+    values = np.ndarray((n_rows, n_cols), dtype=np.float64, buffer=shm.buf, offset=n_rows * 8)
+    values[:] = df.to_numpy(dtype=np.float64)
+
+    tz = str(df.index.tz) if getattr(df.index, "tz", None) is not None else None
+    return shm, SharedFrameHandle(name=shm.name, n_rows=n_rows, columns=tuple(df.columns), tz=tz)
+
+
+def release(shm: shared_memory.SharedMemory) -> None:
+    """Close and unlink a block created by `share_frame`; safe to call twice."""
+    with _OWNED_LOCK:
+        _OWNED.pop(shm.name, None)
+    shm.close()
+    try:
+        shm.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def attach_frame(handle: SharedFrameHandle) -> pd.DataFrame:
+    """Rebuild the DataFrame in a worker as a zero-copy view on shared memory."""
+    shm = _OWNED.get(handle.name) or _ATTACHED.get(handle.name)
+    if shm is None:
+        shm = _open_block(handle.name)
+        _ATTACHED[handle.name] = shm
+
+    n_rows, n_cols = handle.n_rows, len(handle.columns)
+    index = np.ndarray((n_rows,), dtype=np.int64, buffer=shm.buf)
+    values = np.ndarray((n_rows, n_cols), dtype=np.float64, buffer=shm.buf, offset=n_rows * 8)
+    values.flags.writeable = False
+
+    dt_index = pd.DatetimeIndex(index.view("M8[ns]"))
+    if handle.tz is not None:
+        dt_index = dt_index.tz_localize("UTC").tz_convert(handle.tz)
+    return pd.DataFrame(values, index=dt_index, columns=list(handle.columns), copy=False)
+
+
+def _open_block(name: str) -> shared_memory.SharedMemory:
+    """Attach to a block without taking ownership of it."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python >= 3.13
+    except TypeError:
+        pass
+    # Pool workers share the publisher's resource tracker, which keeps one
+    # entry per block: attaching re-adds it (a no-op) and unregistering would
+    # drop the publisher's entry. A process with its own tracker must
+    # unregister, or its tracker would unlink the block when it exits.
+    inherited = getattr(resource_tracker._resource_tracker, "_fd", None) is not None
+    shm = shared_memory.SharedMemory(name=name)
+    if not inherited:
+        resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+def resolve_frame(frame: pd.DataFrame | SharedFrameHandle) -> pd.DataFrame:
+    """The frame itself, or its shared memory view if it is a handle."""
+    return attach_frame(frame) if isinstance(frame, SharedFrameHandle) else frame
+
+
+class SharedFrames:
+    """Owner of a set of shared frames for the lifetime of a process pool.
+
+    Publish the inputs of a parallel run once and hand the (small, picklable)
+    handles to the workers, which attach to them zero-copy with
+    `attach_frame`/`resolve_frame`. All blocks are released when the `with`
+    block exits, also on errors::
+
+        with SharedFrames() as shared:
+            handle = shared.publish(data)
+            pool.submit(worker, handle, ...)
+    """
+
+    def __init__(self) -> None:
+        self._blocks: list[shared_memory.SharedMemory] = []
+
+    def publish(self, df: pd.DataFrame) -> SharedFrameHandle:
+        """Copy `df` into shared memory and return its handle."""
+        shm, handle = share_frame(df)
+        self._blocks.append(shm)
+        return handle
+
+    def publish_all(self, frames: dict[str, pd.DataFrame] | None) -> dict[str, SharedFrameHandle] | None:
+        """Publish every frame of a mapping, e.g. the informative candles."""
+        if frames is None:
+            return None
+        return {key: self.publish(df) for key, df in frames.items()}
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes currently held in shared memory."""
+        return sum(shm.size for shm in self._blocks)
+
+    def close(self) -> None:
+        """Release all published blocks."""
+        while self._blocks:
+            release(self._blocks.pop())
+
+    def __enter__(self) -> SharedFrames:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _release_owned() -> None:
+    """Release blocks that are still published, e.g. after an unhandled error."""
+    with _OWNED_LOCK:
+        blocks = list(_OWNED.values())
+    for shm in blocks:
+        release(shm)
+
+
+def _terminate(signum, frame) -> None:
+    # Turn SIGTERM into SystemExit so `with` blocks and atexit run
+    raise SystemExit(128 + signum)
+
+
+def _install_cleanup_hooks() -> None:
+    """Release owned blocks at exit and on SIGTERM (installed once, lazily).
+
+    A hard kill (SIGKILL) skips both; the block is then unlinked by the
+    multiprocessing resource tracker, which outlives the publisher.
+    """
+    global _HOOKS_INSTALLED
+    if _HOOKS_INSTALLED:
+        return
+    _HOOKS_INSTALLED = True
+    atexit.register(_release_owned)
+    # Only the main thread may set handlers; keep handlers the application set
+    if threading.current_thread() is threading.main_thread() and signal.getsignal(signal.SIGTERM) is signal.SIG_DFL:
+        signal.signal(signal.SIGTERM, _terminate)
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from tradestrats.config import DEFAULT_EXCHANGE
+from tradestrats.data.fetcher import fetch_ohlcv
+
+_OHLCV_AGG = {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
+_UNITS = {"m": "min", "h": "h", "d": "D"}
+
+
+def timeframe_to_timedelta(timeframe: str) -> pd.Timedelta:
+    """Convert a ccxt-style timeframe ("5m", "4h", "1d") to a Timedelta."""
+    amount, unit = timeframe[:-1], timeframe[-1]
+    if unit not in _UNITS or not amount.isdigit():
+        raise ValueError(f"Unsupported timeframe: {timeframe!r}. Use e.g. '5m', '4h' or '1d'.")
+    return pd.Timedelta(int(amount), unit=_UNITS[unit])
+
+
+def resample_ohlcv(data: pd.DataFrame, timeframe: str) -> pd.DataFrame:
+    """Aggregate OHLCV candles to a higher timeframe.
+
+    Bars are labelled by their open time (like exchange candles); periods
+    without any base candle are dropped.
+    """
+    agg = {col: how for col, how in _OHLCV_AGG.items() if col in data.columns}
+    resampled = data.resample(timeframe_to_timedelta(timeframe), label="left", closed="left").agg(agg)
+    return resampled.dropna(subset=["close"])
+
+
+def align_to_index(
+    higher: pd.DataFrame,
+    index: pd.DatetimeIndex,
+    timeframe: str,
+) -> pd.DataFrame:
+    """As-of join higher-timeframe bars onto a base index without lookahead.
+
+    A higher-timeframe bar labelled ``t`` covers ``[t, t + timeframe)`` and is
+    only complete at ``t + timeframe``. Each base bar (labelled by its open
+    time) receives the most recent higher-timeframe bar whose close time is at
+    or before the base bar's open — i.e. only closed bars are ever visible,
+    regardless of whether orders fill at the base bar's open or close.
+
+    Works for OHLCV frames as well as wide (time x symbol) frames.
+
+    Args:
+        higher: Higher-timeframe frame indexed by bar open time.
+        index: Base DatetimeIndex (bar open times).
+        timeframe: Timeframe of ``higher`` (e.g. "1d").
+
+    Returns:
+        Frame with ``higher``'s columns on ``index``; NaN before the first
+        closed higher-timeframe bar.
+    """
+    available_at = higher.index + timeframe_to_timedelta(timeframe)
+    pos = available_at.searchsorted(index, side="right") - 1
+
+    values = higher.to_numpy(dtype=float)
+    aligned = np.full((len(index), values.shape[1]), np.nan)
+    valid = pos >= 0
+    aligned[valid] = values[pos[valid]]
+    return pd.DataFrame(aligned, index=index, columns=higher.columns)
+
+
+def merge_informative(
+    data: pd.DataFrame,
+    timeframes: list[str] | tuple[str, ...],
+    informative: dict[str, pd.DataFrame] | None = None,
+) -> pd.DataFrame:
+    """Attach closed higher-timeframe OHLCV columns to a base frame.
+
+    Each timeframe adds ``open_<tf>``, ``high_<tf>``, ... columns. Frames given
+    in ``informative`` (e.g. loaded from the cache) are used as-is; missing
+    timeframes are derived by resampling ``data``. Timeframes already present
+    in ``data`` are left untouched.
+    """
+    informative = informative or {}
+    parts = [data]
+    for tf in timeframes:
+        if f"close_{tf}" in data.columns:
+            continue
+        higher = informative.get(tf)
+        if higher is None:
+            higher = resample_ohlcv(data, tf)
+        higher = higher[[c for c in _OHLCV_AGG if c in higher.columns]]
+        aligned = align_to_index(higher, data.index, tf)
+        parts.append(aligned.add_suffix(f"_{tf}"))
+    return pd.concat(parts, axis=1) if len(parts) > 1 else data.copy()
+
+
+def load_informative(
+    symbol: str,
+    timeframes: list[str] | tuple[str, ...],
+    start: str | datetime | None = None,
+    end: str | datetime | None = None,
+    exchange_id: str = DEFAULT_EXCHANGE,
+) -> dict[str, pd.DataFrame]:
+    """Load higher-timeframe candles for a symbol from the cache/exchange.
+
+    The start is moved back by one bar per timeframe so the first base bars
+    already have a closed higher-timeframe bar. Timeframes the data source
+    does not offer (e.g. 4h on yfinance) are skipped and will be derived by
+    `merge_informative`.
+    """
+    frames: dict[str, pd.DataFrame] = {}
+    for tf in timeframes:
+        tf_start = None
+        if start is not None:
+            tf_start = pd.Timestamp(start, tz="UTC") - timeframe_to_timedelta(tf)
+        try:
+            df = fetch_ohlcv(symbol, timeframe=tf, start=tf_start, end=end, exchange_id=exchange_id)
+        except ValueError:
+            continue
+        if not df.empty:
+            frames[tf] = df
+    return frames
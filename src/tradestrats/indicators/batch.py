@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from tradestrats.data.panel import PANEL_LEVELS, is_panel, panel_symbols, symbol_frame
+from tradestrats.indicators.registry import canonical_spec, get_indicator
+
+IndicatorSpec = str | tuple[str, dict[str, Any]]
+
+
+def _canonical_spec(spec: IndicatorSpec) -> tuple[str, tuple[tuple[str, Any], ...]]:
+    """Normalise a spec (name or (name, params)) via `canonical_spec`."""
+    name, params = (spec, {}) if isinstance(spec, str) else spec
+    return canonical_spec(name, params)
+
+
+def _columns(values, name: str) -> dict[str, np.ndarray]:
+    """Flatten an indicator result to a {column: array} mapping."""
+    if isinstance(values, tuple):  # e.g. ichimoku returns (current, forward)
+        values = values[0]
+    if values is None:  # pandas-ta returns None when the input is too short
+        return {}
+    if isinstance(values, pd.Series):
+        return {values.name or name.upper(): values.to_numpy()}
+    return {col: values[col].to_numpy() for col in values.columns}
+
+
+def _compute_frame(
+    data: pd.DataFrame,
+    specs: list[tuple[str, tuple]],
+    executor: ThreadPoolExecutor | None,
+) -> dict[str, np.ndarray]:
+    """Compute unique specs on one OHLCV frame, optionally on a thread pool.
+
+    Raises:
+        ValueError: If two specs produce a column of the same name.
+    """
+
+    def task(spec):
+        name, params = spec
+        return _columns(get_indicator(name, data, **dict(params)), name)
+
+    results = executor.map(task, specs) if executor is not None else map(task, specs)
+    columns: dict[str, np.ndarray] = {}
+    owners: dict[str, tuple] = {}
+    for spec, cols in zip(specs, results):
+        for col, arr in cols.items():
+            if col in columns:
+                raise ValueError(f"Indicator specs {owners[col]} and {spec} both produce column {col!r}.")
+            columns[col], owners[col] = arr, spec
+    return columns
+
+
+def compute_indicators(
+    data: pd.DataFrame,
+    specs: list[IndicatorSpec],
+    max_workers: int | None = None,
+) -> pd.DataFrame:
+    """Compute many indicators in one call.
+
+    Identical specs (after filling in catalog defaults) are computed once;
+    intermediates shared by different indicators (e.g. the moving average
+    inside ``bbands`` and a separate ``sma``) are not reused, each spec is
+    one pandas-ta call. Independent indicators run on a thread pool — pandas' rolling/ewm kernels
+    release the GIL for most of their work. Results are assembled into a
+    single aligned frame instead of one Series per indicator.
+
+    Args:
+        data: Single-symbol OHLCV frame or multi-symbol panel (see
+            `tradestrats.data.panel.build_panel`).
+        specs: Indicator names or ``(name, params)`` tuples, e.g.
+            ``["rsi", ("bbands", {"length": 20})]``.
+        max_workers: Thread pool size. ``1`` computes sequentially.
+
+    Returns:
+        DataFrame on ``data.index``. For a panel the columns are
+        (indicator column, symbol), mirroring the panel's (field, symbol) layout.
+
+    Raises:
+        ValueError: If two different specs produce a column of the same name
+            (pandas-ta replaces some out-of-range parameters by defaults).
+    """
+    unique = list(dict.fromkeys(_canonical_spec(s) for s in specs))
+
+    executor = ThreadPoolExecutor(max_workers=max_workers) if max_workers != 1 else None
+    try:
+        if not is_panel(data):
+            columns = _compute_frame(data, unique, executor)
+            return pd.DataFrame(columns, index=data.index)
+
+        # Each symbol is computed on its own (gap-free) history, then
+        # re-aligned to the panel index so misaligned histories stay NaN.
+        per_symbol: dict[tuple[str, str], np.ndarray] = {}
+        for symbol in panel_symbols(data):
+            frame = symbol_frame(data, symbol)
+            positions = data.index.get_indexer(frame.index)
+            for col, arr in _compute_frame(frame, unique, executor).items():
+                aligned = np.full(len(data.index), np.nan)
+                aligned[positions] = arr
+                per_symbol[(col, symbol)] = aligned
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    # Group columns by indicator (like panel fields), symbols in panel order
+    indicator_cols = dict.fromkeys(col for col, _ in per_symbol)
+    ordered = {
+        (col, symbol): per_symbol[(col, symbol)]
+        for col in indicator_cols for symbol in panel_symbols(data)
+        if (col, symbol) in per_symbol
+    }
+    result = pd.DataFrame(ordered, index=data.index)
+    result.columns.names = PANEL_LEVELS
+    return result
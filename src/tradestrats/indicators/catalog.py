@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import ast
+import inspect
+import json
+import textwrap
+from dataclasses import asdict, dataclass, field
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any
+
+from tradestrats.config import DATA_DIR
+
+# OHLCV columns an indicator can consume, mapped to the pandas-ta parameter name
+INPUT_COLUMNS = {"open": "open_", "high": "high", "low": "low", "close": "close", "volume": "volume"}
+_PARAM_TO_COLUMN = {param: col for col, param in INPUT_COLUMNS.items()}
+
+# Series parameters that are not OHLCV columns (e.g. `fast`/`slow` in xsignals-style helpers)
+_SERIES_ANNOTATION = "Series"
+
+
+@dataclass(frozen=True)
+class IndicatorInfo:
+    """Introspected metadata for a single pandas-ta indicator.
+
+    Attributes:
+        name: Indicator function name in pandas-ta (e.g. "rsi").
+        category: pandas-ta category (e.g. "momentum", "overlap").
+        inputs: OHLCV columns the indicator requires.
+        optional_inputs: OHLCV columns the indicator uses when present.
+        params: Default parameter values (None where pandas-ta resolves them at runtime).
+        dispatchable: False if the indicator needs non-OHLCV series inputs.
+    """
+
+    name: str
+    category: str
+    inputs: tuple[str, ...]
+    optional_inputs: tuple[str, ...] = ()
+    params: dict[str, Any] = field(default_factory=dict)
+    dispatchable: bool = True
+
+
+_CATALOG: dict[str, IndicatorInfo] | None = None
+
+# Bump when the introspection changes so stale catalogs on disk are rebuilt
+CATALOG_FORMAT = 2
+
+_MISSING = object()
+
+
+def pandas_ta_version() -> str:
+    """Return the installed pandas-ta version without importing the package."""
+    try:
+        return version("pandas-ta")
+    except PackageNotFoundError:
+        import pandas_ta as ta
+
+        return str(ta.version)
+
+
+def catalog_path(ta_version: str | None = None) -> Path:
+    """Disk location of the catalog for a given pandas-ta version."""
+    ta_version = ta_version or pandas_ta_version()
+    return DATA_DIR / f"indicator_catalog_v{CATALOG_FORMAT}_{ta_version}.json"
+
+
+def _validator_default(call: ast.Call, namespace: dict[str, Any]) -> Any:
+    """Default of a ``var = validator(var, ...)`` call, or `_MISSING`.
+
+    The call's arguments are bound to the validator's signature, so the value
+    comes from its ``default`` parameter and not from e.g. the ``bound`` of
+    ``v_lowerbound(length, 2, 30)``. Validators without a ``default``
+    parameter (e.g. ``v_series``) or that cannot be resolved are skipped.
+    """
+    validator = namespace.get(call.func.id) if isinstance(call.func, ast.Name) else None
+    try:
+        sig = inspect.signature(validator)
+        bound = sig.bind_partial(*call.args, **{kw.arg: kw.value for kw in call.keywords if kw.arg})
+    except (TypeError, ValueError):
+        return _MISSING
+    if "default" not in sig.parameters:
+        return _MISSING
+    if "default" not in bound.arguments:
+        default = sig.parameters["default"].default
+        return _MISSING if default is inspect.Parameter.empty else default
+    try:
+        return ast.literal_eval(bound.arguments["default"])
+    except ValueError:
+        return _MISSING
+
+
+def _source_defaults(func, param_names: set[str]) -> dict[str, Any]:
+    """Recover runtime defaults from the indicator body.
+
+    pandas-ta declares most parameters as ``None`` in the signature and resolves
+    them in the body, e.g. ``length = v_pos_default(length, 14)`` or
+    ``ddof = int(ddof) if ... else 1``. Only top-level statements count:
+    assignments inside a branch (e.g. ``tos_stdevall``'s ``length``, which
+    is the whole series when None) are not the default.
+    """
+    namespace = getattr(func, "__globals__", {})
+    try:
+        tree = ast.parse(textwrap.dedent(inspect.getsource(func)))
+    except (OSError, TypeError, SyntaxError):
+        return {}
+    if not tree.body or not isinstance(tree.body[0], (ast.FunctionDef, ast.AsyncFunctionDef)):
+        return {}
+
+    defaults: dict[str, Any] = {}
+    for node in tree.body[0].body:
+        if not (isinstance(node, ast.Assign) and len(node.targets) == 1):
+            continue
+        target = node.targets[0]
+        if not isinstance(target, ast.Name) or target.id not in param_names or target.id in defaults:
+            continue
+
+        value = node.value
+        if (
+            isinstance(value, ast.Call)
+            and value.args
+            and isinstance(value.args[0], ast.Name)
+            and value.args[0].id == target.id
+        ):
+            default = _validator_default(value, namespace)
+            if default is not _MISSING:
+                defaults[target.id] = default
+        elif isinstance(value, ast.IfExp):
+            try:
+                defaults[target.id] = ast.literal_eval(value.orelse)
+            except ValueError:
+                continue
+    return defaults
+
+
+def _introspect(name: str, func, category: str) -> IndicatorInfo:
+    """Build the IndicatorInfo for one pandas-ta function."""
+    sig = inspect.signature(func)
+    inputs: list[str] = []
+    optional_inputs: list[str] = []
+    params: dict[str, Any] = {}
+    dispatchable = True
+
+    for param in sig.parameters.values():
+        if param.kind in (param.VAR_KEYWORD, param.VAR_POSITIONAL):
+            continue
+        required = param.default is inspect.Parameter.empty
+        if param.name in _PARAM_TO_COLUMN:
+            column = _PARAM_TO_COLUMN[param.name]
+            (inputs if required else optional_inputs).append(column)
+        elif _SERIES_ANNOTATION in str(param.annotation):
+            if required:
+                dispatchable = False
+        else:
+            params[param.name] = None if required else param.default
+
+    params.update(_source_defaults(func, set(params)))
+    return IndicatorInfo(
+        name=name,
+        category=category,
+        inputs=tuple(inputs),
+        optional_inputs=tuple(optional_inputs),
+        params=params,
+        dispatchable=dispatchable,
+    )
+
+
+def build_catalog() -> dict[str, IndicatorInfo]:
+    """Introspect every pandas-ta indicator (slow — prefer `get_catalog`)."""
+    import pandas_ta as ta
+
+    catalog: dict[str, IndicatorInfo] = {}
+    for category, names in ta.Category.items():
+        for name in names:
+            func = getattr(ta, name, None)
+            if callable(func):
+                catalog[name] = _introspect(name, func, category)
+    return dict(sorted(catalog.items()))
+
+
+def save_catalog(catalog: dict[str, IndicatorInfo], path: Path) -> None:
+    """Write the catalog as JSON."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {name: asdict(info) for name, info in catalog.items()}
+    path.write_text(json.dumps(payload, indent=1, default=repr))
+
+
+def load_catalog(path: Path) -> dict[str, IndicatorInfo]:
+    """Read a catalog previously written by `save_catalog`."""
+    payload = json.loads(path.read_text())
+    return {
+        name: IndicatorInfo(
+            name=entry["name"],
+            category=entry["category"],
+            inputs=tuple(entry["inputs"]),
+            optional_inputs=tuple(entry["optional_inputs"]),
+            params=entry["params"],
+            dispatchable=entry["dispatchable"],
+        )
+        for name, entry in payload.items()
+    }
+
+
+def get_catalog(refresh: bool = False, path: Path | None = None) -> dict[str, IndicatorInfo]:
+    """Return the indicator catalog, building and caching it on first use.
+
+    The catalog is memoized in-process and persisted to disk keyed by the
+    pandas-ta version, so later processes skip the module introspection.
+
+    Args:
+        refresh: Rebuild from pandas-ta even if a cached copy exists.
+        path: Override the on-disk location (default: `catalog_path()`).
+    """
+    global _CATALOG
+    if _CATALOG is not None and not refresh and path is None:
+        return _CATALOG
+
+    path = path or catalog_path()
+    catalog = None
+    if not refresh and path.exists():
+        try:
+            catalog = load_catalog(path)
+        except (ValueError, KeyError, TypeError):
+            catalog = None  # corrupt or outdated format — rebuild
+
+    if catalog is None:
+        catalog = build_catalog()
+        try:
+            save_catalog(catalog, path)
+        except OSError:
+            pass  # read-only data dir: keep the in-memory catalog
+
+    _CATALOG = catalog
+    return catalog
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import numpy as np
+from numba import njit
+
+from tradestrats.indicators.rolling import rma, rolling_std
+from tradestrats.indicators.rolling import rolling_mean as sma
+
+# Compiled indicator kernels on contiguous float64 arrays for the array-level
+# strategy fast path (``signal_array``, see `Strategy`). Warm-up bars and
+# windows that contain NaN yield NaN, as in the pandas/pandas-ta
+# implementations. The rolling primitives (`sma`, `rolling_std`, `rma`) live in
+# `tradestrats.indicators.rolling`, shared with the streaming updaters.
+
+
+@njit(cache=True)
+def rsi(close: np.ndarray, n: int) -> np.ndarray:
+    """Wilder RSI as in pandas-ta: RMA of gains over RMA of gains + losses."""
+    gain = np.full(len(close), np.nan)
+    loss = np.full(len(close), np.nan)
+    for i in range(1, len(close)):
+        delta = close[i] - close[i - 1]
+        gain[i] = delta if delta > 0 else 0.0 if delta == delta else np.nan
+        loss[i] = -delta if delta < 0 else 0.0 if delta == delta else np.nan
+    avg_gain, avg_loss = rma(gain, n), rma(loss, n)
+    return 100 * avg_gain / (avg_gain + avg_loss)
+
+
+@njit(cache=True)
+def crossing_orders(signal: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Entries/exits of an int8 signal array, see `engine.signals_to_orders`."""
+    entries = np.zeros(len(signal), dtype=np.bool_)
+    exits = np.zeros(len(signal), dtype=np.bool_)
+    prev = 0
+    for i in range(len(signal)):
+        s = signal[i]
+        entries[i] = s == 1 and prev != 1
+        exits[i] = s == -1 and prev != -1
+        prev = s
+    return entries, exits
@@ -1,45 +1,71 @@
 from __future__ import annotations
 
+from typing import Any
+
 import pandas as pd
-import pandas_ta as ta
+
+from tradestrats.indicators.catalog import INPUT_COLUMNS, IndicatorInfo, get_catalog
+
+
+def get_indicator_info(name: str) -> IndicatorInfo:
+    """Look up catalog metadata for an indicator.
+
+    Raises:
+        ValueError: If pandas-ta has no indicator of that name.
+    """
+    info = get_catalog().get(name.lower())
+    if info is None:
+        raise ValueError(f"Unknown indicator: {name!r}. Check pandas_ta docs for available indicators.")
+    return info
+
+
+def canonical_spec(name: str, params: dict[str, Any]) -> tuple[str, tuple[tuple[str, Any], ...]]:
+    """Normalise an indicator call to a hashable key.
+
+    Parameters equal to the catalog default are dropped, so ``("rsi", {})``
+    and ``("rsi", {"length": 14})`` map to the same key.
+    """
+    info = get_indicator_info(name)
+    params = {k: v for k, v in params.items() if info.params.get(k, object()) != v}
+    return info.name, tuple(sorted(params.items()))
 
 
 def get_indicator(name: str, data: pd.DataFrame, **params) -> pd.DataFrame | pd.Series:
     """Compute a technical indicator using pandas-ta.
 
+    The OHLCV columns passed to the indicator are taken from the indicator
+    catalog, which records the inputs each pandas-ta function requires.
+
     Args:
         name: Indicator name (e.g. "sma", "rsi", "macd", "bbands").
-        data: OHLCV DataFrame with at least a 'close' column.
+        data: OHLCV DataFrame with the columns the indicator needs.
         **params: Parameters passed to the pandas-ta indicator function.
 
     Returns:
         Series or DataFrame with the computed indicator values.
     """
-    func = getattr(ta, name, None)
-    if func is None:
-        raise ValueError(f"Unknown indicator: {name!r}. Check pandas_ta docs for available indicators.")
+    import pandas_ta as ta
+
+    info = get_indicator_info(name)
+    if not info.dispatchable:
+        raise ValueError(f"Indicator {info.name!r} needs non-OHLCV series inputs and cannot be computed from a frame.")
+
+    missing = [col for col in info.inputs if col not in data.columns]
+    if missing:
+        raise ValueError(f"Indicator {info.name!r} requires columns {missing}.")
 
-    # Most indicators work on the close price by default
-    close = data["close"]
-    high = data.get("high")
-    low = data.get("low")
-    volume = data.get("volume")
-
-    # Indicators that need OHLCV columns
-    ohlcv_indicators = {"atr", "adx", "stoch", "supertrend", "ichimoku", "kc", "donchian"}
-    hlc_indicators = {"atr", "adx", "stoch", "supertrend", "kc"}
-
-    if name.lower() in hlc_indicators and high is not None and low is not None:
-        return func(high=high, low=low, close=close, **params)
-    elif name.lower() in {"obv", "ad", "cmf", "mfi", "vwap"} and volume is not None:
-        if name.lower() in {"mfi"} and high is not None and low is not None:
-            return func(high=high, low=low, close=close, volume=volume, **params)
-        return func(close=close, volume=volume, **params)
-    else:
-        return func(close=close, **params)
-
-
-def list_indicators() -> list[str]:
-    """List all available indicator names from pandas-ta."""
-    # pandas-ta registers indicators as functions in the module
-    return [name for name in dir(ta) if not name.startswith("_") and callable(getattr(ta, name))]
+    inputs = {INPUT_COLUMNS[col]: data[col] for col in info.inputs}
+    inputs.update({INPUT_COLUMNS[col]: data[col] for col in info.optional_inputs if col in data.columns})
+    return getattr(ta, info.name)(**inputs, **params)
+
+
+def list_indicators(category: str | None = None) -> list[str]:
+    """List available indicator names from the catalog.
+
+    Args:
+        category: Restrict to one pandas-ta category (e.g. "overlap", "momentum").
+    """
+    return [
+        name for name, info in get_catalog().items()
+        if category is None or info.category == category
+    ]
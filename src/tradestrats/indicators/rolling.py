@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+import numpy as np
+from numba import njit
+
+# O(1)-per-bar rolling accumulators. Every statistic is one compiled `_*_step`
+# function over a small state array; the batch kernels loop over the input
+# calling the step, and the streaming classes call the same step per bar, so
+# both paths give bit-identical results. Windows that contain NaN (and the
+# warm-up bars) yield NaN, as pandas' rolling with min_periods=window does.
+
+
+# --- Rolling mean (compensated sliding sum) -----------------------------------
+
+@njit(cache=True)
+def _mean_step(state, buffer, x):
+    """state = [sum, compensation, nans, bars]; buffer = last `window` values."""
+    window = len(buffer)
+    i = int(state[3])
+    slot = i % window
+    if i >= window:
+        old = buffer[slot]
+        if np.isnan(old):
+            state[2] -= 1
+        else:
+            # Kahan summation keeps the sliding sum from drifting on long series
+            y = -old - state[1]
+            t = state[0] + y
+            state[1] = (t - state[0]) - y
+            state[0] = t
+    buffer[slot] = x
+    if np.isnan(x):
+        state[2] += 1
+    else:
+        y = x - state[1]
+        t = state[0] + y
+        state[1] = (t - state[0]) - y
+        state[0] = t
+    state[3] = i + 1
+    if i >= window - 1 and state[2] == 0:
+        return state[0] / window
+    return np.nan
+
+
+@njit(cache=True)
+def rolling_mean(x: np.ndarray, window: int) -> np.ndarray:
+    """Rolling mean over `window` bars."""
+    state, buffer = np.zeros(4), np.empty(window)
+    out = np.empty(len(x))
+    for i in range(len(x)):
+        out[i] = _mean_step(state, buffer, x[i])
+    return out
+
+
+# --- Rolling mean and variance (Welford with window removal) ------------------
+
+@njit(cache=True)
+def _welford_step(state, buffer, x):
+    """state = [n, mean, M2, nans, bars]; returns M2 once the window is full and finite."""
+    window = len(buffer)
+    i = int(state[4])
+    slot = i % window
+    if i >= window:
+        old = buffer[slot]
+        if np.isnan(old):
+            state[3] -= 1
+        else:
+            state[0] -= 1
+            if state[0] == 0:
+                state[1], state[2] = 0.0, 0.0
+            else:
+                delta = old - state[1]
+                state[1] -= delta / state[0]
+                state[2] -= delta * (old - state[1])
+    buffer[slot] = x
+    if np.isnan(x):
+        state[3] += 1
+    else:
+        state[0] += 1
+        delta = x - state[1]
+        state[1] += delta / state[0]
+        state[2] += delta * (x - state[1])
+    if slot == window - 1:
+        # Removing a value far from the mean leaves cancellation residue in
+        # M2; re-seed from the buffer once per window (amortised O(1)).
+        n, total = 0, 0.0
+        for value in buffer:
+            if not np.isnan(value):
+                n += 1
+                total += value
+        mean = total / n if n else 0.0
+        m2 = 0.0
+        for value in buffer:
+            if not np.isnan(value):
+                m2 += (value - mean) * (value - mean)
+        state[0], state[1], state[2] = n, mean, m2
+    state[4] = i + 1
+    if i >= window - 1 and state[3] == 0:
+        return max(state[2], 0.0)
+    return np.nan
+
+
+@njit(cache=True)
+def rolling_mean_var(x: np.ndarray, window: int, ddof: int = 1) -> tuple[np.ndarray, np.ndarray]:
+    """Rolling mean and variance from one Welford pass."""
+    state, buffer = np.zeros(5), np.empty(window)
+    mean, var = np.empty(len(x)), np.empty(len(x))
+    for i in range(len(x)):
+        m2 = _welford_step(state, buffer, x[i])
+        mean[i] = state[1] if not np.isnan(m2) else np.nan
+        var[i] = m2 / (window - ddof) if window > ddof else np.nan
+    return mean, var
+
+
+@njit(cache=True)
+def rolling_var(x: np.ndarray, window: int, ddof: int = 1) -> np.ndarray:
+    """Rolling variance over `window` bars (divisor ``window - ddof``)."""
+    return rolling_mean_var(x, window, ddof)[1]
+
+
+@njit(cache=True)
+def rolling_std(x: np.ndarray, window: int, ddof: int = 1) -> np.ndarray:
+    """Rolling standard deviation over `window` bars."""
+    return np.sqrt(rolling_mean_var(x, window, ddof)[1])
+
+
+# --- Rolling min / max (monotonic deque) ----------------------------------------
+
+@njit(cache=True)
+def _extreme_step(istate, indices, values, buffer, x, is_max):
+    """Monotonic deque of the window's candidates for the max (or min).
+
+    istate = [head, size, nans, bars]; `indices`/`values` form a ring buffer
+    of bar positions and values, `buffer` remembers the last `window` inputs.
+    Every value enters and leaves the deque once: amortised O(1) per bar.
+    """
+    window = len(buffer)
+    head, size, nans, i = istate[0], istate[1], istate[2], istate[3]
+    slot = i % window
+    if i >= window and np.isnan(buffer[slot]):
+        nans -= 1
+    buffer[slot] = x
+    while size > 0 and indices[head] <= i - window:
+        head = (head + 1) % window
+        size -= 1
+    if np.isnan(x):
+        nans += 1
+    else:
+        while size > 0:
+            last = values[(head + size - 1) % window]
+            if (last <= x) if is_max else (last >= x):
+                size -= 1
+            else:
+                break
+        pos = (head + size) % window
+        indices[pos] = i
+        values[pos] = x
+        size += 1
+    istate[0], istate[1], istate[2], istate[3] = head, size, nans, i + 1
+    if i >= window - 1 and nans == 0:
+        return values[head]
+    return np.nan
+
+
+@njit(cache=True)
+def _rolling_extreme(x, window, is_max):
+    istate = np.zeros(4, dtype=np.int64)
+    indices, values, buffer = np.zeros(window, dtype=np.int64), np.empty(window), np.empty(window)
+    out = np.empty(len(x))
+    for i in range(len(x)):
+        out[i] = _extreme_step(istate, indices, values, buffer, x[i], is_max)
+    return out
+
+
+@njit(cache=True)
+def rolling_max(x: np.ndarray, window: int) -> np.ndarray:
+    """Rolling maximum over `window` bars."""
+    return _rolling_extreme(x, window, True)
+
+
+@njit(cache=True)
+def rolling_min(x: np.ndarray, window: int) -> np.ndarray:
+    """Rolling minimum over `window` bars."""
+    return _rolling_extreme(x, window, False)
+
+
+# --- Exponential averages ---------------------------------------------------------
+
+@njit(cache=True)
+def _ewm_step(state, x, alpha):
+    """state = [weighted, old weight]; pandas' ewm(adjust=False) update and rounding."""
+    observed = not np.isnan(x)
+    if not np.isnan(state[0]):
+        state[1] *= 1.0 - alpha
+        if observed:
+            if state[0] != x:
+                state[0] = (state[1] * state[0] + alpha * x) / (state[1] + alpha)
+            state[1] = 1.0
+    elif observed:
+        state[0] = x
+    return state[0]
+
+
+@njit(cache=True)
+def _alpha_from_com(com):
+    # pandas converts every smoothing parameter to a center of mass first
+    return 1.0 / (1.0 + com)
+
+
+@njit(cache=True)
+def ema_alpha(span: float) -> float:
+    """Smoothing factor of ``ewm(span=span)``."""
+    return _alpha_from_com((span - 1) / 2)
+
+
+@njit(cache=True)
+def rma_alpha(length: float) -> float:
+    """Smoothing factor of Wilder's ``ewm(alpha=1/length)``."""
+    alpha = 1.0 / length
+    return _alpha_from_com((1.0 - alpha) / alpha)
+
+
+@njit(cache=True)
+def _ewm(x, alpha):
+    state = np.array([np.nan, 1.0])
+    out = np.empty(len(x))
+    for i in range(len(x)):
+        out[i] = _ewm_step(state, x[i], alpha)
+    return out
+
+
+@njit(cache=True)
+def ema(x: np.ndarray, span: int) -> np.ndarray:
+    """Exponential moving average, ``ewm(span=span, adjust=False).mean()``."""
+    return _ewm(x, ema_alpha(span))
+
+
+@njit(cache=True)
+def rma(x: np.ndarray, length: int) -> np.ndarray:
+    """Wilder's moving average, ``ewm(alpha=1/length, adjust=False)`` as in pandas-ta."""
+    return _ewm(x, rma_alpha(length))
+
+
+# --- Streaming updaters -----------------------------------------------------------
+
+class RollingMean:
+    """Streaming rolling mean; `update` returns the mean after each bar."""
+
+    def __init__(self, window: int):
+        self.window = window
+        self._state, self._buffer = np.zeros(4), np.empty(window)
+
+    def update(self, x: float) -> float:
+        return _mean_step(self._state, self._buffer, float(x))
+
+
+class RollingVar:
+    """Streaming rolling mean/variance (Welford with window removal).
+
+    `update` returns the variance after each bar; `mean` and `std` give the
+    matching mean and standard deviation.
+    """
+
+    def __init__(self, window: int, ddof: int = 1):
+        self.window = window
+        self.ddof = ddof
+        self._state, self._buffer = np.zeros(5), np.empty(window)
+        self._m2 = np.nan
+
+    def update(self, x: float) -> float:
+        self._m2 = _welford_step(self._state, self._buffer, float(x))
+        return self.var
+
+    @property
+    def var(self) -> float:
+        return self._m2 / (self.window - self.ddof) if self.window > self.ddof else np.nan
+
+    @property
+    def std(self) -> float:
+        return float(np.sqrt(self.var))
+
+    @property
+    def mean(self) -> float:
+        return self._state[1] if not np.isnan(self._m2) else np.nan
+
+
+class _RollingExtreme:
+    is_max = True
+
+    def __init__(self, window: int):
+        self.window = window
+        self._istate = np.zeros(4, dtype=np.int64)
+        self._indices, self._values = np.zeros(window, dtype=np.int64), np.empty(window)
+        self._buffer = np.empty(window)
+
+    def update(self, x: float) -> float:
+        return _extreme_step(self._istate, self._indices, self._values, self._buffer, float(x), self.is_max)
+
+
+class RollingMax(_RollingExtreme):
+    """Streaming rolling maximum (monotonic deque)."""
+
+
+class RollingMin(_RollingExtreme):
+    """Streaming rolling minimum (monotonic deque)."""
+
+    is_max = False
+
+
+class EMA:
+    """Streaming exponential moving average, see `ema`."""
+
+    def __init__(self, span: int):
+        self.span = span
+        self._alpha = ema_alpha(span)
+        self._state = np.array([np.nan, 1.0])
+
+    def update(self, x: float) -> float:
+        return _ewm_step(self._state, float(x), self._alpha)
+
+
+class RMA(EMA):
+    """Streaming Wilder moving average, see `rma`."""
+
+    def __init__(self, length: int):
+        self.length = length
+        self._alpha = rma_alpha(length)
+        self._state = np.array([np.nan, 1.0])
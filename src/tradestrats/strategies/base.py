@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 
+import numpy as np
 import pandas as pd
 
 
@@ -11,12 +12,33 @@ class Strategy(ABC):
     Subclasses must implement `generate_signals` which takes OHLCV data
     and returns a DataFrame with at least a 'signal' column containing
     1 (buy), -1 (sell), or 0 (hold).
+
+    Strategies that need higher-timeframe context list those timeframes in
+    `informative_timeframes`; the engine then attaches closed higher-timeframe
+    candles as ``<field>_<tf>`` columns (e.g. ``high_1d``) before calling
+    `generate_signals`. See `tradestrats.data.timeframes.merge_informative`.
+
+    `warmup_bars` is the number of base bars a signal depends on (the
+    longest indicator window); chunked and incremental runs keep at least
+    that much history between chunks.
+
+    Strategies may also define ``signal_array(self, columns)``, an
+    array-level version of `generate_signals` that the engine uses in hot
+    loops (parameter sweeps, chunked runs and ``engine.run(..., fast=True)``).
+    It receives contiguous float64 arrays keyed by column name (open, high,
+    low, close, volume and attached ``<field>_<tf>`` columns) plus ``time``
+    as int64 nanoseconds (see `frame_columns`) and returns an int8 signal
+    array equal to ``generate_signals(data)["signal"]`` (up to floating
+    point rounding of the indicators). Strategies without it are run
+    through `generate_signals`, see `has_signal_array`.
     """
 
     name: str = "BaseStrategy"
     description: str = ""
     recommended_timeframe: str = "1h"
     recommended_sl_stop: float = 0.05
+    informative_timeframes: tuple[str, ...] = ()
+    warmup_bars: int = 0
 
     @abstractmethod
     def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
@@ -30,5 +52,92 @@ class Strategy(ABC):
             and any additional indicator columns used by the strategy.
         """
 
+    def generate_panel_signals(self, panel: pd.DataFrame) -> pd.DataFrame:
+        """Generate signals for every symbol of a multi-symbol panel.
+
+        The default implementation calls `generate_signals` once per symbol.
+        Built-in strategies override it with a single vectorized pass over
+        the (time x symbol) matrices.
+
+        Args:
+            panel: Panel with (field, symbol) columns, see
+                `tradestrats.data.panel.build_panel`.
+
+        Returns:
+            (time x symbol) int8 DataFrame of signals (1=buy, -1=sell, 0=hold).
+            Timestamps where a symbol has no data hold 0.
+        """
+        from tradestrats.data.panel import panel_symbols, symbol_frame
+
+        columns = {}
+        for symbol in panel_symbols(panel):
+            frame = symbol_frame(panel, symbol)
+            columns[symbol] = self.generate_signals(frame)["signal"].reindex(panel.index)
+        return _as_signal_frame(pd.DataFrame(columns, index=panel.index))
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(name={self.name!r})"
+
+
+def _as_signal_frame(signals: pd.DataFrame) -> pd.DataFrame:
+    """Normalise a wide signal frame: NaN -> 0, int8 dtype, named symbol axis."""
+    signals = signals.fillna(0).astype(np.int8)
+    signals.columns.name = "symbol"
+    return signals
+
+
+def panel_signals(buy: pd.DataFrame, sell: pd.DataFrame) -> pd.DataFrame:
+    """Combine wide buy/sell masks into a signal frame (sell wins on overlap).
+
+    Mirrors the single-symbol convention of assigning buys first and then
+    overwriting with sells.
+    """
+    signal = np.where(sell.to_numpy(), -1, np.where(buy.to_numpy(), 1, 0)).astype(np.int8)
+    return _as_signal_frame(pd.DataFrame(signal, index=buy.index, columns=buy.columns))
+
+
+def array_signals(buy: np.ndarray, sell: np.ndarray) -> np.ndarray:
+    """Combine buy/sell masks into an int8 signal array (sell wins on overlap)."""
+    return np.where(sell, -1, np.where(buy, 1, 0)).astype(np.int8)
+
+
+def has_signal_array(strategy: Strategy) -> bool:
+    """Whether `signal_array` can stand in for `generate_signals`.
+
+    True if the strategy's class defines ``signal_array``. A subclass that overrides `generate_signals` below the class that
+    implements `signal_array` falls back to `generate_signals`, so the fast
+    path never bypasses customised signal logic.
+    """
+    if getattr(type(strategy), "signal_array", None) is None:
+        return False
+    mro = type(strategy).__mro__
+    array_owner = next(cls for cls in mro if "signal_array" in vars(cls))
+    frame_owner = next(cls for cls in mro if "generate_signals" in vars(cls))
+    return issubclass(array_owner, frame_owner)
+
+
+def frame_columns(data: pd.DataFrame) -> dict[str, np.ndarray]:
+    """Numeric columns of an OHLCV frame as contiguous float64 arrays, plus ``time``."""
+    columns = {
+        name: np.ascontiguousarray(data[name].to_numpy(dtype=np.float64))
+        for name in data.columns
+        if pd.api.types.is_numeric_dtype(data[name])
+    }
+    columns["time"] = data.index.asi8
+    return columns
+
+
+def strategy_signals(strategy: Strategy, data: pd.DataFrame) -> np.ndarray:
+    """int8 signal array of a strategy, via `signal_array` where available.
+
+    `data` must already carry the strategy's informative columns where they
+    should come from the cache (see `merge_informative`); missing ones are
+    derived from `data`, as `generate_signals` does.
+    """
+    if not has_signal_array(strategy):
+        return strategy.generate_signals(data)["signal"].to_numpy(dtype=np.int8)
+    if any(f"close_{tf}" not in data.columns for tf in strategy.informative_timeframes):
+        from tradestrats.data.timeframes import merge_informative
+
+        data = merge_informative(data, strategy.informative_timeframes)
+    return np.asarray(strategy.signal_array(frame_columns(data)), dtype=np.int8)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 import pandas_ta as ta
 
-from tradestrats.strategies.base import Strategy
+from tradestrats.indicators.rolling import rolling_mean_var
+from tradestrats.strategies.base import Strategy, array_signals, panel_signals
 
 
 class BollingerBandStrategy(Strategy):
@@ -23,6 +25,10 @@ class BollingerBandStrategy(Strategy):
         self.bb_period = bb_period
         self.num_std = num_std
 
+    @property
+    def warmup_bars(self) -> int:
+        return self.bb_period
+
     def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
         df = data.copy()
 
@@ -40,6 +46,25 @@ class BollingerBandStrategy(Strategy):
 
         return df
 
+    def signal_array(self, columns: dict[str, np.ndarray]) -> np.ndarray:
+        close = columns["close"]
+        # One Welford pass for the mid band and the sample std (ddof=1)
+        mid, var = rolling_mean_var(close, self.bb_period, 1)
+        std = np.sqrt(var)
+        return array_signals(close < mid - self.num_std * std, close > mid + self.num_std * std)
+
+    def generate_panel_signals(self, panel: pd.DataFrame) -> pd.DataFrame:
+        close = panel["close"]
+
+        # Same definition as ta.bbands: SMA mid, sample std (ddof=1)
+        rolling = close.rolling(self.bb_period)
+        mid = rolling.mean()
+        std = rolling.std(ddof=1)
+        bb_lower = mid - self.num_std * std
+        bb_upper = mid + self.num_std * std
+
+        return panel_signals(close < bb_lower, close > bb_upper)
+
     def __repr__(self) -> str:
         return (
             f"BollingerBandStrategy(period={self.bb_period}, "
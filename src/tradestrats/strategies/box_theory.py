@@ -3,7 +3,8 @@ from __future__ import annotations
 import numpy as np
 import pandas as pd
 
-from tradestrats.strategies.base import Strategy
+from tradestrats.data.timeframes import align_to_index, merge_informative
+from tradestrats.strategies.base import Strategy, array_signals, panel_signals
 
 
 class BoxTheory(Strategy):
@@ -27,32 +28,18 @@ class BoxTheory(Strategy):
     description = "Sell near previous-day high, buy near previous-day low, avoid the middle."
     recommended_timeframe = "5m"
     recommended_sl_stop = 0.02
+    informative_timeframes = ("1d",)
 
     def __init__(self, zone_pct: float = 0.25):
         self.zone_pct = zone_pct
 
     def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
-        df = data.copy()
+        # Previous day's high/low = last closed daily candle. The engine
+        # attaches it from the cache; derive it here when called directly.
+        df = merge_informative(data, self.informative_timeframes)
 
-        # Determine the calendar date for each row
-        df["_date"] = df.index.date
-
-        # Compute daily high/low from the data itself
-        daily_hl = df.groupby("_date").agg(
-            day_high=("high", "max"),
-            day_low=("low", "min"),
-        )
-
-        # Previous day's high/low (shift by one trading day)
-        daily_hl["prev_high"] = daily_hl["day_high"].shift(1)
-        daily_hl["prev_low"] = daily_hl["day_low"].shift(1)
-
-        # Map back to each row
-        date_to_prev_high = daily_hl["prev_high"].to_dict()
-        date_to_prev_low = daily_hl["prev_low"].to_dict()
-
-        df["box_high"] = df["_date"].map(date_to_prev_high)
-        df["box_low"] = df["_date"].map(date_to_prev_low)
+        df["box_high"] = df["high_1d"]
+        df["box_low"] = df["low_1d"]
         df["box_mid"] = (df["box_high"] + df["box_low"]) / 2
         df["box_range"] = df["box_high"] - df["box_low"]
 
@@ -72,10 +59,28 @@ class BoxTheory(Strategy):
         # First day has no previous-day data — no signal
         df.loc[df["box_high"].isna(), "signal"] = 0
 
-        # Clean up helper columns
-        df.drop(columns=["_date"], inplace=True)
-
         return df
 
+    def signal_array(self, columns: dict[str, np.ndarray]) -> np.ndarray:
+        box_high, box_low, close = columns["high_1d"], columns["low_1d"], columns["close"]
+        zone_size = (box_high - box_low) * self.zone_pct
+        signal = array_signals(close <= box_low + zone_size, close >= box_high - zone_size)
+        signal[np.isnan(box_high)] = 0
+        return signal
+
+    def generate_panel_signals(self, panel: pd.DataFrame) -> pd.DataFrame:
+        # Daily high/low per symbol; ffill so each symbol uses its own
+        # previous trading day when histories are misaligned
+        day_high = panel["high"].resample("1D").max().ffill()
+        day_low = panel["low"].resample("1D").min().ffill()
+        box_high = align_to_index(day_high, panel.index, "1d")
+        box_low = align_to_index(day_low, panel.index, "1d")
+
+        zone_size = (box_high - box_low) * self.zone_pct
+        close = panel["close"]
+
+        # NaN boxes (first day per symbol) compare False -> no signal
+        return panel_signals(close <= box_low + zone_size, close >= box_high - zone_size)
+
     def __repr__(self) -> str:
         return f"BoxTheory(zone_pct={self.zone_pct})"
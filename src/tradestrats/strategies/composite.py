@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from tradestrats.strategies.expr import ExprStrategy, col, ind
+
+
+def rsi_bollinger(
+    rsi_period: int = 14,
+    oversold: float = 30,
+    overbought: float = 70,
+    bb_period: int = 20,
+    num_std: float = 2.0,
+) -> ExprStrategy:
+    """RSI + Bollinger Band confluence (mean-reversion).
+
+    Buys only when RSI is oversold *and* the close is below the lower band;
+    sells when RSI is overbought *or* the close is above the upper band.
+    """
+    rsi = ind("rsi", length=rsi_period)
+    close = col("close")
+    bb = {"length": bb_period, "lower_std": num_std, "upper_std": num_std}
+
+    return ExprStrategy(
+        entry=(rsi < oversold) & (close < ind("bbands", "BBL", **bb)),
+        exit=(rsi > overbought) | (close > ind("bbands", "BBU", **bb)),
+        name="RSI + Bollinger",
+        recommended_timeframe="1h",
+        recommended_sl_stop=0.03,
+    )
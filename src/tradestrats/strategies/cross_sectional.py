@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+from abc import abstractmethod
+
+import numpy as np
+import pandas as pd
+from numba import njit
+
+from tradestrats.strategies.base import Strategy, _as_signal_frame
+
+
+def rebalance_mask(index: pd.DatetimeIndex, every: int | str) -> np.ndarray:
+    """Bars on which a cross-sectional strategy re-ranks its universe.
+
+    Args:
+        index: Bar timestamps.
+        every: Number of bars between rebalances, or a pandas frequency
+            (e.g. ``"1D"``, ``"W"``, ``"MS"``); the first bar of each period
+            then rebalances.
+
+    Returns:
+        Boolean array, True on rebalance bars (always including bar 0).
+    """
+    n = len(index)
+    if isinstance(every, (int, np.integer)):
+        if every < 1:
+            raise ValueError(f"Rebalance interval must be at least one bar, got {every}.")
+        return np.arange(n) % every == 0
+
+    naive = index.tz_localize(None) if index.tz is not None else index
+    try:
+        periods = naive.floor(every).asi8
+    except ValueError:  # calendar frequencies (weeks, months) have no fixed length
+        periods = naive.to_period(every).asi8
+    mask = np.ones(n, dtype=bool)
+    mask[1:] = periods[1:] != periods[:-1]
+    return mask
+
+
+def top_k_mask(scores: np.ndarray, k: int) -> np.ndarray:
+    """Row-wise top-`k` selection with a partial sort.
+
+    `np.argpartition` places the `k` largest scores of each row in front in
+    O(symbols) per row instead of fully sorting it. NaN scores are never
+    selected; rows with fewer than `k` finite scores select all of them.
+
+    Args:
+        scores: (rows x symbols) scores.
+        k: Number of symbols to select per row.
+
+    Returns:
+        Boolean (rows x symbols) mask.
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    n_rows, n_cols = scores.shape
+    selected = np.zeros((n_rows, n_cols), dtype=bool)
+    k = min(k, n_cols)
+    if k <= 0 or n_rows == 0:
+        return selected
+    finite = np.isfinite(scores)
+    keyed = np.where(finite, -scores, np.inf)
+    top = np.argpartition(keyed, k - 1, axis=1)[:, :k] if k < n_cols else np.tile(np.arange(n_cols), (n_rows, 1))
+    rows = np.arange(n_rows)[:, None]
+    selected[rows, top] = True
+    return selected & finite
+
+
+def rank_rows(scores: np.ndarray) -> np.ndarray:
+    """Cross-sectional percentile rank (0 = lowest, 1 = highest) of each row.
+
+    NaN scores stay NaN and are excluded from the ranking; ties are broken
+    by column order.
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    finite = np.isfinite(scores)
+    order = np.argsort(np.where(finite, scores, np.inf), axis=1, kind="stable")
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(scores.shape[1])[None, :], axis=1)
+    counts = finite.sum(axis=1, keepdims=True)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        pct = np.where(counts > 1, ranks / (counts - 1), 1.0)
+    return np.where(finite, pct, np.nan)
+
+
+def trailing_return(close: np.ndarray, rows: np.ndarray, lookback: int, skip: int = 0) -> np.ndarray:
+    """Return over `lookback` bars ending `skip` bars before each of `rows`."""
+    end = rows - skip
+    start = end - lookback
+    valid = start >= 0
+    out = np.full((len(rows), close.shape[1]), np.nan)
+    out[valid] = close[end[valid]] / close[start[valid]] - 1
+    return out
+
+
+@njit(cache=True)
+def _prefix_sums_nb(close, points):
+    """Prefix sums of bar returns, squared returns and missing returns at `points`.
+
+    Row j of each output sums the returns of bars 1..points[j]-1 (sorted
+    `points`), walking the bars once in memory order.
+    """
+    n_bars, n_cols = close.shape
+    total = np.zeros((len(points), n_cols))
+    total2 = np.zeros((len(points), n_cols))
+    missing = np.zeros((len(points), n_cols))
+    s, s2, nans = np.zeros(n_cols), np.zeros(n_cols), np.zeros(n_cols)
+    j = 0
+    for i in range(n_bars + 1):
+        while j < len(points) and points[j] == i:
+            total[j], total2[j], missing[j] = s, s2, nans
+            j += 1
+        if i == 0 or i == n_bars:
+            continue
+        for col in range(n_cols):
+            r = close[i, col] / close[i - 1, col] - 1
+            if np.isnan(r):
+                nans[col] += 1
+            else:
+                s[col] += r
+                s2[col] += r * r
+    return total, total2, missing
+
+
+def trailing_volatility(close: np.ndarray, rows: np.ndarray, window: int) -> np.ndarray:
+    """Std (ddof=1) of the last `window` bar returns at each of `rows`.
+
+    One compiled pass over the bars keeps running sums of the returns and
+    squared returns and snapshots them only where a window starts or ends,
+    so the cost is O(time x symbols) for any `window` and the memory
+    O(rows x symbols). Windows with a missing return are NaN.
+    """
+    out = np.full((len(rows), close.shape[1]), np.nan)
+    valid = rows >= window
+    end, start = rows[valid] + 1, rows[valid] + 1 - window
+    points, inverse = np.unique(np.concatenate([start, end]), return_inverse=True)
+    total, total2, missing = _prefix_sums_nb(np.ascontiguousarray(close, dtype=np.float64), points)
+
+    b, e = inverse[:len(start)], inverse[len(start):]
+    s, s2 = total[e] - total[b], total2[e] - total2[b]
+    var = np.maximum((s2 - s * s / window) / (window - 1), 0.0)
+    out[valid] = np.where(missing[e] > missing[b], np.nan, np.sqrt(var))
+    return out
+
+
+class CrossSectionalStrategy(Strategy):
+    """Base class for strategies that rank a universe of symbols.
+
+    On every rebalance bar (see `rebalance_mask`) subclasses score all
+    symbols with `score`; the `top_k` best-scored symbols are held until the
+    next rebalance. Only rebalance rows are scored, and the selection is a
+    partial sort per row (`top_k_mask`), so large universes and long
+    histories stay fast. Symbols without a close on the rebalance bar are
+    not eligible.
+
+    The strategy works on panels only: `generate_panel_signals` returns 1
+    while a symbol is held and -1 otherwise. Backtest it with
+    ``run_portfolio(strategy, panel, max_positions=strategy.top_k)`` so the
+    capital is split into `top_k` slots.
+
+    Args:
+        top_k: Number of symbols held after each rebalance.
+        rebalance: Bars between rebalances or a pandas frequency, see
+            `rebalance_mask`.
+    """
+
+    name = "Cross-Sectional"
+
+    def __init__(self, top_k: int = 10, rebalance: int | str = "1D"):
+        if top_k < 1:
+            raise ValueError(f"top_k must be at least 1, got {top_k}.")
+        self.top_k = top_k
+        self.rebalance = rebalance
+
+    @abstractmethod
+    def score(self, close: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """Score every symbol on the given bars (higher is better).
+
+        Args:
+            close: (time x symbol) close prices, NaN where a symbol has no
+                candle.
+            rows: Bar positions to score (the rebalance bars).
+
+        Returns:
+            (len(rows) x symbol) scores; NaN marks symbols that must not be
+            held.
+        """
+
+    def holdings(self, panel: pd.DataFrame) -> pd.DataFrame:
+        """(time x symbol) boolean frame of the symbols held on each bar."""
+        close = panel["close"]
+        values = close.to_numpy(dtype=np.float64)
+        mask = rebalance_mask(close.index, self.rebalance)
+        rows = np.flatnonzero(mask)
+
+        scores = self.score(values, rows)
+        scores = np.where(np.isnan(values[rows]), np.nan, scores)
+        selected = top_k_mask(scores, self.top_k)
+
+        # Carry each selection forward until the next rebalance
+        held = selected[np.cumsum(mask) - 1]
+        return pd.DataFrame(held, index=close.index, columns=close.columns)
+
+    def generate_panel_signals(self, panel: pd.DataFrame) -> pd.DataFrame:
+        held = self.holdings(panel)
+        signal = held.to_numpy().astype(np.int8) * 2 - 1  # held: 1, not held: -1
+        return _as_signal_frame(pd.DataFrame(signal, index=held.index, columns=held.columns))
+
+    def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
+        raise ValueError(
+            f"{type(self).__name__} ranks a universe of symbols; pass a multi-symbol panel "
+            "to run_portfolio or run_panel instead of a single OHLCV frame."
+        )
+
+
+class CrossSectionalMomentum(CrossSectionalStrategy):
+    """Hold the `top_k` symbols with the highest trailing return.
+
+    Args:
+        lookback: Bars of the trailing return.
+        skip: Most recent bars left out of the return (short-term reversal).
+        top_k, rebalance: See `CrossSectionalStrategy`.
+    """
+
+    name = "Cross-Sectional Momentum"
+    description = "Hold the top-k symbols by trailing return, rebalanced on a schedule."
+
+    def __init__(self, lookback: int = 30, top_k: int = 10, rebalance: int | str = "1D", skip: int = 0):
+        super().__init__(top_k=top_k, rebalance=rebalance)
+        self.lookback = lookback
+        self.skip = skip
+
+    def score(self, close: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        return trailing_return(close, rows, self.lookback, self.skip)
+
+    def __repr__(self) -> str:
+        return (
+            f"CrossSectionalMomentum(lookback={self.lookback}, top_k={self.top_k}, "
+            f"rebalance={self.rebalance!r}, skip={self.skip})"
+        )
+
+
+class VolAdjustedMomentum(CrossSectionalMomentum):
+    """Trailing return divided by the trailing volatility of bar returns.
+
+    Args:
+        vol_window: Bars of the volatility estimate (default: `lookback`).
+        lookback, top_k, rebalance, skip: See `CrossSectionalMomentum`.
+    """
+
+    name = "Volatility-Adjusted Momentum"
+    description = "Hold the top-k symbols by trailing return per unit of volatility."
+
+    def __init__(
+        self,
+        lookback: int = 30,
+        top_k: int = 10,
+        rebalance: int | str = "1D",
+        skip: int = 0,
+        vol_window: int | None = None,
+    ):
+        super().__init__(lookback=lookback, top_k=top_k, rebalance=rebalance, skip=skip)
+        self.vol_window = vol_window or lookback
+
+    def score(self, close: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        momentum = trailing_return(close, rows, self.lookback, self.skip)
+        volatility = trailing_volatility(close, rows, self.vol_window)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(volatility > 0, momentum / volatility, np.nan)
+
+    def __repr__(self) -> str:
+        return (
+            f"VolAdjustedMomentum(lookback={self.lookback}, vol_window={self.vol_window}, "
+            f"top_k={self.top_k}, rebalance={self.rebalance!r}, skip={self.skip})"
+        )
@@ -0,0 +1,370 @@
+from __future__ import annotations
+
+import operator
+from abc import ABC, abstractmethod
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+
+from tradestrats.indicators.registry import canonical_spec, get_indicator
+from tradestrats.strategies.base import Strategy
+
+# Binary operators: symbol used in repr -> numpy implementation
+_BINARY_OPS: dict[str, Callable[[np.ndarray, np.ndarray], np.ndarray]] = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "&": np.logical_and,
+    "|": np.logical_or,
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+}
+
+
+class Expr(ABC):
+    """Node of a lazily evaluated strategy expression graph.
+
+    Expressions are built with Python operators and only computed by an
+    `Evaluator`. Every node has a structural `key`; nodes with equal keys are
+    evaluated once per evaluator, however often they appear in the graph.
+
+    Note that ``==`` is not overloaded — use `key` to compare expressions.
+    """
+
+    @property
+    @abstractmethod
+    def key(self) -> tuple:
+        """Structural identity of the node (hashable, equal for equal subgraphs)."""
+
+    @abstractmethod
+    def _eval(self, ev: Evaluator) -> np.ndarray:
+        """Compute the node's values, evaluating children through `ev`."""
+
+    def _binary(self, op: str, other, reflected: bool = False) -> BinaryOp:
+        other = other if isinstance(other, Expr) else Const(other)
+        return BinaryOp(op, other, self) if reflected else BinaryOp(op, self, other)
+
+    def __lt__(self, other) -> BinaryOp:
+        return self._binary("<", other)
+
+    def __le__(self, other) -> BinaryOp:
+        return self._binary("<=", other)
+
+    def __gt__(self, other) -> BinaryOp:
+        return self._binary(">", other)
+
+    def __ge__(self, other) -> BinaryOp:
+        return self._binary(">=", other)
+
+    def __and__(self, other) -> BinaryOp:
+        return self._binary("&", other)
+
+    def __or__(self, other) -> BinaryOp:
+        return self._binary("|", other)
+
+    def __add__(self, other) -> BinaryOp:
+        return self._binary("+", other)
+
+    def __radd__(self, other) -> BinaryOp:
+        return self._binary("+", other, reflected=True)
+
+    def __sub__(self, other) -> BinaryOp:
+        return self._binary("-", other)
+
+    def __rsub__(self, other) -> BinaryOp:
+        return self._binary("-", other, reflected=True)
+
+    def __mul__(self, other) -> BinaryOp:
+        return self._binary("*", other)
+
+    def __rmul__(self, other) -> BinaryOp:
+        return self._binary("*", other, reflected=True)
+
+    def __truediv__(self, other) -> BinaryOp:
+        return self._binary("/", other)
+
+    def __invert__(self) -> Not:
+        return Not(self)
+
+    def crossed_above(self, other) -> Cross:
+        """True on the bar where this expression moves above `other`."""
+        return Cross("above", self, other if isinstance(other, Expr) else Const(other))
+
+    def crossed_below(self, other) -> Cross:
+        """True on the bar where this expression moves below `other`."""
+        return Cross("below", self, other if isinstance(other, Expr) else Const(other))
+
+    # Expressions are graph nodes, not values
+    __hash__ = object.__hash__
+
+    def __bool__(self) -> bool:
+        raise TypeError("Expressions have no truth value; use & | ~ instead of and/or/not.")
+
+
+class Column(Expr):
+    """A column of the input frame, e.g. ``Column("close")``."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    @property
+    def key(self) -> tuple:
+        return ("col", self.name)
+
+    def _eval(self, ev: Evaluator) -> np.ndarray:
+        return ev.data[self.name].to_numpy(dtype=float)
+
+    def __repr__(self) -> str:
+        return self.name
+
+
+class Const(Expr):
+    """A scalar constant."""
+
+    def __init__(self, value: float):
+        self.value = value
+
+    @property
+    def key(self) -> tuple:
+        return ("const", self.value)
+
+    def _eval(self, ev: Evaluator) -> np.ndarray:
+        return np.asarray(self.value)
+
+    def __repr__(self) -> str:
+        return repr(self.value)
+
+
+class Indicator(Expr):
+    """A pandas-ta indicator, optionally selecting one output column.
+
+    Args:
+        name: Indicator name from the catalog (e.g. "rsi", "bbands").
+        output: For multi-column indicators, the column position or a column
+            name prefix (e.g. "BBL" for the lower Bollinger band).
+        **params: Indicator parameters. Catalog defaults are normalised away,
+            so ``Indicator("rsi")`` and ``Indicator("rsi", length=14)`` share one
+            computation.
+    """
+
+    def __init__(self, name: str, output: int | str | None = None, **params: Any):
+        self.name, self.params = canonical_spec(name, params)
+        self.output = output
+
+    @property
+    def key(self) -> tuple:
+        return ("ind", self.name, self.params, self.output)
+
+    def _eval(self, ev: Evaluator) -> np.ndarray:
+        values = ev.indicator(self.name, self.params)
+        if isinstance(values, tuple):  # e.g. ichimoku returns (current, forward)
+            values = values[0]
+        if isinstance(values, pd.DataFrame):
+            if self.output is None:
+                raise ValueError(f"Indicator {self.name!r} has several outputs {list(values.columns)}; pass output=.")
+            if isinstance(self.output, int):
+                values = values.iloc[:, self.output]
+            else:
+                matches = [c for c in values.columns if c.startswith(self.output)]
+                if not matches:
+                    raise ValueError(f"Indicator {self.name!r} has no output {self.output!r}: {list(values.columns)}")
+                values = values[matches[0]]
+        if values is None:  # pandas-ta returns None when the input is too short
+            return np.full(len(ev.data), np.nan)
+        return values.to_numpy(dtype=float)
+
+    def __repr__(self) -> str:
+        args = ", ".join(f"{k}={v!r}" for k, v in self.params)
+        output = f"[{self.output}]" if self.output is not None else ""
+        return f"{self.name}{output}({args})"
+
+
+class BinaryOp(Expr):
+    """Arithmetic, comparison or boolean combination of two expressions."""
+
+    def __init__(self, op: str, left: Expr, right: Expr):
+        self.op = op
+        self.left = left
+        self.right = right
+
+    @property
+    def key(self) -> tuple:
+        return ("op", self.op, self.left.key, self.right.key)
+
+    def _eval(self, ev: Evaluator) -> np.ndarray:
+        left, right = ev.evaluate(self.left), ev.evaluate(self.right)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return _BINARY_OPS[self.op](left, right)
+
+    def __repr__(self) -> str:
+        return f"({self.left!r} {self.op} {self.right!r})"
+
+
+class Not(Expr):
+    """Boolean negation."""
+
+    def __init__(self, operand: Expr):
+        self.operand = operand
+
+    @property
+    def key(self) -> tuple:
+        return ("not", self.operand.key)
+
+    def _eval(self, ev: Evaluator) -> np.ndarray:
+        return np.logical_not(ev.evaluate(self.operand))
+
+    def __repr__(self) -> str:
+        return f"~{self.operand!r}"
+
+
+class Cross(Expr):
+    """Crossover of two expressions (first bar where the order flips)."""
+
+    def __init__(self, direction: str, left: Expr, right: Expr):
+        self.direction = direction
+        self.left = left
+        self.right = right
+
+    @property
+    def key(self) -> tuple:
+        return ("cross", self.direction, self.left.key, self.right.key)
+
+    def _eval(self, ev: Evaluator) -> np.ndarray:
+        left = np.broadcast_to(ev.evaluate(self.left), (len(ev.data),))
+        right = np.broadcast_to(ev.evaluate(self.right), (len(ev.data),))
+        with np.errstate(invalid="ignore"):
+            now = left > right if self.direction == "above" else left < right
+            before = left <= right if self.direction == "above" else left >= right
+        crossed = np.zeros(len(now), dtype=bool)
+        crossed[1:] = now[1:] & before[:-1]
+        return crossed
+
+    def __repr__(self) -> str:
+        return f"{self.left!r}.crossed_{self.direction}({self.right!r})"
+
+
+def col(name: str) -> Column:
+    """Shorthand for `Column`."""
+    return Column(name)
+
+
+def ind(name: str, output: int | str | None = None, **params: Any) -> Indicator:
+    """Shorthand for `Indicator`."""
+    return Indicator(name, output=output, **params)
+
+
+class Evaluator:
+    """Evaluates expressions on one OHLCV frame with a shared memo.
+
+    Every distinct node (by `Expr.key`) and every distinct indicator call is
+    computed at most once, so any number of expressions — e.g. a whole family
+    of composite strategies — can be evaluated in a single pass.
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        self.data = data
+        self._values: dict[tuple, np.ndarray] = {}
+        self._indicators: dict[tuple, Any] = {}
+
+    def evaluate(self, expr: Expr) -> np.ndarray:
+        key = expr.key
+        if key not in self._values:
+            self._values[key] = expr._eval(self)
+        return self._values[key]
+
+    def indicator(self, name: str, params: tuple):
+        """Raw pandas-ta output, shared between e.g. the lower and upper band."""
+        key = (name, params)
+        if key not in self._indicators:
+            self._indicators[key] = get_indicator(name, self.data, **dict(params))
+        return self._indicators[key]
+
+    @property
+    def n_evaluated(self) -> int:
+        """Number of distinct nodes computed so far."""
+        return len(self._values)
+
+
+class ExprStrategy(Strategy):
+    """Strategy defined by entry/exit expressions.
+
+    Example::
+
+        rsi = ind("rsi", length=14)
+        close = col("close")
+        ExprStrategy(
+            entry=(rsi < 30) & (close < ind("bbands", "BBL", length=20)),
+            exit=(rsi > 70) | (close > ind("bbands", "BBU", length=20)),
+        )
+
+    Args:
+        entry: Boolean expression for buy signals (signal = 1).
+        exit: Boolean expression for sell signals (signal = -1, wins on overlap).
+        name: Display name.
+        recommended_timeframe: Default timeframe for CLI/dashboard.
+        recommended_sl_stop: Default stop-loss for CLI/dashboard.
+    """
+
+    description = "Composite strategy built from indicator expressions."
+
+    def __init__(
+        self,
+        entry: Expr,
+        exit: Expr,
+        name: str = "Composite",
+        recommended_timeframe: str = "1h",
+        recommended_sl_stop: float = 0.05,
+    ):
+        self.entry = entry
+        self.exit = exit
+        self.name = name
+        self.recommended_timeframe = recommended_timeframe
+        self.recommended_sl_stop = recommended_sl_stop
+
+    def _signals_from(self, ev: Evaluator) -> np.ndarray:
+        """Evaluate entry/exit on a (possibly shared) evaluator."""
+        n = len(ev.data)
+        buy = np.broadcast_to(ev.evaluate(self.entry), (n,))
+        sell = np.broadcast_to(ev.evaluate(self.exit), (n,))
+        return np.where(sell, -1, np.where(buy, 1, 0))
+
+    def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
+        ev = Evaluator(data)
+        signal = self._signals_from(ev)
+
+        df = data.copy()
+        # Expose the computed indicator outputs for charts/inspection
+        for (name, params), values in ev._indicators.items():
+            if isinstance(values, tuple):
+                values = values[0]
+            if isinstance(values, pd.Series):
+                df[values.name or name.upper()] = values
+            elif isinstance(values, pd.DataFrame):
+                for c in values.columns:
+                    df[c] = values[c]
+        df["signal"] = signal
+        return df
+
+    def __repr__(self) -> str:
+        return f"ExprStrategy(entry={self.entry!r}, exit={self.exit!r})"
+
+
+def family_signals(strategies: dict[str, ExprStrategy], data: pd.DataFrame) -> pd.DataFrame:
+    """Evaluate many composite strategies in one pass over shared subexpressions.
+
+    Args:
+        strategies: Mapping of label to ExprStrategy.
+        data: OHLCV DataFrame.
+
+    Returns:
+        DataFrame with one signal column per strategy label.
+    """
+    ev = Evaluator(data)
+    return pd.DataFrame(
+        {label: strategy._signals_from(ev) for label, strategy in strategies.items()},
+        index=data.index,
+    )
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from tradestrats.indicators.rolling import rolling_mean_var
+from tradestrats.strategies.base import Strategy, array_signals
+
+
+class PairSpread(Strategy):
+    """Mean-reversion on the z-score of a pair spread.
+
+    Runs on the synthetic spread instrument of
+    `tradestrats.backtesting.pairs.spread_frame`. The z-score is the log
+    close minus its rolling mean, divided by its rolling standard deviation.
+    Buys the spread (long y, short x) when the z-score drops below
+    ``-entry_z`` and sells when it recovers above ``exit_z``. With
+    ``exit_z=entry_z`` and the native backend's ``short=True`` the spread is
+    traded in both directions.
+
+    Args:
+        lookback: Bars of the rolling mean and standard deviation. A few
+            times the pair's half-life is a good start.
+        entry_z: Z-score below ``-entry_z`` opens the long spread.
+        exit_z: Z-score above ``exit_z`` closes it.
+    """
+
+    name = "Pair Spread"
+    description = "Buy the pair spread when its z-score is low, sell when it reverts."
+    recommended_timeframe = "1h"
+    recommended_sl_stop = 0.05
+
+    def __init__(self, lookback: int = 100, entry_z: float = 2.0, exit_z: float = 0.0):
+        self.lookback = lookback
+        self.entry_z = entry_z
+        self.exit_z = exit_z
+
+    @property
+    def warmup_bars(self) -> int:
+        return self.lookback
+
+    def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
+        df = data.copy()
+
+        log_close = np.log(df["close"])
+        rolling = log_close.rolling(self.lookback)
+        df["spread_z"] = (log_close - rolling.mean()) / rolling.std(ddof=1)
+
+        df["signal"] = 0
+        df.loc[df["spread_z"] < -self.entry_z, "signal"] = 1
+        df.loc[df["spread_z"] > self.exit_z, "signal"] = -1
+
+        return df
+
+    def signal_array(self, columns: dict[str, np.ndarray]) -> np.ndarray:
+        log_close = np.log(columns["close"])
+        mean, var = rolling_mean_var(log_close, self.lookback, 1)
+        std = np.sqrt(var)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z = (log_close - mean) / std
+        return array_signals(z < -self.entry_z, z > self.exit_z)
+
+    def __repr__(self) -> str:
+        return f"PairSpread(lookback={self.lookback}, entry_z={self.entry_z}, exit_z={self.exit_z})"
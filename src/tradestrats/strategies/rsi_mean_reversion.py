@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 import pandas_ta as ta
 
-from tradestrats.strategies.base import Strategy
+from tradestrats.indicators import kernels
+from tradestrats.strategies.base import Strategy, array_signals, panel_signals
 
 
 class RSIMeanReversion(Strategy):
@@ -40,6 +42,22 @@ class RSIMeanReversion(Strategy):
 
         return df
 
+    def signal_array(self, columns: dict[str, np.ndarray]) -> np.ndarray:
+        rsi = kernels.rsi(columns["close"], self.rsi_period)
+        return array_signals(rsi < self.oversold, rsi > self.overbought)
+
+    def generate_panel_signals(self, panel: pd.DataFrame) -> pd.DataFrame:
+        close = panel["close"]
+
+        # Wilder RSI as in pandas-ta: RMA of gains / losses, column-wise
+        delta = close.diff()
+        alpha = 1.0 / self.rsi_period
+        gain = delta.clip(lower=0).ewm(alpha=alpha, adjust=False).mean()
+        loss = delta.clip(upper=0).ewm(alpha=alpha, adjust=False).mean().abs()
+        rsi = 100 * gain / (gain + loss)
+
+        return panel_signals(rsi < self.oversold, rsi > self.overbought)
+
     def __repr__(self) -> str:
         return (
             f"RSIMeanReversion(period={self.rsi_period}, "
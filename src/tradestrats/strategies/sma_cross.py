@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 import pandas_ta as ta
 
-from tradestrats.strategies.base import Strategy
+from tradestrats.indicators import kernels
+from tradestrats.strategies.base import Strategy, array_signals, panel_signals
 
 
 class SMACrossover(Strategy):
@@ -22,6 +24,10 @@ class SMACrossover(Strategy):
         self.fast_period = fast_period
         self.slow_period = slow_period
 
+    @property
+    def warmup_bars(self) -> int:
+        return max(self.fast_period, self.slow_period)
+
     def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
         df = data.copy()
 
@@ -35,5 +41,16 @@ class SMACrossover(Strategy):
 
         return df
 
+    def signal_array(self, columns: dict[str, np.ndarray]) -> np.ndarray:
+        sma_fast = kernels.sma(columns["close"], self.fast_period)
+        sma_slow = kernels.sma(columns["close"], self.slow_period)
+        return array_signals(sma_fast > sma_slow, sma_fast < sma_slow)
+
+    def generate_panel_signals(self, panel: pd.DataFrame) -> pd.DataFrame:
+        close = panel["close"]
+        sma_fast = close.rolling(self.fast_period).mean()
+        sma_slow = close.rolling(self.slow_period).mean()
+        return panel_signals(sma_fast > sma_slow, sma_fast < sma_slow)
+
     def __repr__(self) -> str:
         return f"SMACrossover(fast={self.fast_period}, slow={self.slow_period})"
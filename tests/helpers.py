@@ -0,0 +1,48 @@
+"""Data builders shared by several test modules."""
+
+import numpy as np
+import pandas as pd
+
+# Batch job spec over symbols served by `fake_loader`
+BATCH_SPEC = {
+    "symbols": ["AAA/USDT", "BBB/USDT"],
+    "strategies": ["sma", "rsi"],
+    "timeframes": ["1h"],
+    "ranges": [["2024-01-01", "2024-01-20"], ["2024-01-10", None]],
+    "fees": 0.001,
+}
+
+LOADS: list[tuple] = []  # calls of `fake_loader` in this process
+
+
+def fake_loader(symbol, timeframe, start, end, exchange_id):
+    """Deterministic random-walk candles per symbol, cut to the requested span."""
+    LOADS.append((symbol, timeframe, start, end))
+    if symbol == "BROKEN/USDT":
+        raise ValueError("exchange unavailable")
+    rng = np.random.default_rng(sum(map(ord, symbol)))
+    closes = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.01, 1000)))
+    data = pd.DataFrame(
+        {"open": closes, "high": closes * 1.01, "low": closes * 0.99, "close": closes, "volume": 1.0},
+        index=pd.date_range("2024-01-01", periods=1000, freq="1h", tz="UTC"),
+    )
+    data = data[data.index >= pd.Timestamp(start, tz="UTC")]
+    return data if end is None else data[data.index <= pd.Timestamp(end, tz="UTC")]
+
+
+def make_ohlcv(n: int = 3000, seed: int = 0, freq: str = "1h") -> pd.DataFrame:
+    """Random-walk OHLCV with distinct open/high/low so OHLC stops trigger."""
+    rng = np.random.default_rng(seed)
+    closes = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    opens = np.concatenate([[100.0], closes[:-1]]) * np.exp(rng.normal(0, 0.002, n))
+    spread = np.abs(rng.normal(0, 0.005, n))
+    return pd.DataFrame(
+        {
+            "open": opens,
+            "high": np.maximum(opens, closes) * (1 + spread),
+            "low": np.minimum(opens, closes) * (1 - spread),
+            "close": closes,
+            "volume": 1.0,
+        },
+        index=pd.date_range("2024-01-01", periods=n, freq=freq, tz="UTC"),
+    )
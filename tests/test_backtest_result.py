@@ -0,0 +1,85 @@
+"""Tests for cached one-pass BacktestResult metrics."""
+
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradestrats.backtesting import engine
+from tradestrats.data.panel import build_panel
+from tradestrats.strategies.sma_cross import SMACrossover
+
+METRICS = ("total_return", "sharpe_ratio", "max_drawdown", "win_rate", "final_value")
+
+
+def _make_ohlcv(n: int = 800, seed: int = 0, start: str = "2024-01-01") -> pd.DataFrame:
+    """Build a random-walk OHLCV DataFrame with hourly candles."""
+    rng = np.random.default_rng(seed)
+    closes = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    return pd.DataFrame(
+        {"open": closes, "high": closes * 1.01, "low": closes * 0.99, "close": closes, "volume": 1.0},
+        index=pd.date_range(start, periods=n, freq="1h"),
+    )
+
+
+def test_metrics_match_vectorbt():
+    result = engine.run(SMACrossover(5, 20), _make_ohlcv())
+    pf = result.portfolio
+    summary = result.summary()
+
+    assert summary["total_return"] == pytest.approx(pf.total_return())
+    assert summary["sharpe_ratio"] == pytest.approx(pf.sharpe_ratio())
+    assert summary["max_drawdown"] == pytest.approx(pf.max_drawdown())
+    assert summary["win_rate"] == pytest.approx(pf.trades.win_rate())
+    assert summary["final_value"] == pytest.approx(pf.final_value())
+    assert summary["total_trades"] == pf.trades.count()
+
+
+def test_multi_column_metrics_match_vectorbt():
+    """Panel results (including a symbol with late data) give per-symbol Series."""
+    panel = build_panel({"AAA": _make_ohlcv(seed=1), "BBB": _make_ohlcv(600, seed=2, start="2024-01-09 08:00")})
+    result = engine.run_panel(SMACrossover(5, 20), panel)
+    pf = result.portfolio
+
+    expected = {
+        "total_return": pf.total_return(),
+        "sharpe_ratio": pf.sharpe_ratio(),
+        "max_drawdown": pf.max_drawdown(),
+        "win_rate": pf.trades.win_rate(),
+        "final_value": pf.final_value(),
+    }
+    for metric in METRICS:
+        value = getattr(result, metric)
+        assert list(value.index) == ["AAA", "BBB"]
+        np.testing.assert_allclose(value, expected[metric])
+    assert list(result.total_trades) == list(pf.trades.count())
+
+
+def test_summary_is_cached():
+    result = engine.run(SMACrossover(5, 20), _make_ohlcv())
+    first = result.summary()
+    assert result.metrics is not None
+    assert result.equity_curve is result.equity_curve
+
+    first["total_return"] = 123.0  # summary() hands out copies
+    assert result.summary()["total_return"] != 123.0
+
+
+def test_compact_result_keeps_metrics_only():
+    result = engine.run(SMACrossover(5, 20), _make_ohlcv())
+    compact = result.compact()
+
+    assert compact.portfolio is None and compact.signals is None
+    assert compact.summary() == result.summary()
+    assert len(pickle.dumps(compact)) < 1000
+    with pytest.raises(ValueError, match="keep_equity"):
+        compact.equity_curve
+
+    with_equity = result.compact(keep_equity=True)
+    assert with_equity.equity_curve.equals(result.equity_curve)
+
+
+def test_result_without_metrics_or_portfolio_raises():
+    with pytest.raises(ValueError, match="precomputed metrics"):
+        engine.BacktestResult(portfolio=None, signals=None).summary()
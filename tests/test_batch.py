@@ -0,0 +1,72 @@
+"""Tests for the batch backtest runner."""
+
+import pandas as pd
+import pytest
+
+from tradestrats.backtesting import engine
+from tradestrats.backtesting.batch import expand_jobs, finished_keys, run_batch
+from tradestrats.backtesting.store import ResultStore
+from tradestrats.strategies.sma_cross import SMACrossover
+from tests.helpers import BATCH_SPEC, LOADS, fake_loader
+
+
+def test_expand_jobs_builds_matrix():
+    jobs = expand_jobs(BATCH_SPEC)
+    assert len(jobs) == 2 * 2 * 1 * 2
+    assert len({job.key for job in jobs}) == len(jobs)
+    assert {job.dataset for job in jobs} == {("binance", "AAA/USDT", "1h"), ("binance", "BBB/USDT", "1h")}
+
+    with pytest.raises(ValueError, match="Unknown strategies"):
+        expand_jobs({**BATCH_SPEC, "strategies": ["nope"]})
+
+
+def test_run_batch_loads_each_dataset_once(tmp_path):
+    LOADS.clear()
+    seen = []
+    results = run_batch(
+        BATCH_SPEC, tmp_path / "results.csv", max_workers=1, progress=lambda d, t, row: seen.append(d), loader=fake_loader,
+    )
+
+    assert len(LOADS) == 2  # one load per symbol for both date ranges
+    assert seen == list(range(1, 9))
+    assert len(results) == 8 and results["error"].isna().all()
+
+    # Rows equal a direct backtest on the sliced data
+    row = results[(results["symbol"] == "AAA/USDT") & (results["strategy"] == "sma") & (results["start"] == "2024-01-01")]
+    window = fake_loader("AAA/USDT", "1h", "2024-01-01", "2024-01-20", "binance")
+    expected = engine.run(SMACrossover(), window, fees=0.001, sl_stop=SMACrossover.recommended_sl_stop)
+    assert row["total_return"].iloc[0] == pytest.approx(expected.total_return)
+    assert row["bars"].iloc[0] == len(window)
+
+
+def test_restart_skips_finished_jobs(tmp_path):
+    path = tmp_path / "results.csv"
+    spec = {**BATCH_SPEC, "symbols": ["AAA/USDT", "BROKEN/USDT"]}
+    first = run_batch(spec, path, max_workers=1, loader=fake_loader)
+    assert first["error"].notna().sum() == 4
+    assert len(finished_keys(path)) == 4
+
+    LOADS.clear()
+    again = run_batch(spec, path, max_workers=1, loader=fake_loader)
+    assert [load[0] for load in LOADS] == ["BROKEN/USDT"]  # only failed jobs are retried
+    assert len(again) == 8
+
+    run_batch(spec, path, max_workers=1, restart=False, loader=fake_loader)
+    assert len(pd.read_csv(path)) == 8
+
+
+def test_run_batch_on_process_pool(tmp_path):
+    results = run_batch(BATCH_SPEC, tmp_path / "results.csv", max_workers=2, loader=fake_loader)
+    assert len(results) == 8
+    assert results["error"].isna().all()
+
+
+def test_batch_fills_result_store(tmp_path):
+    store = ResultStore(tmp_path / "results.sqlite")
+    first = run_batch(BATCH_SPEC, tmp_path / "a.csv", max_workers=1, loader=fake_loader, store_path=store.path)
+    assert len(store) == 8
+
+    # A fresh results file reuses the stored runs with identical metrics
+    again = run_batch(BATCH_SPEC, tmp_path / "b.csv", max_workers=1, loader=fake_loader, store_path=store.path)
+    assert len(store) == 8
+    pd.testing.assert_series_equal(again["sharpe_ratio"], first["sharpe_ratio"])
@@ -0,0 +1,95 @@
+"""Tests for chunked, memory-bounded backtests."""
+
+import tracemalloc
+
+import pandas as pd
+import pytest
+
+from tradestrats.backtesting import engine, simulator
+from tradestrats.backtesting.chunked import iter_parquet, min_overlap, run_chunked
+from tradestrats.strategies.box_theory import BoxTheory
+from tradestrats.strategies.rsi_mean_reversion import RSIMeanReversion
+from tradestrats.strategies.sma_cross import SMACrossover
+from tests.helpers import make_ohlcv
+
+
+def _assert_same(chunked, single):
+    pd.testing.assert_frame_equal(chunked.trades, single.trades)
+    pd.testing.assert_series_equal(chunked.equity_curve, single.equity_curve)
+    assert chunked.summary() == pytest.approx(single.summary(), rel=1e-9)
+
+
+@pytest.mark.parametrize("strategy", [SMACrossover(10, 40), RSIMeanReversion()])
+def test_chunked_equals_single_shot(strategy):
+    data = make_ohlcv()
+    kwargs = {"sl_stop": 0.02, "tp_stop": 0.04, "sl_trail": True}
+    single = simulator.run(strategy, data, **kwargs)
+    chunked = run_chunked(strategy, data, chunk_size=250, overlap=200, keep_equity=True, **kwargs)
+    _assert_same(chunked, single)
+
+
+def test_state_carries_across_tiny_chunks():
+    """Shorts and pending limit orders survive chunk boundaries of a few bars."""
+    data = make_ohlcv(1500, seed=4)
+    kwargs = {"short": True, "limit_offset": 0.002, "limit_tif": 3, "sl_stop": 0.03}
+    single = simulator.run(SMACrossover(5, 20), data, **kwargs)
+    chunked = run_chunked(SMACrossover(5, 20), data, chunk_size=7, overlap=40, keep_equity=True, **kwargs)
+    _assert_same(chunked, single)
+    assert (single.trades["direction"] == -1).any()
+
+
+def test_stream_from_parquet_and_engine_option(tmp_path):
+    data = make_ohlcv(2000, seed=2)
+    path = tmp_path / "ohlcv.parquet"
+    data.to_parquet(path, row_group_size=300)
+
+    single = simulator.run(SMACrossover(10, 40), data, warmup=100)
+    via_engine = engine.run(SMACrossover(10, 40), data, backend="native", chunk_size=333, warmup=100)
+    _assert_same(via_engine, single)
+
+    streamed = run_chunked(SMACrossover(10, 40), iter_parquet(path, chunk_size=256), overlap=100)
+    full = simulator.run(SMACrossover(10, 40), data)
+    assert streamed.equity is None
+    pd.testing.assert_frame_equal(streamed.trades, full.trades)
+    assert streamed.summary() == pytest.approx(full.summary(), rel=1e-9)
+
+    with pytest.raises(ValueError, match="warmup requires a DataFrame"):
+        run_chunked(SMACrossover(), iter_parquet(path), warmup=10)
+    with pytest.raises(ValueError, match="require backend='native'"):
+        engine.run(SMACrossover(), data, chunk_size=100)
+
+
+def test_informative_timeframe_sets_the_minimum_overlap():
+    # 20 days of 1m bars: each chunk must carry two full days to rebuild the previous-day box
+    data = make_ohlcv(20 * 1440, seed=6, freq="1min")
+    strategy = BoxTheory()
+    assert min_overlap(strategy, pd.Timedelta("1min")) == 2880
+    assert min_overlap(SMACrossover(10, 40), pd.Timedelta("1min")) == 40
+
+    single = simulator.run(strategy, data, sl_stop=0.02)
+    chunked = run_chunked(strategy, data, chunk_size=5_000, sl_stop=0.02, keep_equity=True)
+    _assert_same(chunked, single)
+    assert len(single.trades) > 10
+
+    with pytest.raises(ValueError, match="at least 2880 bars"):
+        run_chunked(strategy, data, chunk_size=5_000, overlap=1_000)
+    with pytest.raises(ValueError, match="at least 40 bars"):
+        run_chunked(SMACrossover(10, 40), data.iloc[:500], chunk_size=100, overlap=20)
+
+
+def test_peak_memory_bounded_by_chunk_size():
+    data = make_ohlcv(100_000, freq="1min")
+    strategy = SMACrossover(5, 20)
+    run_chunked(strategy, data.iloc[:2000], chunk_size=500)  # compile outside the measurement
+
+    def _peak(fn):
+        tracemalloc.start()
+        try:
+            fn()
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    single = _peak(lambda: simulator.run(strategy, data))
+    chunked = _peak(lambda: run_chunked(strategy, data, chunk_size=5_000, overlap=100))
+    assert chunked < single / 3
@@ -0,0 +1,93 @@
+"""Tests for cross-sectional universe strategies."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradestrats.backtesting.portfolio import run_portfolio
+from tradestrats.data.panel import build_panel
+from tradestrats.strategies.cross_sectional import (
+    CrossSectionalMomentum,
+    VolAdjustedMomentum,
+    rank_rows,
+    rebalance_mask,
+    top_k_mask,
+    trailing_volatility,
+)
+
+
+@pytest.fixture(scope="module")
+def panel():
+    rng = np.random.default_rng(3)
+    frames = {}
+    index = pd.date_range("2024-01-01", periods=24 * 60, freq="1h", tz="UTC")
+    for i, symbol in enumerate(["AAA", "BBB", "CCC", "DDD", "EEE", "FFF"]):
+        drift = (i - 2.5) * 2e-4
+        closes = 100.0 * np.exp(np.cumsum(rng.normal(drift, 0.01, len(index))))
+        frame = pd.DataFrame(
+            {"open": closes, "high": closes * 1.002, "low": closes * 0.998, "close": closes, "volume": 1.0},
+            index=index,
+        )
+        frames[symbol] = frame.iloc[24 * 10:] if symbol == "FFF" else frame  # listed later
+    return build_panel(frames)
+
+
+def test_top_k_and_ranks():
+    scores = np.array([[3.0, np.nan, 1.0, 5.0, 2.0], [np.nan, np.nan, 1.0, np.nan, np.nan]])
+    selected = top_k_mask(scores, 2)
+    assert selected.tolist() == [[True, False, False, True, False], [False, False, True, False, False]]
+    assert top_k_mask(scores, 10).sum() == 5
+
+    ranks = rank_rows(scores)
+    np.testing.assert_allclose(ranks[0], [2 / 3, np.nan, 0.0, 1.0, 1 / 3])
+    np.testing.assert_allclose(ranks[1], [np.nan, np.nan, 1.0, np.nan, np.nan])
+
+
+def test_rebalance_mask():
+    index = pd.date_range("2024-01-01 22:00", periods=30, freq="1h", tz="UTC")
+    assert np.flatnonzero(rebalance_mask(index, 12)).tolist() == [0, 12, 24]
+    assert np.flatnonzero(rebalance_mask(index, "1D")).tolist() == [0, 2, 26]
+    weekly = rebalance_mask(pd.date_range("2024-01-01", periods=20, freq="1D"), "W")
+    assert np.flatnonzero(weekly).tolist() == [0, 7, 14]
+    with pytest.raises(ValueError, match="at least one bar"):
+        rebalance_mask(index, 0)
+
+
+def test_momentum_holds_top_k_between_rebalances(panel):
+    strategy = CrossSectionalMomentum(lookback=48, top_k=2, rebalance="1D")
+    held = strategy.holdings(panel)
+    close = panel["close"]
+
+    # Nothing is held before the first full lookback; then exactly two symbols
+    assert not held.iloc[:48].to_numpy().any()
+    assert (held.iloc[48:].sum(axis=1) == 2).all()
+    # FFF has no candles for the first ten days and is never picked there
+    assert not held["FFF"].iloc[:24 * 12].any()
+
+    # Picks change only on rebalance bars and equal the best trailing returns
+    changes = held.ne(held.shift()).any(axis=1).to_numpy()
+    assert not changes[~rebalance_mask(panel.index, "1D")][1:].any()
+    day = 24 * 30
+    expected = (close.iloc[day] / close.iloc[day - 48] - 1).nlargest(2).index
+    assert set(held.columns[held.iloc[day]]) == set(expected)
+
+    signals = strategy.generate_panel_signals(panel)
+    assert signals.dtypes.eq(np.int8).all()
+    assert set(np.unique(signals.to_numpy())) == {-1, 1}
+    with pytest.raises(ValueError, match="multi-symbol panel"):
+        strategy.generate_signals(panel.xs("AAA", axis=1, level="symbol"))
+
+
+def test_vol_adjusted_momentum_and_portfolio(panel):
+    close = panel["close"]
+    rows = np.array([10, 100, 500])
+    expected = close.pct_change(fill_method=None).rolling(24).std().to_numpy()[rows]
+    np.testing.assert_allclose(trailing_volatility(close.to_numpy(), rows, 24), expected, rtol=1e-8)
+
+    strategy = VolAdjustedMomentum(lookback=72, top_k=3, rebalance=24)
+    result = run_portfolio(strategy, panel, max_positions=strategy.top_k, sl_stop=None)
+    assert result.total_trades > 0
+    held = strategy.holdings(panel)
+    # Never more than top_k positions at once
+    assert (result.portfolio.assets().ne(0).sum(axis=1) <= 3).all()
+    assert held.sum(axis=1).max() == 3
@@ -0,0 +1,119 @@
+"""Tests for composable strategy expressions."""
+
+import numpy as np
+import pandas as pd
+import pandas_ta as ta
+import pytest
+
+from tradestrats.backtesting import engine
+from tradestrats.strategies.composite import rsi_bollinger
+from tradestrats.strategies.expr import Evaluator, Expr, ExprStrategy, col, family_signals, ind
+from tradestrats.strategies.rsi_mean_reversion import RSIMeanReversion
+
+
+def _make_ohlcv(n: int = 200, seed: int = 0) -> pd.DataFrame:
+    """Build a random-walk OHLCV DataFrame with hourly candles."""
+    rng = np.random.default_rng(seed)
+    closes = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    return pd.DataFrame(
+        {
+            "open": closes,
+            "high": closes * 1.01,
+            "low": closes * 0.99,
+            "close": closes,
+            "volume": rng.uniform(50, 150, n),
+        },
+        index=pd.date_range("2024-01-01", periods=n, freq="1h"),
+    )
+
+
+def test_expression_matches_builtin_strategy():
+    """An RSI expression strategy must reproduce RSIMeanReversion."""
+    data = _make_ohlcv()
+    rsi = ind("rsi", length=14)
+    strategy = ExprStrategy(entry=rsi < 30, exit=rsi > 70)
+
+    expected = RSIMeanReversion().generate_signals(data)["signal"]
+    np.testing.assert_array_equal(strategy.generate_signals(data)["signal"], expected)
+
+
+def test_identical_subexpressions_evaluated_once():
+    """Equal nodes and default-equivalent indicator params are deduplicated."""
+    data = _make_ohlcv()
+    ev = Evaluator(data)
+    a = ind("rsi") < 30
+    b = ind("rsi", length=14) < 30
+
+    ev.evaluate(a & b)
+
+    # rsi, const 30, comparison, and-node
+    assert ev.n_evaluated == 4
+    assert len(ev._indicators) == 1
+
+
+def test_multi_output_indicator_shared():
+    """Lower and upper bands come from a single bbands computation."""
+    data = _make_ohlcv()
+    ev = Evaluator(data)
+    close = col("close")
+    ev.evaluate((close < ind("bbands", "BBL", length=20)) | (close > ind("bbands", "BBU", length=20)))
+
+    assert len(ev._indicators) == 1
+    lower = ev.evaluate(ind("bbands", "BBL", length=20))
+    np.testing.assert_allclose(lower, ta.bbands(data["close"], length=20).iloc[:, 0], equal_nan=True)
+
+
+def test_crossover():
+    """crossed_above is True only on the bar where the order flips."""
+    data = _make_ohlcv(6)
+    data["close"] = [1.0, 2.0, 3.0, 2.0, 1.0, 3.0]
+    ev = Evaluator(data)
+
+    crossed = ev.evaluate(col("close").crossed_above(2.5))
+    np.testing.assert_array_equal(crossed, [False, False, True, False, False, True])
+
+
+def test_expressions_have_no_truth_value():
+    """Using `and`/`or` instead of `&`/`|` must fail loudly."""
+    with pytest.raises(TypeError):
+        bool(ind("rsi") < 30)
+
+
+def test_incomplete_nodes_fail_on_creation():
+    class Incomplete(Expr):
+        @property
+        def key(self):
+            return ("incomplete",)
+
+    with pytest.raises(TypeError, match="abstract"):
+        Incomplete()
+
+
+def test_family_signals_and_engine():
+    """A family evaluates in one pass and each member runs through engine.run."""
+    data = _make_ohlcv()
+    family = {f"rsi<{t}": ExprStrategy(entry=ind("rsi") < t, exit=ind("rsi") > 70) for t in (25, 30, 35)}
+    signals = family_signals(family, data)
+
+    assert list(signals.columns) == list(family)
+    assert (signals["rsi<35"] == 1).sum() >= (signals["rsi<25"] == 1).sum()
+
+    result = engine.run(rsi_bollinger(), data)
+    assert {"RSI_14", "BBL_20_2.0_2.0", "signal"} <= set(result.signals.columns)
+
+
+def test_runs_through_the_array_signal_paths():
+    """Composite strategies use generate_signals wherever the engine takes the fast path."""
+    data = _make_ohlcv(600)
+    strategy = rsi_bollinger()
+    reference = engine.run(strategy, data)
+
+    assert engine.run(strategy, data, fast=True).summary() == pytest.approx(reference.summary())
+    native = engine.run(strategy, data, backend="native")
+    chunked = engine.run(strategy, data, backend="native", chunk_size=150)
+    pd.testing.assert_frame_equal(chunked.trades, native.trades)
+
+    entries = [ind("rsi") < 30, ind("rsi") < 40]
+    grid = engine.optimize(ExprStrategy, data, {"entry": entries, "exit": [ind("rsi") > 70]})
+    single = engine.run(ExprStrategy(entries[1], ind("rsi") > 70), data)
+    assert grid["total_return"].iloc[1] == pytest.approx(single.total_return)
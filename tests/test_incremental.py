@@ -0,0 +1,84 @@
+"""Tests for incremental backtest updates."""
+
+import pandas as pd
+import pytest
+
+from tradestrats.backtesting import simulator
+from tradestrats.backtesting.incremental import run_incremental
+from tradestrats.strategies.box_theory import BoxTheory
+from tradestrats.strategies.sma_cross import SMACrossover
+from tests.helpers import make_ohlcv
+
+KWARGS = {"sl_stop": 0.02, "tp_stop": 0.04, "sl_trail": True}
+
+
+class _CountingSMA(SMACrossover):
+    """SMA crossover that records how many bars each signal pass sees."""
+
+    seen: list[int] = []
+
+    def generate_signals(self, data):
+        _CountingSMA.seen.append(len(data))
+        return super().generate_signals(data)
+
+
+def test_updates_match_full_rerun(tmp_path):
+    data = make_ohlcv(3000, seed=5)
+    path = tmp_path / "sma.pkl"
+    _CountingSMA.seen = []
+
+    for end in (2000, 2003, 2500, 3000):
+        result = run_incremental(_CountingSMA(10, 40), data.iloc[:end], path, overlap=200, keep_equity=True, **KWARGS)
+        full = simulator.run(SMACrossover(10, 40), data.iloc[:end], **KWARGS)
+        pd.testing.assert_frame_equal(result.trades, full.trades)
+        pd.testing.assert_series_equal(result.equity_curve, full.equity_curve)
+        assert result.summary() == pytest.approx(full.summary(), rel=1e-9)
+
+    # After the first run only overlap + new bars are processed
+    assert _CountingSMA.seen[0] == 2000
+    assert _CountingSMA.seen[1:] == [203, 697, 700]
+
+
+def test_no_new_bars_reuses_checkpoint(tmp_path):
+    data = make_ohlcv(1000, seed=1)
+    path = tmp_path / "sma.pkl"
+    first = run_incremental(_CountingSMA(10, 40), data, path, **KWARGS)
+
+    _CountingSMA.seen = []
+    again = run_incremental(_CountingSMA(10, 40), data, path, **KWARGS)
+    assert _CountingSMA.seen == []
+    assert again.summary() == first.summary()
+    assert again.equity is None
+
+
+def test_full_run_on_changed_settings_or_history(tmp_path):
+    data = make_ohlcv(1500, seed=2)
+    path = tmp_path / "sma.pkl"
+    run_incremental(_CountingSMA(10, 40), data.iloc[:1000], path, **KWARGS)
+
+    # Other stop-loss: the checkpoint does not apply
+    _CountingSMA.seen = []
+    changed = run_incremental(_CountingSMA(10, 40), data.iloc[:1200], path, **{**KWARGS, "sl_stop": 0.05})
+    assert _CountingSMA.seen == [1200]
+    expected = simulator.run(SMACrossover(10, 40), data.iloc[:1200], **{**KWARGS, "sl_stop": 0.05})
+    assert changed.summary() == pytest.approx(expected.summary(), rel=1e-9)
+
+    # Revised last candle: recompute from scratch
+    revised = data.copy()
+    revised.iloc[1199, revised.columns.get_loc("close")] *= 1.01
+    _CountingSMA.seen = []
+    run_incremental(_CountingSMA(10, 40), revised, path, **{**KWARGS, "sl_stop": 0.05})
+    assert _CountingSMA.seen == [1500]
+
+
+def test_informative_strategy_updates_with_derived_overlap(tmp_path):
+    data = make_ohlcv(6 * 1440, seed=3, freq="1min")
+    path = tmp_path / "box.pkl"
+    for end in (4 * 1440, 6 * 1440):
+        result = run_incremental(BoxTheory(), data.iloc[:end], path, **KWARGS)
+        full = simulator.run(BoxTheory(), data.iloc[:end], **KWARGS)
+        pd.testing.assert_frame_equal(result.trades, full.trades)
+        assert result.summary() == pytest.approx(full.summary(), rel=1e-9)
+
+    with pytest.raises(ValueError, match="too short"):
+        run_incremental(BoxTheory(), data, tmp_path / "short.pkl", overlap=1_000, **KWARGS)
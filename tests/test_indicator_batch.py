@@ -0,0 +1,77 @@
+"""Tests for batch multi-indicator computation."""
+
+import numpy as np
+import pandas as pd
+import pandas_ta as ta
+import pytest
+
+from tradestrats.data.panel import build_panel
+from tradestrats.indicators.batch import compute_indicators
+
+
+def _make_ohlcv(n: int, start: str = "2024-01-01", seed: int = 0) -> pd.DataFrame:
+    """Build a random-walk OHLCV DataFrame with hourly candles."""
+    rng = np.random.default_rng(seed)
+    closes = 100.0 + np.cumsum(rng.normal(0, 1, n))
+    return pd.DataFrame(
+        {
+            "open": closes,
+            "high": closes * 1.01,
+            "low": closes * 0.99,
+            "close": closes,
+            "volume": rng.uniform(50, 150, n),
+        },
+        index=pd.date_range(start, periods=n, freq="1h"),
+    )
+
+
+def test_single_frame_matches_pandas_ta():
+    """Batch results must equal the individual pandas-ta calls."""
+    data = _make_ohlcv(100)
+    result = compute_indicators(data, ["rsi", ("sma", {"length": 20}), ("atr", {"length": 10})])
+
+    np.testing.assert_allclose(result["RSI_14"], ta.rsi(data["close"]), equal_nan=True)
+    np.testing.assert_allclose(result["SMA_20"], ta.sma(data["close"], length=20), equal_nan=True)
+    expected_atr = ta.atr(data["high"], data["low"], data["close"], length=10)
+    np.testing.assert_allclose(result["ATRr_10"], expected_atr, equal_nan=True)
+    assert result.index.equals(data.index)
+
+
+def test_default_params_are_deduplicated():
+    """Specs that only differ by spelled-out defaults should yield one column."""
+    data = _make_ohlcv(60)
+    result = compute_indicators(data, ["rsi", ("rsi", {}), ("rsi", {"length": 14})], max_workers=1)
+
+    assert list(result.columns) == ["RSI_14"]
+
+
+def test_clashing_output_columns_raise():
+    """Different specs may not silently share an output column."""
+    data = _make_ohlcv(60)
+    # zscore needs length > 1; pandas-ta falls back to its default of 30
+    with pytest.raises(ValueError, match="both produce column 'ZS_30'"):
+        compute_indicators(data, ["zscore", ("zscore", {"length": 1})], max_workers=1)
+
+
+def test_multi_output_indicator_expands_columns():
+    """DataFrame-valued indicators contribute all of their columns."""
+    data = _make_ohlcv(60)
+    result = compute_indicators(data, [("bbands", {"length": 20})])
+
+    assert {"BBL_20_2.0_2.0", "BBM_20_2.0_2.0", "BBU_20_2.0_2.0"} <= set(result.columns)
+
+
+def test_panel_with_misaligned_histories():
+    """Panel results are per-symbol and NaN where a symbol has no history."""
+    long = _make_ohlcv(80, seed=1)
+    short = _make_ohlcv(40, start="2024-01-02 16:00", seed=2)
+    panel = build_panel({"BTC/USDT": long, "ETH/USDT": short})
+
+    result = compute_indicators(panel, [("sma", {"length": 5})])
+
+    assert list(result.columns) == [("SMA_5", "BTC/USDT"), ("SMA_5", "ETH/USDT")]
+    eth = result[("SMA_5", "ETH/USDT")]
+    assert eth.loc[: short.index[0] - pd.Timedelta("1h")].isna().all()
+    np.testing.assert_allclose(
+        eth.loc[short.index].to_numpy(), ta.sma(short["close"], length=5).to_numpy(), equal_nan=True,
+    )
@@ -0,0 +1,93 @@
+"""Tests for the indicator catalog and registry dispatch."""
+
+import pandas as pd
+import pandas_ta as ta
+import pytest
+
+from tradestrats.indicators import catalog
+from tradestrats.indicators import registry
+from tradestrats.indicators.batch import compute_indicators
+from tradestrats.indicators.registry import get_indicator, list_indicators
+
+
+def _make_ohlcv(n: int = 60) -> pd.DataFrame:
+    """Build a deterministic OHLCV DataFrame with a zig-zag close."""
+    closes = [100.0 + (i % 7) * 1.5 - (i % 3) for i in range(n)]
+    return pd.DataFrame(
+        {
+            "open": closes,
+            "high": [c * 1.01 for c in closes],
+            "low": [c * 0.99 for c in closes],
+            "close": closes,
+            "volume": [100.0 + i for i in range(n)],
+        },
+        index=pd.date_range("2024-01-01", periods=n, freq="1h"),
+    )
+
+
+def test_catalog_inputs_from_signature():
+    """The catalog should learn each indicator's OHLCV inputs from its signature."""
+    cat = catalog.get_catalog()
+
+    assert cat["rsi"].inputs == ("close",)
+    assert cat["atr"].inputs == ("high", "low", "close")
+    assert cat["mfi"].inputs == ("high", "low", "close", "volume")
+    assert "open" in cat["ad"].optional_inputs
+
+
+def test_catalog_default_params():
+    """Defaults resolved in the indicator body should be recorded."""
+    cat = catalog.get_catalog()
+
+    assert cat["rsi"].params["length"] == 14
+    assert cat["bbands"].params["lower_std"] == 2.0
+    assert cat["macd"].params["slow"] == 26
+    # v_lowerbound(length, 2, 30): the second argument is the bound, not the default
+    assert cat["zscore"].params["length"] == 30
+
+
+def test_bounded_default_keeps_explicit_params():
+    """A value equal to a validator's bound is not mistaken for the default."""
+    assert registry.canonical_spec("zscore", {"length": 1}) == ("zscore", (("length", 1),))
+    assert registry.canonical_spec("zscore", {"length": 30}) == ("zscore", ())
+    frame = compute_indicators(_make_ohlcv(), [("zscore", {}), ("zscore", {"length": 30}), ("zscore", {"length": 5})])
+    assert list(frame.columns) == ["ZS_30", "ZS_5"]
+
+
+def test_catalog_disk_roundtrip(tmp_path):
+    """A saved catalog should load back identical without re-introspection."""
+    path = tmp_path / "catalog.json"
+    built = catalog.get_catalog(refresh=True, path=path)
+
+    assert path.exists()
+    assert catalog.load_catalog(path) == built
+
+
+def test_get_indicator_dispatches_hlc_inputs():
+    """ATR must receive high/low/close rather than close only."""
+    data = _make_ohlcv()
+    result = get_indicator("atr", data, length=14)
+    expected = ta.atr(data["high"], data["low"], data["close"], length=14)
+
+    pd.testing.assert_series_equal(result, expected)
+
+
+def test_get_indicator_missing_columns():
+    """Indicators needing absent columns should raise a clear ValueError."""
+    data = _make_ohlcv()[["close"]]
+    with pytest.raises(ValueError, match="requires columns"):
+        get_indicator("atr", data)
+
+
+def test_get_indicator_unknown():
+    """Unknown indicator names should raise ValueError."""
+    with pytest.raises(ValueError, match="Unknown indicator"):
+        get_indicator("does_not_exist", _make_ohlcv())
+
+
+def test_list_indicators_by_category():
+    """Listing should come from the catalog and support category filters."""
+    assert "rsi" in list_indicators()
+    overlap = list_indicators("overlap")
+    assert "sma" in overlap
+    assert "rsi" not in overlap
@@ -0,0 +1,119 @@
+"""Tests for cache compaction and integrity checks."""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+from tradestrats import cli
+from tradestrats.data.maintenance import check_frame, compact_cache, compact_file, verify_cache, verify_file
+from tests.helpers import make_ohlcv
+
+NOW = pd.Timestamp("2024-03-01 12:30", tz="UTC")
+
+
+def _fragmented_cache(path, n=2000, seed=0):
+    """Cache file as repeated incremental fetches leave it: overlapping, unsorted fragments."""
+    data = make_ohlcv(n, seed=seed, freq="1h")
+    data.index.name = "timestamp"
+    revised = data.iloc[n - 300:].copy()
+    revised[["high", "close"]] *= 1.001  # later fetches revise the overlapping candles
+    fragments = pd.concat([data.iloc[n - 500:], data.iloc[:n - 500], revised])
+    fragments.to_parquet(path, row_group_size=100)
+    return data, revised
+
+
+def test_check_frame_counts_each_issue():
+    df = make_ohlcv(10, freq="1h")
+    df.iloc[2, df.columns.get_loc("high")] = df["low"].iloc[2] * 0.9    # high below low
+    df.iloc[4, df.columns.get_loc("close")] = np.nan
+    df.iloc[5, df.columns.get_loc("open")] = -1.0
+    df.iloc[6, df.columns.get_loc("volume")] = -5.0
+    df = pd.concat([df, df.iloc[[7]], df.iloc[[1]]])                   # duplicate + out of order
+
+    issues = check_frame(df, pd.Timedelta("1h"), now=df.index.max() + pd.Timedelta("30min"))
+    assert issues == {
+        "unsorted": 2,
+        "duplicates": 2,
+        "nan_prices": 1,
+        "non_positive": 1,
+        "ohlc_violations": 2,  # high below low, negative open below the low
+        "negative_volume": 1,
+        "partial_last": 1,
+    }
+
+
+def test_compact_file_sorts_dedups_and_drops_partial_candle(tmp_path):
+    path = tmp_path / "binance_BTC_USDT_1h.parquet"
+    data, revised = _fragmented_cache(path)
+    now = data.index[-1] + pd.Timedelta("20min")  # the newest candle is still open
+
+    report = compact_file(path, now=now)
+    assert report["rows_before"] == 2300 and report["duplicates"] == 300
+    assert report["partial_dropped"] == 1 and report["rows_after"] == 1999
+    assert report["row_groups_before"] == 23 and report["row_groups_after"] == 1
+    assert report["bytes_after"] < report["bytes_before"]
+
+    compacted = pd.read_parquet(path)
+    expected = pd.concat([data.iloc[:-300], revised]).iloc[:-1]
+    pd.testing.assert_frame_equal(compacted, expected, check_freq=False)
+    assert verify_file(path, now=now)["ok"]
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_partial_candle_is_judged_at_fetch_time(tmp_path):
+    # An old file fetched while its last candle was open: still partial today
+    path = tmp_path / "binance_ETH_USDT_1h.parquet"
+    data = make_ohlcv(300, seed=3, freq="1h")
+    data.index.name = "timestamp"
+    data.to_parquet(path)
+    fetched = data.index[-1] + pd.Timedelta("10min")
+    os.utime(path, (fetched.timestamp(), fetched.timestamp()))
+
+    assert verify_file(path)["partial_last"] == 1
+    assert compact_file(path, dry_run=True)["partial_dropped"] == 1
+
+    # Fetched after the candle closed: complete, however old the file is
+    closed = data.index[-1] + pd.Timedelta("1h")
+    os.utime(path, (closed.timestamp(), closed.timestamp()))
+    assert verify_file(path)["ok"]
+    assert compact_file(path, dry_run=True)["partial_dropped"] == 0
+
+
+def test_parallel_verify_and_compact_over_many_files(tmp_path):
+    paths = [tmp_path / f"binance_{symbol}_USDT_1h.parquet" for symbol in ("BTC", "ETH", "SOL")]
+    for seed, path in enumerate(paths):
+        _fragmented_cache(path, n=1000, seed=seed)
+    (tmp_path / "binance_BAD_USDT_1h.parquet").write_bytes(b"not parquet")
+
+    before = verify_cache([*paths, tmp_path / "binance_BAD_USDT_1h.parquet"], max_workers=2, now=NOW)
+    assert before["ok"].sum() == 0
+    assert before["error"].notna().sum() == 1
+    assert (before["duplicates"].dropna() == 300).all()
+
+    report = compact_cache(paths, max_workers=2, now=NOW)
+    assert report["file"].tolist() == [p.name for p in paths]
+    assert (report["rows_after"] == 1000).all()
+    assert verify_cache(paths, max_workers=2, now=NOW)["ok"].all()
+
+
+def test_cli_cache_verify_and_compact(tmp_path, monkeypatch, capsys):
+    path = tmp_path / "binance_BTC_USDT_1h.parquet"
+    _fragmented_cache(path, n=500)
+    monkeypatch.setattr(cli, "DATA_DIR", tmp_path)
+
+    monkeypatch.setattr(sys, "argv", ["tradestrats", "cache", "verify", "-j", "1"])
+    cli.main()
+    assert "1 mit Problemen" in capsys.readouterr().out
+
+    monkeypatch.setattr(sys, "argv", ["tradestrats", "cache", "compact", "--dry-run", "-j", "1"])
+    cli.main()
+    assert "Dry-Run: 300 Zeilen" in capsys.readouterr().out
+    assert pq.ParquetFile(path).metadata.num_rows == 800
+
+    monkeypatch.setattr(sys, "argv", ["tradestrats", "cache", "compact", "-j", "1"])
+    cli.main()
+    out = capsys.readouterr().out
+    assert "800 -> 500 Zeilen" in out and "KB frei" in out and "Lesezeit" in out
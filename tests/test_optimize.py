@@ -0,0 +1,56 @@
+"""Tests for broadcast parameter sweeps (engine.optimize)."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradestrats.backtesting import engine
+from tradestrats.strategies.sma_cross import SMACrossover
+
+GRID = {"fast_period": [5, 10], "slow_period": [30, 60]}
+
+
+def _make_ohlcv(n: int = 600, seed: int = 0) -> pd.DataFrame:
+    """Build a random-walk OHLCV DataFrame with hourly candles."""
+    rng = np.random.default_rng(seed)
+    closes = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    return pd.DataFrame(
+        {"open": closes, "high": closes * 1.01, "low": closes * 0.99, "close": closes, "volume": 1.0},
+        index=pd.date_range("2024-01-01", periods=n, freq="1h"),
+    )
+
+
+def test_optimize_matches_individual_runs():
+    """Each row must equal a separate engine.run with the same settings."""
+    data = _make_ohlcv()
+    table = engine.optimize(SMACrossover, data, GRID, fees=0.001, sl_stop=0.05)
+
+    assert len(table) == 4
+    assert table.index.names == ["fast_period", "slow_period", "fees", "sl_stop"]
+    for fast, slow, fee, stop in table.index:
+        single = engine.run(SMACrossover(fast, slow), data, fees=fee, sl_stop=stop).summary()
+        row = table.loc[(fast, slow, fee, stop)]
+        for metric in ("total_return", "sharpe_ratio", "max_drawdown", "final_value"):
+            assert row[metric] == pytest.approx(single[metric])
+        assert row["total_trades"] == single["total_trades"]
+
+
+def test_optimize_broadcasts_engine_grids():
+    """fees and sl_stop lists multiply the grid; higher fees cannot help."""
+    data = _make_ohlcv()
+    table = engine.optimize(SMACrossover, data, GRID, fees=[0.0, 0.01], sl_stop=[0.02, 0.1])
+
+    assert len(table) == 4 * 2 * 2
+    cheap = table.xs(0.0, level="fees")["final_value"]
+    expensive = table.xs(0.01, level="fees")["final_value"]
+    traded = table.xs(0.0, level="fees")["total_trades"] > 0
+    assert (expensive[traded] < cheap[traded]).all()
+
+
+def test_optimize_chunking_is_transparent():
+    """A tiny memory budget must give the same table as one big call."""
+    data = _make_ohlcv()
+    full = engine.optimize(SMACrossover, data, GRID, fees=[0.0, 0.001])
+    chunked = engine.optimize(SMACrossover, data, GRID, fees=[0.0, 0.001], memory_budget=1)
+
+    pd.testing.assert_frame_equal(full, chunked)
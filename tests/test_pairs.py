@@ -0,0 +1,98 @@
+"""Tests for the pairs / cointegration scanner."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradestrats.backtesting import engine
+from tradestrats.backtesting.pairs import correlation_matrix, engle_granger, log_returns, scan_pairs, spread_frame
+from tradestrats.data import fetcher, panel as panel_module
+from tradestrats.data.panel import build_panel, cached_symbols, load_cached_panel
+from tradestrats.strategies.base import strategy_signals
+from tradestrats.strategies.pair_spread import PairSpread
+
+
+def _frame(log_close: np.ndarray, index: pd.DatetimeIndex) -> pd.DataFrame:
+    close = np.exp(log_close)
+    return pd.DataFrame(
+        {"open": close, "high": close * 1.001, "low": close * 0.999, "close": close, "volume": 1.0}, index=index,
+    )
+
+
+@pytest.fixture(scope="module")
+def universe():
+    """AAA/BBB cointegrated, CCC correlated with AAA but drifting away, DDD unrelated."""
+    rng = np.random.default_rng(7)
+    n = 3000
+    index = pd.date_range("2024-01-01", periods=n, freq="1h", tz="UTC")
+    walk = np.cumsum(rng.normal(0, 0.01, n))
+    noise = np.zeros(n)
+    for t in range(1, n):
+        noise[t] = 0.9 * noise[t - 1] + rng.normal(0, 0.004)
+    frames = {
+        "AAA/USDT": _frame(4.6 + walk, index),
+        "BBB/USDT": _frame(0.2 + 1.3 * walk + noise, index),
+        "CCC/USDT": _frame(3.0 + np.cumsum(0.9 * np.diff(walk, prepend=0) + rng.normal(0, 0.004, n)), index),
+        "DDD/USDT": _frame(2.0 + np.cumsum(rng.normal(0, 0.01, n)), index),
+    }
+    frames["DDD/USDT"] = frames["DDD/USDT"].iloc[500:]  # shorter history
+    return build_panel(frames)
+
+
+def test_correlation_matrix_matches_pandas(universe):
+    returns = log_returns(universe["close"])
+    pd.testing.assert_frame_equal(correlation_matrix(returns), returns.corr(), atol=1e-10)
+
+
+def test_engle_granger_and_half_life(universe):
+    log_close = np.log(universe["close"])
+    coint = engle_granger(log_close["BBB/USDT"].to_numpy(), log_close["AAA/USDT"].to_numpy())
+    assert coint["cointegrated"]
+    assert coint["beta"] == pytest.approx(1.3, abs=0.02)
+    assert coint["half_life"] == pytest.approx(np.log(0.5) / np.log(0.9), rel=0.3)
+
+    drifting = engle_granger(log_close["CCC/USDT"].to_numpy(), log_close["AAA/USDT"].to_numpy())
+    assert not drifting["cointegrated"]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_scan_ranks_cointegrated_pair_first(universe, workers):
+    pairs = scan_pairs(universe, min_corr=0.5, min_overlap=500, max_workers=workers)
+    # DDD is filtered out by the correlation screen
+    assert not pairs[["y", "x"]].isin(["DDD/USDT"]).any().any()
+    top = pairs.iloc[0]
+    assert (top["y"], top["x"]) == ("AAA/USDT", "BBB/USDT")  # fixed direction: panel order
+    assert top["beta"] == pytest.approx(1 / 1.3, rel=0.05)
+    assert top["cointegrated"] and pairs["cointegrated"].sum() == 1
+    assert pairs["adf_stat"].iloc[0] == pairs["adf_stat"].min()
+
+
+def test_spread_strategy_runs_through_engine(universe):
+    top = scan_pairs(universe, min_corr=0.5, max_workers=1).iloc[0]
+    spread = spread_frame(universe, top["y"], top["x"], top["beta"])
+    np.testing.assert_allclose(
+        np.log(spread["close"]),
+        np.log(universe["close"][top["y"]]) - top["beta"] * np.log(universe["close"][top["x"]]),
+    )
+
+    strategy = PairSpread(lookback=50, entry_z=1.5)
+    np.testing.assert_array_equal(strategy_signals(strategy, spread), strategy.generate_signals(spread)["signal"])
+    result = engine.run(strategy, spread, sl_stop=0.05)
+    assert result.total_trades > 0
+    assert result.total_return > 0  # the spread reverts, buying its dips pays
+
+
+def test_load_cached_panel(universe, tmp_path, monkeypatch):
+    monkeypatch.setattr(fetcher, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(panel_module, "DATA_DIR", tmp_path)
+    for symbol in ["AAA/USDT", "BBB/USDT"]:
+        frame = universe.xs(symbol, axis=1, level="symbol")
+        frame.columns.name = None
+        frame.to_parquet(fetcher._cache_path(symbol, "1h", "binance"))
+
+    assert cached_symbols("1h", "binance") == ["AAA/USDT", "BBB/USDT"]
+    panel = load_cached_panel(timeframe="1h", exchange_id="binance", start="2024-02-01")
+    assert list(panel["close"].columns) == ["AAA/USDT", "BBB/USDT"]
+    assert panel.index.min() == pd.Timestamp("2024-02-01", tz="UTC")
+    with pytest.raises(ValueError, match="No cached"):
+        load_cached_panel(timeframe="4h", exchange_id="binance")
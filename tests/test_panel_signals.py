@@ -0,0 +1,77 @@
+"""Tests for vectorized multi-symbol panel signal generation."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradestrats.backtesting import engine
+from tradestrats.data.panel import build_panel
+from tradestrats.strategies.bollinger_band import BollingerBandStrategy
+from tradestrats.strategies.box_theory import BoxTheory
+from tradestrats.strategies.rsi_mean_reversion import RSIMeanReversion
+from tradestrats.strategies.sma_cross import SMACrossover
+
+STRATEGIES = [
+    RSIMeanReversion(),
+    SMACrossover(fast_period=5, slow_period=20),
+    BollingerBandStrategy(bb_period=20, num_std=1.5),
+    BoxTheory(zone_pct=0.25),
+]
+
+
+def _make_ohlcv(n: int, start: str = "2024-01-01", seed: int = 0) -> pd.DataFrame:
+    """Build a random-walk OHLCV DataFrame with hourly candles."""
+    rng = np.random.default_rng(seed)
+    closes = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    spread = rng.uniform(0.001, 0.01, n)
+    return pd.DataFrame(
+        {
+            "open": closes,
+            "high": closes * (1 + spread),
+            "low": closes * (1 - spread),
+            "close": closes,
+            "volume": rng.uniform(50, 150, n),
+        },
+        index=pd.date_range(start, periods=n, freq="1h"),
+    )
+
+
+def _misaligned_panel() -> tuple[pd.DataFrame, dict[str, pd.DataFrame]]:
+    frames = {
+        "BTC/USDT": _make_ohlcv(240, seed=1),
+        "ETH/USDT": _make_ohlcv(240, seed=2),
+        "SOL/USDT": _make_ohlcv(150, start="2024-01-04 10:00", seed=3),  # later listing
+    }
+    return build_panel(frames), frames
+
+
+@pytest.mark.parametrize("strategy", STRATEGIES, ids=lambda s: type(s).__name__)
+def test_panel_matches_single_symbol(strategy):
+    """One vectorized pass must reproduce the per-symbol signals."""
+    panel, frames = _misaligned_panel()
+    signals = strategy.generate_panel_signals(panel)
+
+    assert signals.shape == (len(panel), len(frames))
+    for symbol, frame in frames.items():
+        expected = strategy.generate_signals(frame)["signal"]
+        np.testing.assert_array_equal(signals.loc[frame.index, symbol].to_numpy(), expected.to_numpy())
+
+
+def test_panel_no_signal_without_history():
+    """Timestamps before a symbol's first candle must hold 0."""
+    panel, frames = _misaligned_panel()
+    signals = RSIMeanReversion().generate_panel_signals(panel)
+
+    before = signals.loc[: frames["SOL/USDT"].index[0] - pd.Timedelta("1h"), "SOL/USDT"]
+    assert not before.empty
+    assert (before == 0).all()
+
+
+def test_run_panel_multi_column_portfolio():
+    """run_panel should produce one portfolio column per symbol."""
+    panel, frames = _misaligned_panel()
+    result = engine.run_panel(SMACrossover(fast_period=5, slow_period=20), panel)
+
+    assert list(result.total_return.index) == list(frames)
+    single = engine.run(SMACrossover(fast_period=5, slow_period=20), frames["BTC/USDT"])
+    assert result.total_return["BTC/USDT"] == pytest.approx(single.total_return)
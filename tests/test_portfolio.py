@@ -0,0 +1,76 @@
+"""Tests for shared-cash multi-asset portfolio backtests."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradestrats.backtesting.portfolio import position_weights, run_portfolio
+from tradestrats.data.panel import build_panel
+from tradestrats.strategies.sma_cross import SMACrossover
+
+
+def _make_ohlcv(n: int = 800, seed: int = 0, vol: float = 0.01) -> pd.DataFrame:
+    """Build a random-walk OHLCV DataFrame with hourly candles."""
+    rng = np.random.default_rng(seed)
+    closes = 100.0 * np.exp(np.cumsum(rng.normal(0, vol, n)))
+    return pd.DataFrame(
+        {"open": closes, "high": closes * 1.01, "low": closes * 0.99, "close": closes, "volume": 1.0},
+        index=pd.date_range("2024-01-01", periods=n, freq="1h"),
+    )
+
+
+@pytest.fixture(scope="module")
+def panel():
+    return build_panel({
+        "AAA": _make_ohlcv(seed=1),
+        "BBB": _make_ohlcv(seed=2),
+        "CCC": _make_ohlcv(seed=3, vol=0.03),
+    })
+
+
+def test_shared_cash_and_metrics(panel):
+    result = run_portfolio(SMACrossover(5, 20), panel, init_cash=10_000)
+    pf = result.portfolio
+
+    # One portfolio with one cash pool, not three times init_cash
+    assert isinstance(result.equity_curve, pd.Series)
+    assert pf.init_cash == 10_000
+    assert result.total_return == pytest.approx(pf.total_return())
+    assert result.max_drawdown == pytest.approx(pf.max_drawdown())
+    assert result.total_trades == pf.trades.count()
+
+    assert list(result.assets.index) == ["AAA", "BBB", "CCC"]
+    assert result.assets["trades"].sum() == result.total_trades
+    assert result.assets["pnl"].sum() == pytest.approx(result.final_value - 10_000)
+
+
+def test_equal_weight_caps_position_value(panel):
+    result = run_portfolio(SMACrossover(5, 20), panel, sl_stop=None)
+    pf = result.portfolio
+    asset_value = pf.asset_value(group_by=False)
+    share = asset_value.div(pf.value(), axis=0)
+    # Positions start at 1/3 of the portfolio; drift allows a bit more
+    entries = result.weights.notna() & (result.weights > 0)
+    assert share[entries].max().max() == pytest.approx(1 / 3, rel=0.01)
+
+
+def test_max_positions(panel):
+    result = run_portfolio(SMACrossover(5, 20), panel, max_positions=1)
+    held = (result.portfolio.assets() != 0).sum(axis=1)
+    assert held.max() == 1
+    assert result.weights.max().max() == pytest.approx(1.0)
+
+    with pytest.raises(ValueError, match="max_positions"):
+        run_portfolio(SMACrossover(5, 20), panel, max_positions=4)
+
+
+def test_volatility_sizing_scales_down_risky_assets(panel):
+    weights = position_weights(panel["close"], "volatility", target_vol=1.0, vol_window=50)
+    late = weights.iloc[100:]
+    # CCC has three times the volatility of the others
+    assert late["CCC"].mean() < late["AAA"].mean()
+    assert (weights <= 1 / 3 + 1e-12).all().all()
+    assert (weights.iloc[:50] == 1 / 3).all().all()
+
+    with pytest.raises(ValueError, match="Unknown sizing rule"):
+        position_weights(panel["close"], "kelly")
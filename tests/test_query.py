@@ -0,0 +1,85 @@
+"""Tests for the DuckDB query layer over the cache and the result store."""
+
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("duckdb")
+
+from tradestrats import cli
+from tradestrats.backtesting import engine
+from tradestrats.backtesting.store import ResultStore
+from tradestrats.data import query as query_module
+from tradestrats.data.query import connect, query
+from tradestrats.strategies.sma_cross import SMACrossover
+from tests.helpers import make_ohlcv
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    for name, seed in [("binance_BTC_USDT_1d", 1), ("binance_ETH_USDT_1d", 2), ("binance_BTC_USDT_1h", 3)]:
+        frame = make_ohlcv(300, seed=seed, freq=name.rsplit("_", 1)[1])
+        frame.index.name = "timestamp"
+        frame.to_parquet(tmp_path / f"{name}.parquet")
+    index = make_ohlcv(50, seed=4, freq="1d")
+    index.index.name = "timestamp"
+    index.to_parquet(tmp_path / "yfinance_IDX_GSPC_1d.parquet")
+    return tmp_path
+
+
+def test_candles_table_matches_cache_files(data_dir):
+    counts = query(
+        "SELECT source, symbol, timeframe, count(*) AS n FROM candles GROUP BY ALL ORDER BY ALL", data_dir,
+    )
+    assert counts.values.tolist() == [
+        ["binance", "BTC/USDT", "1d", 300],
+        ["binance", "BTC/USDT", "1h", 300],
+        ["binance", "ETH/USDT", "1d", 300],
+        ["yfinance", "^GSPC", "1d", 50],
+    ]
+
+    # Aggregates agree with pandas on the same file
+    expected = pd.read_parquet(data_dir / "binance_ETH_USDT_1d.parquet")
+    wide = (expected["high"] - expected["low"]) / expected["low"] > 0.01
+    result = query(
+        "SELECT count(*) AS days, max(close) AS top FROM candles "
+        "WHERE symbol = 'ETH/USDT' AND timeframe = '1d' AND (high - low) / low > 0.01",
+        data_dir,
+    )
+    assert result["days"].iloc[0] == wide.sum()
+    assert result["top"].iloc[0] == pytest.approx(expected.loc[wide, "close"].max())
+
+
+def test_runs_table_reads_the_result_store(data_dir):
+    store = ResultStore(data_dir / "results.sqlite")
+    data = make_ohlcv(1000, seed=5)
+    for fast, slow in [(5, 20), (10, 40)]:
+        engine.run(SMACrossover(fast, slow), data, store=store)
+
+    runs = query("SELECT strategy, sharpe_ratio FROM runs ORDER BY sharpe_ratio DESC", data_dir)
+    assert runs["strategy"].tolist() == ["SMACrossover", "SMACrossover"]
+    np.testing.assert_allclose(runs["sharpe_ratio"], store.top(2)["sharpe_ratio"])
+
+
+def test_empty_directory_has_empty_tables(tmp_path):
+    con = connect(tmp_path)
+    try:
+        assert con.execute("SELECT count(*) FROM candles").fetchone()[0] == 0
+        assert con.execute("SELECT count(*) FROM runs").fetchone()[0] == 0
+    finally:
+        con.close()
+
+
+def test_cli_query_prints_and_exports(data_dir, monkeypatch, capsys):
+    monkeypatch.setattr(query_module, "DATA_DIR", data_dir)
+    output = data_dir / "out.csv"
+    monkeypatch.setattr(
+        sys, "argv",
+        ["tradestrats", "query", "SELECT DISTINCT symbol FROM candles ORDER BY 1", "-n", "2", "-o", str(output)],
+    )
+    cli.main()
+    printed = capsys.readouterr().out
+    assert "BTC/USDT" in printed and "1 weitere Zeilen" in printed
+    assert pd.read_csv(output)["symbol"].tolist() == ["BTC/USDT", "ETH/USDT", "^GSPC"]
@@ -0,0 +1,89 @@
+"""Tests for the shared backtest job queue and its workers."""
+
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from tradestrats.backtesting.batch import expand_jobs, run_batch
+from tradestrats.backtesting.queue import JobQueue, run_worker
+from tests.helpers import BATCH_SPEC, fake_loader
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return JobQueue(tmp_path / "queue.sqlite")
+
+
+def test_submit_and_claim(queue):
+    jobs = expand_jobs(BATCH_SPEC)
+    assert queue.submit(jobs) == 8
+    assert queue.submit(jobs) == 0  # already queued
+    assert queue.submit(jobs[:2], sweep="other") == 2
+
+    first = queue.claim("a")
+    second = queue.claim("b")
+    assert first.job == jobs[0] and second.job == jobs[1]
+    assert first.attempt == 1
+    assert queue.counts() == {"pending": 6, "running": 2, "done": 0, "failed": 0}
+
+    assert queue.complete(first, {"key": first.job.key, "total_return": 0.1})
+    assert not queue.complete(first, {})  # no longer running
+    assert queue.counts()["done"] == 1
+
+
+def test_expired_lease_is_taken_over(queue):
+    queue.submit(expand_jobs(BATCH_SPEC)[:1])
+    crashed = queue.claim("a", lease=0.05)
+    assert queue.claim("b") is None  # lease still valid
+
+    time.sleep(0.1)
+    retry = queue.claim("b")
+    assert retry.id == crashed.id and retry.attempt == 2
+
+    # The first worker's late answers are ignored
+    assert not queue.heartbeat(crashed)
+    assert not queue.complete(crashed, {"key": "stale"})
+    assert queue.complete(retry, {"key": retry.job.key})
+
+
+def test_failed_jobs_are_retried_then_given_up(queue):
+    queue.submit(expand_jobs(BATCH_SPEC)[:1], max_attempts=2)
+    assert queue.fail(queue.claim("a"), "boom")
+    assert queue.counts()["pending"] == 1
+
+    assert queue.fail(queue.claim("a"), "boom again")
+    assert queue.claim("a") is None
+    assert queue.counts()["failed"] == 1
+    assert queue.results()["error"].tolist() == ["boom again"]
+
+    # Leases that expire on the last attempt fail the job as well
+    queue.submit(expand_jobs(BATCH_SPEC)[1:2], max_attempts=1)
+    queue.claim("a", lease=0.0)
+    assert queue.claim("b") is None
+    assert queue.counts()["failed"] == 2
+
+
+def test_workers_drain_sweep_cooperatively(queue, tmp_path):
+    queue.submit(expand_jobs(BATCH_SPEC))
+    processed = []
+
+    def _work(name):
+        processed.append(run_worker(queue, owner=name, poll=0.01, loader=fake_loader))
+
+    threads = [threading.Thread(target=_work, args=(f"w{i}",)) for i in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sum(processed) == 8
+    assert queue.counts() == {"pending": 0, "running": 0, "done": 8, "failed": 0}
+
+    # Same rows as a local batch run
+    expected = run_batch(BATCH_SPEC, tmp_path / "batch.csv", max_workers=1, loader=fake_loader)
+    results = queue.results().set_index("key").loc[expected["key"]]
+    pd.testing.assert_series_equal(
+        results["total_return"].reset_index(drop=True), expected["total_return"], check_names=False,
+    )
@@ -0,0 +1,86 @@
+"""Tests for Monte Carlo / bootstrap robustness analysis."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradestrats.backtesting import engine
+from tradestrats.backtesting.robustness import bootstrap_paths, monte_carlo, path_metrics, shuffle_paths
+from tradestrats.strategies.sma_cross import SMACrossover
+
+
+def _make_ohlcv(n: int = 1500, seed: int = 0) -> pd.DataFrame:
+    """Build a random-walk OHLCV DataFrame with hourly candles."""
+    rng = np.random.default_rng(seed)
+    closes = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    return pd.DataFrame(
+        {"open": closes, "high": closes * 1.01, "low": closes * 0.99, "close": closes, "volume": 1.0},
+        index=pd.date_range("2024-01-01", periods=n, freq="1h"),
+    )
+
+
+@pytest.fixture(scope="module")
+def result():
+    return engine.run(SMACrossover(5, 20), _make_ohlcv())
+
+
+def test_path_metrics_match_vectorbt(result):
+    """Metrics of the unresampled returns equal the portfolio's own metrics."""
+    mc = monte_carlo(result, n_paths=10, seed=0)
+    assert mc.observed["total_return"] == pytest.approx(result.total_return)
+    assert mc.observed["max_drawdown"] == pytest.approx(result.max_drawdown)
+    assert mc.observed["sharpe_ratio"] == pytest.approx(result.sharpe_ratio)
+
+
+def test_shuffle_keeps_total_return(result):
+    """Permuting trades changes the path but not the compounded return."""
+    mc = monte_carlo(result, method="shuffle", n_paths=500, seed=1)
+    assert len(mc.distribution) == 500
+    np.testing.assert_allclose(mc.distribution["total_return"], mc.observed["total_return"])
+    assert "sharpe_ratio" not in mc.distribution
+    # The observed drawdown is one of the possible orderings
+    assert mc.distribution["max_drawdown"].min() <= mc.observed["max_drawdown"] + 1e-12
+
+
+def test_chunked_run_gives_consistent_distribution(result):
+    """A tiny memory budget forces one path per chunk without changing the outcome."""
+    full = monte_carlo(result, method="bootstrap", n_paths=300, seed=7)
+    chunked = monte_carlo(result, method="bootstrap", n_paths=300, seed=7, memory_budget=1)
+    assert len(chunked.distribution) == 300
+    ci_full = full.confidence_interval(0.9)
+    ci_chunked = chunked.confidence_interval(0.9)
+    assert (ci_full["lower"] <= ci_full["median"]).all()
+    assert (ci_full["median"] <= ci_full["upper"]).all()
+    # Both are samples of the same distribution
+    assert ci_chunked.loc["total_return", "median"] == pytest.approx(ci_full.loc["total_return", "median"], abs=0.05)
+
+
+def test_bootstrap_paths_use_contiguous_blocks():
+    returns = np.arange(10, dtype=float)
+    paths = bootstrap_paths(returns, 50, np.random.default_rng(0), block_size=5)
+    assert paths.shape == (50, 10)
+    steps = np.diff(paths, axis=1)[:, :4]  # within the first block
+    assert np.all((steps == 1) | (steps == -9))  # consecutive, wrapping around
+
+    with pytest.raises(ValueError, match="block_size"):
+        bootstrap_paths(returns, 5, np.random.default_rng(0), block_size=11)
+
+
+def test_shuffle_paths_and_metrics():
+    returns = np.array([0.1, -0.5, 0.2])
+    paths = shuffle_paths(returns, 20, np.random.default_rng(0))
+    np.testing.assert_allclose(np.sort(paths, axis=1), np.tile(np.sort(returns), (20, 1)))
+
+    metrics = path_metrics(np.array([[0.1, -0.5, 0.2]]))
+    assert metrics["total_return"][0] == pytest.approx(1.1 * 0.5 * 1.2 - 1)
+    assert metrics["max_drawdown"][0] == pytest.approx(-0.5)
+
+
+def test_path_metrics_count_first_step_loss():
+    metrics = path_metrics(np.array([[-0.5, 0.1, 0.2], [0.0, -0.2, 0.5]]))
+    np.testing.assert_allclose(metrics["max_drawdown"], [-0.5, -0.2])
+
+
+def test_monte_carlo_rejects_unknown_method(result):
+    with pytest.raises(ValueError, match="Unknown method"):
+        monte_carlo(result, method="jackknife")
@@ -0,0 +1,77 @@
+"""Tests for the streaming and batch rolling accumulators."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradestrats.indicators import rolling
+
+
+@pytest.fixture(scope="module")
+def series():
+    rng = np.random.default_rng(5)
+    x = 30_000 * np.exp(np.cumsum(rng.normal(0, 0.002, 20_000)))
+    x[[50, 51, 4000, 9000]] = np.nan  # gaps poison the windows that contain them
+    return x
+
+
+def test_batch_kernels_match_pandas(series):
+    s = pd.Series(series)
+    r = s.rolling(30)
+    np.testing.assert_allclose(rolling.rolling_mean(series, 30), r.mean(), rtol=1e-12)
+    mean, var = rolling.rolling_mean_var(series, 30, 1)
+    np.testing.assert_allclose(mean, r.mean(), rtol=1e-12)
+    np.testing.assert_allclose(var, r.var(ddof=1), rtol=1e-6)
+    np.testing.assert_allclose(rolling.rolling_std(series, 30, 0), r.std(ddof=0), rtol=1e-6)
+    np.testing.assert_array_equal(rolling.rolling_max(series, 30), r.max().to_numpy())
+    np.testing.assert_array_equal(rolling.rolling_min(series, 30), r.min().to_numpy())
+    # Exponential averages reproduce pandas' ewm bit for bit, NaN gaps included
+    np.testing.assert_array_equal(rolling.ema(series, 12), s.ewm(span=12, adjust=False).mean().to_numpy())
+    np.testing.assert_array_equal(rolling.rma(series, 14), s.ewm(alpha=1 / 14, adjust=False).mean().to_numpy())
+
+
+@pytest.mark.parametrize(
+    "updater, kernel",
+    [
+        (lambda: rolling.RollingMean(25), lambda x: rolling.rolling_mean(x, 25)),
+        (lambda: rolling.RollingVar(25), lambda x: rolling.rolling_var(x, 25)),
+        (lambda: rolling.RollingMax(25), lambda x: rolling.rolling_max(x, 25)),
+        (lambda: rolling.RollingMin(25), lambda x: rolling.rolling_min(x, 25)),
+        (lambda: rolling.EMA(9), lambda x: rolling.ema(x, 9)),
+        (lambda: rolling.RMA(14), lambda x: rolling.rma(x, 14)),
+    ],
+)
+def test_streaming_updaters_match_batch_exactly(series, updater, kernel):
+    x = series[:3000]
+    acc = updater()
+    streamed = np.array([acc.update(value) for value in x])
+    np.testing.assert_array_equal(streamed, kernel(x))
+
+
+def test_rolling_var_exposes_mean_and_std(series):
+    acc = rolling.RollingVar(10, ddof=0)
+    for value in series[100:110]:
+        acc.update(value)
+    window = series[100:110]
+    assert acc.mean == pytest.approx(window.mean(), rel=1e-12)
+    assert acc.std == pytest.approx(window.std(), rel=1e-9)
+
+    acc.update(np.nan)
+    assert np.isnan(acc.mean) and np.isnan(acc.std)
+
+
+def test_welford_stays_accurate_after_level_shifts():
+    # A huge level followed by a small one: the removal updates must not leave residue
+    x = np.concatenate([np.full(500, 1e9) + np.arange(500), np.arange(500, dtype=float)])
+    std = rolling.rolling_std(x, 20)
+    np.testing.assert_allclose(std[-400:], pd.Series(np.arange(500.0)).rolling(20).std().to_numpy()[-400:], rtol=1e-6)
+
+    constant = rolling.rolling_var(np.full(200, 123.456), 20)
+    assert np.all(constant[19:] >= 0) and np.all(constant[19:] < 1e-20)
+
+
+def test_deque_handles_monotonic_input_and_unit_window():
+    down = np.arange(100, 0, -1, dtype=float)
+    np.testing.assert_array_equal(rolling.rolling_max(down, 5)[4:], down[:-4])
+    np.testing.assert_array_equal(rolling.rolling_min(down, 5)[4:], down[4:])
+    np.testing.assert_array_equal(rolling.rolling_max(down, 1), down)
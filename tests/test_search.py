@@ -0,0 +1,87 @@
+"""Tests for pruned parameter searches."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradestrats.backtesting import engine
+from tradestrats.backtesting.search import grid_size, search
+from tradestrats.strategies.sma_cross import SMACrossover
+
+SPACE = {"fast_period": [3, 5, 8, 12, 20, 30], "slow_period": [40, 60, 80, 120, 160, 200]}
+
+
+def _make_ohlcv(n: int = 2000, seed: int = 0) -> pd.DataFrame:
+    """Build a random-walk OHLCV DataFrame with hourly candles."""
+    rng = np.random.default_rng(seed)
+    closes = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    return pd.DataFrame(
+        {"open": closes, "high": closes * 1.01, "low": closes * 0.99, "close": closes, "volume": 1.0},
+        index=pd.date_range("2024-01-01", periods=n, freq="1h"),
+    )
+
+
+@pytest.fixture(scope="module")
+def data():
+    return _make_ohlcv()
+
+
+def test_halving_prunes_on_growing_slices(data):
+    result = search(SMACrossover, data, SPACE, method="halving", n_trials=27, eta=3, seed=1, max_workers=1)
+    rungs = result.trials.groupby("rung").agg(n=("score", "size"), budget=("budget", "first"), bars=("bars", "first"))
+
+    assert rungs["n"].tolist() == [27, 9, 3]
+    assert rungs["budget"].tolist() == pytest.approx([1 / 9, 1 / 3, 1.0])
+    assert rungs["bars"].is_monotonic_increasing and rungs["bars"].iloc[-1] == len(data)
+    # 27/9 + 9/3 + 3 full-data evaluations instead of 36
+    assert result.cost_fraction == pytest.approx(9 / grid_size(SPACE), rel=0.01)
+
+    # Survivors are the best of the previous rung (non-finite scores rank last)
+    first = result.trials[result.trials["rung"] == 0]
+    first = first.assign(score=first["score"].replace([np.inf, -np.inf], np.nan)).sort_values("score", ascending=False)
+    survivors = result.trials[result.trials["rung"] == 1]
+    assert set(survivors["fast_period"] * 1000 + survivors["slow_period"]) == set(
+        (first["fast_period"] * 1000 + first["slow_period"]).head(9)
+    )
+
+
+def test_seed_reproducible_and_independent_of_workers(data):
+    runs = [
+        search(SMACrossover, data, SPACE, method="tpe", n_trials=16, batch_size=4, seed=7, max_workers=workers)
+        for workers in (1, 1, 2)
+    ]
+    for other in runs[1:]:
+        pd.testing.assert_frame_equal(other.trials, runs[0].trials)
+
+    params = runs[0].trials[list(SPACE)]
+    assert not params.duplicated().any()
+
+
+def test_compare_against_grid(data):
+    grid = engine.optimize(SMACrossover, data, SPACE)
+    result = search(SMACrossover, data, SPACE, method="random", n_trials=grid_size(SPACE), seed=0, max_workers=1)
+    report = result.compare(grid)
+
+    # Sampling the whole grid must recover its optimum exactly
+    assert report["rank"] == 1 and report["score_gap"] == 0
+    assert report["search_best_score"] == pytest.approx(grid["sharpe_ratio"].max())
+    assert report["cost_fraction"] == pytest.approx(1.0)
+
+    pruned = search(SMACrossover, data, SPACE, method="hyperband", seed=0, max_workers=1).compare(grid)
+    assert 1 <= pruned["rank"] <= grid_size(SPACE)
+    assert pruned["cost_fraction"] < 1.0
+
+
+def test_symbol_budget(data):
+    symbols = {name: _make_ohlcv(1000, seed) for seed, name in enumerate(["AAA", "BBB", "CCC", "DDD"])}
+    result = search(
+        SMACrossover, symbols, SPACE, method="halving", resource="symbols", n_trials=8, eta=2, min_budget=0.25,
+        seed=3, max_workers=1,
+    )
+    assert result.trials.groupby("rung")["symbols"].first().tolist() == [1, 2, 4]
+    assert (result.trials["bars"] == 1000).all()
+
+    with pytest.raises(ValueError, match="resource='symbols'"):
+        search(SMACrossover, data, SPACE, resource="symbols")
+    with pytest.raises(ValueError, match="Unknown search method"):
+        search(SMACrossover, data, SPACE, method="grid")
@@ -0,0 +1,88 @@
+"""Tests for the shared-memory data plane."""
+
+import os
+import signal
+import subprocess
+import sys
+from multiprocessing import shared_memory
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradestrats.backtesting import engine
+from tradestrats.backtesting.batch import run_batch
+from tradestrats.data.shared import SharedFrames, attach_frame, resolve_frame
+from tradestrats.strategies.sma_cross import SMACrossover
+from tests.helpers import fake_loader, make_ohlcv
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+def _exists(name: str) -> bool:
+    try:
+        shared_memory.SharedMemory(name=name).close()
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def test_publish_attach_and_release():
+    data = make_ohlcv(500)
+    with SharedFrames() as shared:
+        handle = shared.publish(data)
+        assert shared.nbytes >= data.size * 8
+        view = attach_frame(handle)
+        pd.testing.assert_frame_equal(view, data, check_freq=False)
+        assert not view["close"].to_numpy().flags.writeable
+        assert resolve_frame(data) is data
+        name = handle.name
+    assert not _exists(name)
+
+
+def test_released_after_error_and_sigterm():
+    with pytest.raises(RuntimeError):
+        with SharedFrames() as shared:
+            name = shared.publish(make_ohlcv(10)).name
+            raise RuntimeError("worker crashed")
+    assert not _exists(name)
+
+    script = (
+        "import sys, time\n"
+        "import numpy as np, pandas as pd\n"
+        "from tradestrats.data.shared import share_frame\n"
+        "shm, handle = share_frame(pd.DataFrame({'close': np.ones(10)}, index=pd.date_range('2024', periods=10)))\n"
+        "print(handle.name, flush=True)\n"
+        "time.sleep(60)\n"
+    )
+    env = {**os.environ, "PYTHONPATH": str(SRC)}
+    proc = subprocess.Popen([sys.executable, "-c", script], stdout=subprocess.PIPE, text=True, env=env)
+    name = proc.stdout.readline().strip()
+    assert _exists(name)
+    proc.send_signal(signal.SIGTERM)
+    assert proc.wait(timeout=30) == 128 + signal.SIGTERM
+    assert not _exists(name)
+
+
+def test_parallel_optimize_matches_serial():
+    data = make_ohlcv(1500, seed=3)
+    grid = {"fast_period": [5, 10, 20], "slow_period": [40, 60]}
+    serial = engine.optimize(SMACrossover, data, grid, sl_stop=[0.02, 0.05])
+    parallel = engine.optimize(SMACrossover, data, grid, sl_stop=[0.02, 0.05], max_workers=2)
+    pd.testing.assert_frame_equal(parallel, serial)
+
+
+def test_batch_fans_out_single_dataset(tmp_path):
+    spec = {
+        "symbols": ["AAA/USDT"],
+        "strategies": ["sma", "rsi"],
+        "timeframes": ["1h"],
+        "ranges": [["2024-01-01", "2024-01-20"], ["2024-01-10", None]],
+    }
+    serial = run_batch(spec, tmp_path / "serial.csv", max_workers=1, loader=fake_loader)
+    shared = run_batch(spec, tmp_path / "shared.csv", max_workers=3, loader=fake_loader)
+    shared = shared.set_index("key").loc[serial["key"]].reset_index()
+    assert shared["error"].isna().all()
+    np.testing.assert_allclose(shared["total_return"], serial["total_return"])
+    assert (shared["bars"] == serial["bars"]).all()
@@ -0,0 +1,72 @@
+"""Tests for the array-level strategy fast path."""
+
+import numpy as np
+import pandas as pd
+import pandas_ta as ta
+import pytest
+
+from tradestrats.backtesting import engine
+from tradestrats.backtesting.engine import signals_to_orders
+from tradestrats.indicators import kernels
+from tradestrats.strategies.base import Strategy, has_signal_array, strategy_signals
+from tradestrats.strategies.bollinger_band import BollingerBandStrategy
+from tradestrats.strategies.box_theory import BoxTheory
+from tradestrats.strategies.composite import rsi_bollinger
+from tradestrats.strategies.rsi_mean_reversion import RSIMeanReversion
+from tradestrats.strategies.sma_cross import SMACrossover
+from tests.helpers import make_ohlcv
+
+
+@pytest.fixture(scope="module")
+def data():
+    return make_ohlcv(5000, seed=11, freq="15min")
+
+
+@pytest.mark.parametrize(
+    "strategy", [SMACrossover(10, 40), RSIMeanReversion(), BollingerBandStrategy(), BoxTheory()],
+)
+def test_signal_array_matches_generate_signals(strategy, data):
+    assert has_signal_array(strategy)
+    expected = strategy.generate_signals(data)["signal"].to_numpy()
+    signal = strategy_signals(strategy, data)
+    assert signal.dtype == np.int8
+    np.testing.assert_array_equal(signal, expected)
+
+
+def test_kernels_match_pandas(data):
+    close = data["close"]
+    x = close.to_numpy()
+    np.testing.assert_allclose(kernels.sma(x, 20), ta.sma(close, length=20), rtol=1e-12)
+    np.testing.assert_allclose(kernels.rolling_std(x, 20), close.rolling(20).std(), rtol=1e-6)
+    # Wilder smoothing reproduces pandas' ewm bit for bit
+    np.testing.assert_array_equal(kernels.rsi(x, 14), ta.rsi(close, length=14).to_numpy())
+
+    signal = np.random.default_rng(0).integers(-1, 2, 1000).astype(np.int8)
+    entries, exits = kernels.crossing_orders(signal)
+    expected_entries, expected_exits = signals_to_orders(pd.Series(signal))
+    np.testing.assert_array_equal(entries, expected_entries)
+    np.testing.assert_array_equal(exits, expected_exits)
+
+
+def test_overridden_generate_signals_falls_back(data):
+    class Inverted(SMACrossover):
+        def generate_signals(self, data):
+            df = super().generate_signals(data)
+            df["signal"] = -df["signal"]
+            return df
+
+    strategy = Inverted(10, 40)
+    assert not has_signal_array(strategy)
+    assert not hasattr(Strategy, "signal_array")
+    assert not has_signal_array(rsi_bollinger())
+    np.testing.assert_array_equal(strategy_signals(strategy, data), -strategy_signals(SMACrossover(10, 40), data))
+
+
+@pytest.mark.parametrize("backend", ["vectorbt", "native"])
+def test_fast_run_matches_default(backend, data):
+    strategy = RSIMeanReversion()
+    default = engine.run(strategy, data, warmup=50, backend=backend)
+    fast = engine.run(strategy, data, warmup=50, backend=backend, fast=True)
+    assert fast.summary() == pytest.approx(default.summary())
+    assert list(fast.signals.columns) == ["signal"]
+    pd.testing.assert_series_equal(fast.signals["signal"], default.signals["signal"].astype(np.int8))
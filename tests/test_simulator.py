@@ -0,0 +1,123 @@
+"""Tests for the native Numba simulator backend."""
+
+import numpy as np
+import pandas as pd
+import pytest
+import vectorbt as vbt
+
+from tradestrats.backtesting import engine
+from tradestrats.backtesting.simulator import SimState, simulate, trade_frame
+from tradestrats.strategies.sma_cross import SMACrossover
+
+
+def _make_ohlc(n: int = 2000, seed: int = 0):
+    """Random-walk OHLC arrays with gaps between close and next open."""
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    open_ = np.r_[close[0], close[:-1]] * (1 + rng.normal(0, 0.002, n))
+    high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.004, n)))
+    low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.004, n)))
+    entries = rng.random(n) < 0.03
+    exits = (rng.random(n) < 0.03) & ~entries
+    return open_, high, low, close, entries, exits
+
+
+@pytest.mark.parametrize("stops", [
+    {},
+    {"sl_stop": 0.02},
+    {"sl_stop": 0.02, "tp_stop": 0.03},
+    {"sl_stop": 0.02, "sl_trail": True, "tp_stop": 0.05},
+])
+def test_matches_vectorbt_with_ohlc_stops(stops):
+    open_, high, low, close, entries, exits = _make_ohlc()
+    index = pd.date_range("2024-01-01", periods=len(close), freq="1h")
+
+    sim = simulate(close, entries, exits, open_=open_, high=high, low=low, init_cash=10_000, fees=0.001, **stops)
+    pf = vbt.Portfolio.from_signals(
+        pd.Series(close, index), entries, exits, open=open_, high=high, low=low,
+        init_cash=10_000, fees=0.001, freq="1h", **stops,
+    )
+
+    np.testing.assert_allclose(sim.value, pf.value().to_numpy(), rtol=1e-10)
+    trades = trade_frame(sim)
+    assert len(trades) == pf.trades.count()
+    np.testing.assert_allclose(trades["pnl"], pf.trades.pnl.values, rtol=1e-8, atol=1e-8)
+
+
+def test_stop_fills_at_level_or_gap_open():
+    close = np.array([100.0, 100.0, 97.0, 90.0])
+    entries = np.array([True, False, False, False])
+    # Bar 1 dips to 98 (above the 5% stop), bar 2 trades through 95, bar 3 never reached
+    low = np.array([100.0, 98.0, 94.0, 90.0])
+    sim = simulate(close, entries, None, low=low, fees=0.0, sl_stop=0.05)
+    trades = trade_frame(sim)
+    assert trades["exit_price"].tolist() == [pytest.approx(95.0)]
+    assert trades["exit_reason"].tolist() == ["stop_loss"]
+
+    gap_open = np.array([100.0, 100.0, 93.0, 90.0])
+    sim = simulate(close, entries, None, open_=gap_open, low=low, fees=0.0, sl_stop=0.05)
+    assert trade_frame(sim)["exit_price"].tolist() == [93.0]
+
+
+def test_short_round_trip():
+    close = np.array([100.0, 90.0, 80.0])
+    sim = simulate(
+        close, None, None,
+        short_entries=np.array([True, False, False]),
+        short_exits=np.array([False, False, True]),
+        init_cash=1_000.0, fees=0.0,
+    )
+    trades = trade_frame(sim)
+    assert trades["direction"].tolist() == [-1]
+    assert trades["pnl"].iloc[0] == pytest.approx(200.0)  # 10 units, 100 -> 80
+    np.testing.assert_allclose(sim.value, [1_000.0, 1_100.0, 1_200.0])
+
+
+def test_limit_entry_fills_or_expires():
+    close = np.array([100.0, 100.0, 100.0, 100.0])
+    entries = np.array([True, False, False, False])
+    low = np.array([100.0, 99.5, 98.0, 98.0])
+
+    filled = simulate(close, entries, None, low=low, fees=0.0, limit_offset=0.01, limit_tif=2)
+    assert filled.state.entry_price == pytest.approx(99.0)
+    assert filled.state.entry_bar == 2
+
+    expired = simulate(close, entries, None, low=low, fees=0.0, limit_offset=0.01, limit_tif=1)
+    assert expired.state.position == 0
+    assert expired.state.limit_direction == 0
+
+
+def test_state_continues_across_chunks():
+    """Two calls carrying the state equal one call over the whole history."""
+    open_, high, low, close, entries, exits = _make_ohlc(1000, seed=3)
+    kwargs = {"fees": 0.001, "sl_stop": 0.02, "sl_trail": True}
+    full = simulate(close, entries, exits, open_=open_, high=high, low=low, **kwargs)
+
+    first = simulate(close[:400], entries[:400], exits[:400], open_=open_[:400], high=high[:400], low=low[:400], **kwargs)
+    second = simulate(
+        close[400:], entries[400:], exits[400:], open_=open_[400:], high=high[400:], low=low[400:],
+        state=first.state, bar_offset=400, **kwargs,
+    )
+    np.testing.assert_allclose(np.r_[first.value, second.value], full.value)
+    np.testing.assert_array_equal(np.r_[first.trades, second.trades], full.trades)
+    assert isinstance(second.state, SimState)
+
+
+def test_engine_native_backend():
+    rng = np.random.default_rng(1)
+    closes = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.01, 600)))
+    data = pd.DataFrame(
+        {"open": closes, "high": closes, "low": closes, "close": closes, "volume": 1.0},
+        index=pd.date_range("2024-01-01", periods=600, freq="1h"),
+    )
+    native = engine.run(SMACrossover(5, 20), data, backend="native")
+    reference = engine.run(SMACrossover(5, 20), data)
+
+    assert native.portfolio is None
+    assert native.summary() == pytest.approx(reference.summary())
+    assert len(native.trades) == reference.total_trades
+
+    with pytest.raises(ValueError, match="backend='native'"):
+        engine.run(SMACrossover(5, 20), data, short=True)
+    with pytest.raises(ValueError, match="Unknown backend"):
+        engine.run(SMACrossover(5, 20), data, backend="zipline")
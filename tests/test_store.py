@@ -0,0 +1,94 @@
+"""Tests for the content-addressed backtest result store."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradestrats.backtesting import engine
+from tradestrats.backtesting.store import ResultStore, run_key
+from tradestrats.strategies.sma_cross import SMACrossover
+
+SETTINGS = {"init_cash": 10_000.0, "fees": 0.001, "sl_stop": 0.05}
+
+
+def _make_ohlcv(n: int = 600, seed: int = 0) -> pd.DataFrame:
+    """Build a random-walk OHLCV DataFrame with hourly candles."""
+    rng = np.random.default_rng(seed)
+    closes = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    return pd.DataFrame(
+        {"open": closes, "high": closes * 1.01, "low": closes * 0.99, "close": closes, "volume": 1.0},
+        index=pd.date_range("2024-01-01", periods=n, freq="1h"),
+    )
+
+
+def test_key_is_stable_and_content_sensitive():
+    data = _make_ohlcv()
+    key = run_key(SMACrossover(5, 20), data, SETTINGS)
+
+    assert run_key(SMACrossover(5, 20), data.copy(), dict(SETTINGS)) == key
+    assert run_key(SMACrossover(5, 30), data, SETTINGS) != key
+    assert run_key(SMACrossover(5, 20), data, {**SETTINGS, "fees": 0.002}) != key
+
+    changed = data.copy()
+    changed.iloc[-1, changed.columns.get_loc("close")] *= 1.0001
+    assert run_key(SMACrossover(5, 20), changed, SETTINGS) != key
+
+
+class _Threshold(SMACrossover):
+    """Subclass with an extra parameter and the inherited repr."""
+
+    def __init__(self, fast: int, slow: int, threshold: float):
+        super().__init__(fast, slow)
+        self.threshold = threshold
+
+
+def test_key_covers_params_missing_from_repr():
+    data = _make_ohlcv()
+    assert repr(_Threshold(5, 20, 0.1)) == repr(_Threshold(5, 20, 0.2))
+    assert run_key(_Threshold(5, 20, 0.1), data, SETTINGS) != run_key(_Threshold(5, 20, 0.2), data, SETTINGS)
+    assert run_key(_Threshold(5, 20, 0.1), data, SETTINGS) == run_key(_Threshold(5, 20, 0.1), data, SETTINGS)
+
+
+def test_run_is_served_from_store(tmp_path, monkeypatch):
+    store = ResultStore(tmp_path / "results.sqlite")
+    data = _make_ohlcv()
+    first = engine.run(SMACrossover(5, 20), data, store=store)
+    assert first.portfolio is not None and len(store) == 1
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("backtest was recomputed")
+
+    monkeypatch.setattr(engine.vbt.Portfolio, "from_signals", _fail)
+    cached = engine.run(SMACrossover(5, 20), data, store=store)
+
+    assert cached.portfolio is None
+    assert cached.summary() == pytest.approx(first.summary())
+    pd.testing.assert_series_equal(cached.equity_curve, first.equity_curve, check_names=False, check_freq=False)
+    assert len(cached.trades) == first.total_trades
+
+
+def test_native_trades_round_trip(tmp_path):
+    store = ResultStore(tmp_path / "results.sqlite")
+    data = _make_ohlcv(seed=3)
+    first = engine.run(SMACrossover(5, 20), data, backend="native", store=store)
+    cached = engine.run(SMACrossover(5, 20), data, backend="native", store=store)
+
+    pd.testing.assert_frame_equal(cached.trades, first.trades)
+    assert cached.total_trades == first.total_trades
+
+
+def test_top_ranks_by_metric(tmp_path):
+    store = ResultStore(tmp_path / "results.sqlite")
+    data = _make_ohlcv(seed=1)
+    for fast, slow in [(3, 10), (5, 20), (10, 40), (20, 80)]:
+        engine.run(SMACrossover(fast, slow), data, store=store)
+
+    top = store.top(3)
+    assert len(top) == 3
+    assert top["sharpe_ratio"].is_monotonic_decreasing
+    assert top["sharpe_ratio"].iloc[0] == store.top(10)["sharpe_ratio"].max()
+    assert (top["strategy"] == "SMACrossover").all()
+    assert store.top(10, strategy="RSIMeanReversion").empty
+
+    with pytest.raises(ValueError, match="Unknown metric"):
+        store.top(by="profit")
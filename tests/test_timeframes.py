@@ -0,0 +1,111 @@
+"""Tests for multi-timeframe resampling and lookahead-free alignment."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradestrats.backtesting import engine
+from tradestrats.data.timeframes import (
+    align_to_index,
+    merge_informative,
+    resample_ohlcv,
+    timeframe_to_timedelta,
+)
+from tradestrats.strategies.box_theory import BoxTheory
+
+
+def _make_ohlcv(n: int, freq: str = "5min", seed: int = 0) -> pd.DataFrame:
+    """Build a random-walk OHLCV DataFrame."""
+    rng = np.random.default_rng(seed)
+    closes = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.002, n)))
+    return pd.DataFrame(
+        {
+            "open": closes,
+            "high": closes * 1.001,
+            "low": closes * 0.999,
+            "close": closes,
+            "volume": rng.uniform(1, 10, n),
+        },
+        index=pd.date_range("2024-01-01", periods=n, freq=freq, tz="UTC"),
+    )
+
+
+def test_timeframe_to_timedelta():
+    """ccxt-style timeframes convert to fixed durations."""
+    assert timeframe_to_timedelta("5m") == pd.Timedelta(minutes=5)
+    assert timeframe_to_timedelta("4h") == pd.Timedelta(hours=4)
+    assert timeframe_to_timedelta("1d") == pd.Timedelta(days=1)
+    with pytest.raises(ValueError, match="Unsupported timeframe"):
+        timeframe_to_timedelta("1M!")
+
+
+def test_resample_ohlcv_aggregation():
+    """Resampled bars aggregate open/high/low/close/volume correctly."""
+    data = _make_ohlcv(48 * 3, freq="1h")
+    daily = resample_ohlcv(data, "1d")
+
+    first_day = data.loc["2024-01-01"]
+    assert daily["open"].iloc[0] == first_day["open"].iloc[0]
+    assert daily["high"].iloc[0] == first_day["high"].max()
+    assert daily["low"].iloc[0] == first_day["low"].min()
+    assert daily["close"].iloc[0] == first_day["close"].iloc[-1]
+    assert daily["volume"].iloc[0] == pytest.approx(first_day["volume"].sum())
+
+
+def test_alignment_only_uses_closed_bars():
+    """Every base bar must only see higher-timeframe bars that closed before it opened."""
+    data = _make_ohlcv(12 * 24 * 3)
+    four_hour = resample_ohlcv(data, "4h")
+    merged = merge_informative(data, ["4h"])
+
+    for ts in data.index[::37]:
+        closed = four_hour[four_hour.index + pd.Timedelta("4h") <= ts]
+        value = merged.at[ts, "close_4h"]
+        if closed.empty:
+            assert np.isnan(value)
+        else:
+            assert value == closed["close"].iloc[-1]
+
+
+def test_alignment_is_truncation_invariant():
+    """Aligned values must not change when future data is removed (no lookahead)."""
+    data = _make_ohlcv(12 * 24 * 4)
+    full = merge_informative(data, ["1h", "1d"])
+
+    cut = data.index[700]
+    truncated = merge_informative(data.loc[:cut], ["1h", "1d"])
+
+    pd.testing.assert_frame_equal(full.loc[:cut], truncated)
+
+
+def test_merge_informative_prefers_given_frames():
+    """Frames passed in (e.g. from the cache) are aligned instead of re-derived."""
+    data = _make_ohlcv(12 * 24 * 2)
+    daily = resample_ohlcv(data, "1d")
+    daily["high"] = 999.0
+
+    merged = merge_informative(data, ["1d"], informative={"1d": daily})
+
+    assert (merged.loc["2024-01-02", "high_1d"] == 999.0).all()
+    assert merged.loc["2024-01-01", "high_1d"].isna().all()
+
+
+def test_align_wide_frame():
+    """Alignment works on wide (time x symbol) frames."""
+    index = pd.date_range("2024-01-01", periods=72, freq="1h")
+    daily = pd.DataFrame({"A": [1.0, 2.0, 3.0], "B": [4.0, 5.0, 6.0]}, index=pd.date_range("2024-01-01", periods=3))
+
+    aligned = align_to_index(daily, index, "1d")
+
+    assert aligned.loc["2024-01-01"].isna().all().all()
+    assert (aligned.loc["2024-01-02", "A"] == 1.0).all()
+    assert (aligned.loc["2024-01-03", "B"] == 5.0).all()
+
+
+def test_engine_passes_informative_to_strategy():
+    """engine.run should attach the strategy's declared timeframes."""
+    data = _make_ohlcv(12 * 24 * 3)
+    result = engine.run(BoxTheory(), data)
+
+    assert "high_1d" in result.signals.columns
+    np.testing.assert_array_equal(result.signals["box_high"], result.signals["high_1d"])
@@ -0,0 +1,93 @@
+"""Tests for the vectorized trade analytics."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradestrats.backtesting import engine, simulator
+from tradestrats.backtesting.analytics import excursions, time_in_market, trade_analytics
+from tradestrats.data.panel import build_panel
+from tradestrats.strategies.sma_cross import SMACrossover
+from tests.helpers import make_ohlcv
+
+
+def _reference(high, low, trades):
+    """Trade-by-trade loop over the same price path definition."""
+    mae, mfe = [], []
+    for t in trades.itertuples():
+        prices = [t.entry_price, t.exit_price]
+        path_high = max([*high[t.entry_bar + 1:t.exit_bar + 1], *prices])
+        path_low = min([*low[t.entry_bar + 1:t.exit_bar + 1], *prices])
+        up, down = path_high / t.entry_price - 1, path_low / t.entry_price - 1
+        mfe.append(up if t.direction > 0 else -down)
+        mae.append(down if t.direction > 0 else -up)
+    return np.array(mae), np.array(mfe)
+
+
+def test_native_long_and_short_trades_match_loop():
+    data = make_ohlcv(4000, seed=3)
+    result = simulator.run(SMACrossover(10, 40), data, short=True, sl_stop=0.03)
+    analytics = result.trade_analytics(data, risk=0.03)
+    assert set(analytics["direction"]) == {1, -1}
+
+    mae, mfe = _reference(data["high"].to_numpy(), data["low"].to_numpy(), analytics.assign(
+        entry_price=result.trades["entry_price"], exit_price=result.trades["exit_price"],
+    ))
+    np.testing.assert_allclose(analytics["mae"], mae, rtol=1e-12)
+    np.testing.assert_allclose(analytics["mfe"], mfe, rtol=1e-12)
+    assert (analytics["mae"] <= 0).all() and (analytics["mfe"] >= 0).all()
+    np.testing.assert_allclose(analytics["r_multiple"], result.trades["return"] / 0.03)
+    # The still open last trade is measured up to the last bar
+    assert analytics["exit_bar"].iloc[-1] <= len(data) - 1
+
+
+def test_vectorbt_result_bars_held_and_time_in_market():
+    data = make_ohlcv(3000, seed=8)
+    result = engine.run(SMACrossover(10, 40), data)
+    records = result.portfolio.trades.records
+    analytics = trade_analytics(result, data)
+
+    np.testing.assert_array_equal(analytics["bars_held"], records["exit_idx"] - records["entry_idx"])
+    assert analytics["r_multiple"].isna().all()
+    exposure = time_in_market(result, len(data))
+    assert exposure.iloc[0] == pytest.approx(analytics["bars_held"].sum() / len(data))
+    assert 0 < exposure.iloc[0] < 1
+
+
+def test_panel_trades_use_their_own_symbol_prices():
+    frames = {"AAA": make_ohlcv(2000, seed=1), "BBB": make_ohlcv(2000, seed=2)}
+    panel = build_panel(frames)
+    result = engine.run_panel(SMACrossover(10, 40), panel)
+    analytics = trade_analytics(result, panel)
+    assert set(analytics["column"]) == {"AAA", "BBB"}
+
+    records = result.portfolio.trades.records
+    for symbol, frame in frames.items():
+        mine = analytics["column"] == symbol
+        trades = analytics[mine].assign(
+            entry_price=records["entry_price"][mine.to_numpy()], exit_price=records["exit_price"][mine.to_numpy()],
+        )
+        mae, mfe = _reference(frame["high"].to_numpy(), frame["low"].to_numpy(), trades)
+        np.testing.assert_allclose(analytics.loc[mine, "mae"], mae, rtol=1e-12)
+        np.testing.assert_allclose(analytics.loc[mine, "mfe"], mfe, rtol=1e-12)
+
+
+def test_excursions_edge_cases():
+    high = np.array([10.0, 12.0, 11.0, 13.0])
+    low = np.array([9.0, 8.0, 10.0, 9.5])
+    empty = np.array([], dtype=np.int64)
+    mae, mfe = excursions(high, low, empty, empty, empty, empty, np.array([]), np.array([]))
+    assert len(mae) == len(mfe) == 0
+
+    # Same-bar trade: only its fill prices; unsorted trades in any order
+    mae, mfe = excursions(
+        high, low,
+        col=np.zeros(3, dtype=np.int64),
+        entry_bar=np.array([2, 0, 1]),
+        exit_bar=np.array([2, 3, 2]),
+        direction=np.array([1, 1, -1]),
+        entry_price=np.array([10.0, 10.0, 11.0]),
+        exit_price=np.array([10.5, 12.0, 10.0]),
+    )
+    np.testing.assert_allclose(mae, [0.0, -0.2, 0.0])
+    np.testing.assert_allclose(mfe, [0.05, 0.3, 1 - 10 / 11])
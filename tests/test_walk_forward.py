@@ -0,0 +1,54 @@
+"""Tests for walk-forward optimization."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradestrats.backtesting.walk_forward import Window, split_windows, walk_forward
+from tradestrats.strategies.sma_cross import SMACrossover
+
+
+def _make_ohlcv(n: int = 900, seed: int = 0) -> pd.DataFrame:
+    """Build a random-walk OHLCV DataFrame with hourly candles."""
+    rng = np.random.default_rng(seed)
+    closes = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    return pd.DataFrame(
+        {"open": closes, "high": closes * 1.01, "low": closes * 0.99, "close": closes, "volume": 1.0},
+        index=pd.date_range("2024-01-01", periods=n, freq="1h", tz="UTC"),
+    )
+
+
+def test_split_windows_rolling():
+    """Rolling windows keep the in-sample length and tile the out-of-sample part."""
+    windows = split_windows(100, in_sample=40, out_of_sample=25)
+
+    assert windows == [Window(0, 40, 40, 65), Window(25, 65, 65, 90), Window(50, 90, 90, 100)]
+
+
+def test_split_windows_anchored():
+    """Anchored windows always start at bar 0."""
+    windows = split_windows(100, in_sample=40, out_of_sample=30, anchored=True)
+
+    assert [w.is_start for w in windows] == [0, 0]
+    assert [w.is_end for w in windows] == [40, 70]
+
+
+def test_split_windows_rejects_short_history():
+    with pytest.raises(ValueError, match="no out-of-sample"):
+        split_windows(50, in_sample=50, out_of_sample=10)
+
+
+def test_walk_forward_stitches_folds():
+    """Each fold's best params trade out-of-sample and capital carries over."""
+    data = _make_ohlcv()
+    grid = {"fast_period": [5, 10], "slow_period": [30, 60]}
+    result = walk_forward(SMACrossover, data, grid, in_sample=300, out_of_sample=200, max_workers=2)
+
+    assert len(result.folds) == 3
+    assert set(result.folds["fast_period"]) <= {5, 10}
+    assert result.equity_curve.iloc[0] == 10_000.0
+    assert result.equity_curve.index.is_unique
+    assert len(result.equity_curve) == 1 + len(data) - 300
+
+    compounded = np.prod(1 + result.folds["oos_return"].to_numpy()) - 1
+    assert result.summary()["total_return"] == pytest.approx(compounded)